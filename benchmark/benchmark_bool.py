@@ -4,6 +4,8 @@
 from  random import random, getrandbits
 import time
 
+import numpy as np
+
 def test_one(N):
     a = 0
     t0 = time.time()
@@ -27,14 +29,19 @@ def test_random(n):
     t0 = time.time()
     a = [random() >=0.5 for _ in range(n)]
 
-    print(a)
+    return time.time() - t0
 
+def test_numpy_unpackbits(n):
+    t0 = time.time()
+    packed = np.random.randint(0, 1 << 8, size=(n + 7) // 8, dtype=np.uint8)
+    a = np.unpackbits(packed, count=n).view(bool)
     return time.time() - t0
 
 def test(N):
     print('For N={0}'.format(N))
     print('  getrandbits(1) in for loop              {0} sec'.format(test_one(N)))
     print('  random() >= 0.5 in for loop              {0} sec'.format(test_random(N)))
+    print('  numpy packed bits unpacked to bool      {0} sec'.format(test_numpy_unpackbits(N)))
 
 
 
@@ -0,0 +1,25 @@
+## Low cardinality string columns: python strings per row vs categorical codes over a vocabulary
+
+import time
+
+from randen import DataFrameGenerator
+
+
+def test(nrows, ncols=10):
+    dfg = DataFrameGenerator(seed=0)
+    print('For N={0} x {1} columns'.format(nrows, ncols))
+    for label, generate in [('object strings          ', dfg.get_string_dataframe),
+                            ('categorical, 100 values ', dfg.get_categorical_dataframe)]:
+        t0 = time.time()
+        df = generate(nrows, ncols)
+        elapsed = time.time() - t0
+        print('  {0} {1:.3f} sec {2:10.1f} MB'.format(label, elapsed, df.memory_usage(deep=True).sum() / 1e6))
+
+
+def main():
+    for i in range(4, 7):
+        test(10**i)
+
+
+if __name__ == '__main__':
+    main()
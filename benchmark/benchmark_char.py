@@ -5,24 +5,38 @@ import time
 import os, sys
 from string import ascii_lowercase, ascii_uppercase
 
-lowercase = True
-_numrows = 10
-if lowercase:
-   min_lc = ord(b'a')
-else:
-    min_lc = ord(b'A')
-len_lc = 26
-ba = bytearray(os.urandom(_numrows))
-for i, b in enumerate(ba):
-    ba[i] = min_lc + b % len_lc  # convert 0..255 to 97..122
-print(ba)
-sys.stdout.buffer.write(ba)
-
-
-if lowercase:
-    bal = [c.encode('ascii') for c in ascii_lowercase]
-else:
-    bal = [c.encode('ascii') for c in ascii_uppercase]
-a = [choice(bal) for _ in range(_numrows)]
-
-print(a)
\ No newline at end of file
+import numpy as np
+
+
+def test_choice(n, alphabet):
+    t0 = time.time()
+    a = [choice(alphabet) for _ in range(n)]
+    return time.time() - t0
+
+def test_urandom(n, alphabet):
+    t0 = time.time()
+    min_lc = ord(alphabet[0])
+    ba = bytearray(os.urandom(n))
+    for i, b in enumerate(ba):
+        ba[i] = min_lc + b % len(alphabet)  # convert 0..255 to 97..122
+    return time.time() - t0
+
+def test_numpy_uint8(n, alphabet):
+    t0 = time.time()
+    table = np.frombuffer(alphabet.encode('ascii'), dtype=np.uint8)
+    a = table[np.random.randint(0, len(alphabet), size=n, dtype=np.uint8)].view('S1')
+    return time.time() - t0
+
+def test(N, lowercase=True):
+    alphabet = ascii_lowercase if lowercase else ascii_uppercase
+    print('For N={0}'.format(N))
+    print('  random.choice in for loop               {0} sec'.format(test_choice(N, alphabet)))
+    print('  os.urandom bytes with modulo            {0} sec'.format(test_urandom(N, alphabet)))
+    print('  numpy uint8 draw mapped to S1           {0} sec'.format(test_numpy_uint8(N, alphabet)))
+
+def main():
+    for i in range(3,8):
+       test(10**i)
+
+if __name__ == '__main__':
+   main()
@@ -0,0 +1,50 @@
+## Bulk load throughput into SQLite: DataFrameGenerator.write_sql against pandas' DataFrame.to_sql
+## Reports rows/s loading the same mixed frame into a fresh database file, generation included for
+## write_sql and excluded for to_sql, which is handed the frame already generated.
+
+import os
+import time
+import sqlite3
+import tempfile
+
+from datetime import datetime
+
+from randen import DataFrameGenerator
+
+CTYPES = [int, float, bool, str, datetime]
+
+
+def load(method, path, nrows):
+    dfg = DataFrameGenerator(seed=0)
+    if method == 'write_sql':
+        t0 = time.perf_counter()
+        dfg.write_sql(path, 'bench', nrows, CTYPES, nullratio=0.05)
+        return nrows / (time.perf_counter() - t0)
+    df = dfg.get_dataframe(nrows, CTYPES, nullratio=0.05)
+    connection = sqlite3.connect(path)
+    t0 = time.perf_counter()
+    df.to_sql('bench', connection, index=False, chunksize=10000, method=method)
+    connection.commit()
+    rate = nrows / (time.perf_counter() - t0)
+    connection.close()
+    return rate
+
+
+def test(nrows):
+    print('{0:,} rows x {1} columns'.format(nrows, len(CTYPES)))
+    base = None
+    for method in ('to_sql', 'multi', 'write_sql'):
+        with tempfile.TemporaryDirectory() as directory:
+            rate = load(None if method == 'to_sql' else method, os.path.join(directory, 'bench.db'), nrows)
+        base = base or rate
+        label = 'to_sql(method="multi")' if method == 'multi' else method
+        print('  {0:<24} {1:>12,.0f} rows/s  x{2:.2f}'.format(label, rate, rate / base))
+
+
+def main():
+    test(10**5)
+    test(10**6)
+
+
+if __name__ == '__main__':
+    main()
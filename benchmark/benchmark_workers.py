@@ -0,0 +1,82 @@
+## Thread scaling of column-parallel generation: DataFrameGenerator(workers=N)
+## Reports rows/s and the speedup over a single worker for numeric and mixed frames, and saves them to JSON
+## with the machine description of benchmark/suite.py results. Worker counts past the CPUs measure no scaling.
+##
+##   PYTHONPATH=. python benchmark/benchmark_workers.py --workers 1 2 4 8 16 --output workers.json
+
+import os
+import json
+import time
+import argparse
+import platform
+import multiprocessing
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import randen
+from randen import DataFrameGenerator
+
+WORKERS = (1, 2, 4, 8, 16)
+
+CASES = {
+    'float': (2 * 10**6, 32, None),
+    'numeric': (2 * 10**6, 8, [int, float, bool, datetime]),
+    'mixed': (5 * 10**5, 2, [str, bytes, int, float]),
+}
+
+
+def rows_per_sec(workers, nrows, ncols, ctypes):
+    dfg = DataFrameGenerator(seed=0, workers=workers)
+    t0 = time.perf_counter()
+    if ctypes is None:
+        dfg.get_float_dataframe(nrows, ncols)
+    else:
+        dfg.get_dataframe(nrows, ctypes * ncols)
+    return nrows / (time.perf_counter() - t0)
+
+
+def test(name, nrows, ncols, ctypes=None, workers_counts=WORKERS):
+    ncolumns = ncols if ctypes is None else ncols * len(ctypes)
+    print('{0}: {1:,} rows x {2} columns'.format(name, nrows, ncolumns))
+    base, records = None, []
+    for workers in workers_counts:
+        rate = rows_per_sec(workers, nrows, ncols, ctypes)
+        base = base or rate
+        print('  workers={0:<3} {1:>14,.0f} rows/s  x{2:.2f}'.format(workers, rate, rate / base))
+        records.append({'case': name, 'nrows': nrows, 'ncols': ncolumns, 'workers': workers,
+                        'rows_per_s': rate, 'speedup': rate / base})
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the thread scaling of randen DataFrameGenerator')
+    parser.add_argument('--cases', nargs='+', default=list(CASES), choices=list(CASES))
+    parser.add_argument('--workers', nargs='+', type=int, default=list(WORKERS))
+    parser.add_argument('--output', default='benchmark_workers.json')
+    args = parser.parse_args()
+
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+    print('CPUs available: {0}'.format(cpus))
+    if cpus < max(args.workers):
+        print('Warning: more workers than CPUs, the speedups past {0} workers are not scaling numbers'.format(cpus))
+
+    records = []
+    for case in args.cases:
+        nrows, ncols, ctypes = CASES[case]
+        records += test(case, nrows, ncols, ctypes, args.workers)
+    meta = {
+        'randen': randen.__version__, 'numpy': np.__version__, 'pandas': pd.__version__,
+        'python': platform.python_version(), 'platform': platform.platform(), 'machine': platform.machine(),
+        'cpus': multiprocessing.cpu_count(), 'cpus_available': cpus,
+        'date': datetime.now().isoformat(timespec='seconds'),
+    }
+    with open(args.output, 'w', encoding='utf-8') as handle:
+        json.dump({'meta': meta, 'results': records}, handle, indent=1)
+    print('Saved {0} results to {1}'.format(len(records), args.output))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+## Benchmark suite of DataFrameGenerator: every generator and column type across row and column counts
+##
+## Each (case, rows, columns) point runs in a fresh process, so that its peak RSS is its own, and records
+## the best of --repeat timings, rows/s, MB/s of the generated frame, the tracemalloc peak and the peak RSS.
+## Results are saved to JSON; --compare flags the points that got slower than a previous run on the machine.
+## Cold import times, of the package alone up to a first DataFrame, are recorded alongside as "import:*" cases.
+##
+##   PYTHONPATH=. python benchmark/suite.py --rows 1e3 1e5 1e7 --cols 1 10 --output results.json
+##   PYTHONPATH=. python benchmark/suite.py --output new.json --compare results.json
+
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tracemalloc
+import multiprocessing
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import numpy as np
+import pandas as pd
+
+import randen
+from randen import DataFrameGenerator
+
+MIXED_CTYPES = [int, float, bool, str, bytes, datetime, pd.Categorical]
+
+CASES = {
+    "dataframe": lambda dfg, nrows, ncols: dfg.get_dataframe(nrows, [MIXED_CTYPES[i % 7] for i in range(ncols)]),
+    "integer": lambda dfg, nrows, ncols: dfg.get_integer_dataframe(nrows, ncols),
+    "float": lambda dfg, nrows, ncols: dfg.get_float_dataframe(nrows, ncols),
+    "boolean": lambda dfg, nrows, ncols: dfg.get_boolean_dataframe(nrows, ncols),
+    "char": lambda dfg, nrows, ncols: dfg.get_char_dataframe(nrows, ncols),
+    "string": lambda dfg, nrows, ncols: dfg.get_string_dataframe(nrows, ncols),
+    "dates": lambda dfg, nrows, ncols: dfg.get_dates_dataframe(nrows, ncols),
+    "categorical": lambda dfg, nrows, ncols: dfg.get_categorical_dataframe(nrows, ncols),
+}
+
+# Cold import cases: statements timed in a fresh interpreter, from nothing imported to their end
+IMPORTS = {
+    "import:package": "import randen",
+    "import:generator": "from randen import DataFrameGenerator; DataFrameGenerator()",
+    "import:numpy": "import randen; randen.DataFrameGenerator(output='numpy').get_dataframe(1000, [int])",
+    "import:pandas": "import randen; randen.DataFrameGenerator().get_dataframe(1000, [int])",
+}
+
+
+def measure_import(case, repeat):
+    """Best of `repeat` cold timings of an IMPORTS statement, each in a new interpreter"""
+    code = f"import time; t0 = time.perf_counter(); {IMPORTS[case]}; print(time.perf_counter() - t0)"
+    timings = [float(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout)
+               for _ in range(repeat)]
+    return {"case": case, "nrows": 0, "ncols": 0, "seconds": min(timings)}
+
+
+def measure(case, nrows, ncols, repeat, results):
+    """Benchmark one point, run in a process of its own"""
+    import logging
+    logging.getLogger("randen").setLevel(logging.WARNING)
+    dfg = DataFrameGenerator(seed=0)
+    generate = CASES[case]
+
+    tracemalloc.start()
+    df = generate(dfg, nrows, ncols)
+    traced_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    frame_bytes = int(df.memory_usage(deep=True, index=False).sum())
+    del df
+
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        df = generate(dfg, nrows, ncols)
+        timings.append(time.perf_counter() - t0)
+        del df
+
+    seconds = min(timings)
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    if peak_rss is not None:
+        peak_rss *= 1 if sys.platform == "darwin" else 1024  # bytes on macOS, KiB on Linux
+    results.put({
+        "case": case, "nrows": nrows, "ncols": ncols, "seconds": seconds,
+        "rows_per_s": nrows / seconds, "mb_per_s": frame_bytes / seconds / 1e6, "frame_mb": frame_bytes / 1e6,
+        "tracemalloc_peak_mb": traced_peak / 1e6, "peak_rss_mb": peak_rss / 1e6 if peak_rss is not None else None,
+    })
+
+
+def run(cases, rows, cols, repeat):
+    context = multiprocessing.get_context("spawn")
+    records = []
+    for case in cases:
+        for nrows in rows:
+            for ncols in cols:
+                results = context.Queue()
+                process = context.Process(target=measure, args=(case, nrows, ncols, repeat, results))
+                process.start()
+                process.join()
+                if process.exitcode != 0:
+                    record = {"case": case, "nrows": nrows, "ncols": ncols, "error": f"exit code {process.exitcode}"}
+                else:
+                    record = results.get()
+                records.append(record)
+                report(record)
+    return records
+
+
+def report(record, baseline=None):
+    point = "{case:12} {nrows:>11,} x {ncols:<3}".format(**record)
+    if "error" in record:
+        print(f"{point} failed: {record['error']}")
+        return
+    if "rows_per_s" not in record:  # cold import
+        line = f"{record['case']:32} {record['seconds']:9.4f} s"
+        if baseline is not None:
+            line += f"  {baseline['seconds'] / record['seconds']:5.2f}x vs baseline"
+        print(line, flush=True)
+        return
+    line = ("{point} {seconds:9.4f} s {rows_per_s:14,.0f} rows/s {mb_per_s:9.1f} MB/s "
+            "tracemalloc {tracemalloc_peak_mb:9.1f} MB  rss {peak_rss}").format(
+        point=point, peak_rss="n/a" if record["peak_rss_mb"] is None else f"{record['peak_rss_mb']:.1f} MB",
+        **{key: value for key, value in record.items() if key != "peak_rss_mb"})
+    if baseline is not None:
+        line += f"  {baseline['seconds'] / record['seconds']:5.2f}x vs baseline"
+    print(line, flush=True)
+
+
+def compare(records, baseline_path, threshold):
+    """Print the speedup of every point over the baseline run; return the points slower than `threshold`"""
+    with open(baseline_path) as handle:
+        baseline = {(r["case"], r["nrows"], r["ncols"]): r for r in json.load(handle)["results"] if "error" not in r}
+    print(f"\nCompared to {baseline_path}:")
+    regressions = []
+    for record in records:
+        before = baseline.get((record["case"], record["nrows"], record["ncols"]))
+        if before is None or "error" in record:
+            continue
+        report(record, before)
+        if record["seconds"] > before["seconds"] * (1 + threshold):
+            regressions.append(record)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark randen DataFrameGenerator")
+    parser.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--rows", nargs="+", type=float, default=[1e3, 1e4, 1e5, 1e6],
+                        help="row counts, up to 1e8 given the memory")
+    parser.add_argument("--cols", nargs="+", type=int, default=[1, 10])
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per point, the best is kept")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", help="results JSON of a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown reported as a regression")
+    parser.add_argument("--no-import", action="store_true", help="skip the cold import cases")
+    args = parser.parse_args()
+
+    records = []
+    if not args.no_import:
+        for case in IMPORTS:
+            records.append(measure_import(case, max(args.repeat, 5)))
+            report(records[-1])
+    records += run(args.cases, [int(nrows) for nrows in args.rows], args.cols, args.repeat)
+    meta = {
+        "randen": randen.__version__, "numpy": np.__version__, "pandas": pd.__version__,
+        "python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine(),
+        "cpus": multiprocessing.cpu_count(), "date": datetime.now().isoformat(timespec="seconds"),
+    }
+    with open(args.output, "w") as handle:
+        json.dump({"meta": meta, "results": records}, handle, indent=1)
+    print(f"Saved {len(records)} results to {args.output}")
+
+    if args.compare:
+        regressions = compare(records, args.compare, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} point(s) slower than the baseline by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
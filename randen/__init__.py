@@ -4,4 +4,38 @@ Randen: Random DataFrame Generator
 
 __version__ = '1.0.0'
 
-from randen.data_generator import DataFrameGenerator # NOQA
+import importlib
+
+# typing.TYPE_CHECKING without importing typing, which alone costs more than the rest of `import randen`;
+# type checkers treat the constant alike
+TYPE_CHECKING = False
+if TYPE_CHECKING:  # what the lazy exports resolve to, for type checkers and linters
+    from randen.cache import DatasetCache
+    from randen.data_generator import DataFrameGenerator
+    from randen.memmap import open_memmap
+    from randen.relational import ForeignKey, RelationalGenerator
+    from randen.schema import Schema
+    from randen.stream import Stream
+
+# Exports are imported on first use, so that `import randen` costs next to nothing
+_EXPORTS = {
+    "DataFrameGenerator": "randen.data_generator",
+    "open_memmap": "randen.memmap",
+    "DatasetCache": "randen.cache",
+    "Schema": "randen.schema",
+    "RelationalGenerator": "randen.relational",
+    "ForeignKey": "randen.relational",
+    "Stream": "randen.stream",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
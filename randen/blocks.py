@@ -0,0 +1,218 @@
+"""
+Randen: Random DataFrame Generator
+    Assembly of generated column buffers into pandas DataFrames, NumPy arrays or Arrow tables
+
+    Columns are generated into (ncols, nrows) buffers, one per dtype, which is the layout pandas
+    keeps its blocks in, and the buffers are handed to pandas through BlockManager without a copy.
+    Columns pandas stores as extension arrays or python objects are generated into a raw buffer
+    and finished by a wrap function, e.g. categorical codes into a pd.Categorical.
+"""
+
+from __future__ import annotations
+
+__appname__ = "randen"
+
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+from randen.lazy import LazyModule
+
+pd = LazyModule("pandas")
+pa = LazyModule("pyarrow")
+
+# Offsets of Arrow "string"/"binary" arrays are int32, so string columns are cut into chunks of
+# fewer data bytes than this
+_ARROW_CHUNK_BYTES = 1 << 31
+
+
+def decode_ascii(values: np.ndarray) -> np.ndarray:
+    """Wrap of string columns: fixed width ASCII bytes to an object array of python strings"""
+    return values.astype(str).astype(object)
+
+
+def to_objects(values: np.ndarray) -> np.ndarray:
+    """Wrap of bytes columns: fixed width bytes to an object array of python bytes"""
+    return values.astype(object)
+
+
+class Categorize:
+    """Wrap of categorical columns: integer codes to a pd.Categorical over `categories`"""
+    def __init__(self, categories: Sequence):
+        self.categories = list(categories)
+
+    def __call__(self, codes: np.ndarray) -> pd.Categorical:
+        return pd.Categorical.from_codes(codes, categories=self.categories)
+
+
+class Localize:
+    """Wrap of timezone aware columns: UTC datetime64[ns] values to a DatetimeArray in `tz`"""
+    def __init__(self, tz: str):
+        self.tz = str(tz)
+
+    def __call__(self, values: np.ndarray) -> pd.arrays.DatetimeArray:
+        return pd.arrays.DatetimeArray(values, dtype=pd.DatetimeTZDtype(tz=self.tz))
+
+
+class Nullable:
+    """Wrap of nullable columns: values and null mask to a pandas integer, boolean or string array
+
+    Integer arrays (Int8 ... UInt64, after the width of the values) and boolean arrays view the
+    two buffers without a copy; string values are an object
+    array of python strings, whose null rows are set to pd.NA in place.
+    """
+    def __init__(self, dtype: str):
+        assert dtype in ("integer", "boolean", "string"), f"Unsupported nullable dtype {dtype}"
+        self.dtype = dtype
+
+    def __call__(self, values: np.ndarray, mask: np.ndarray) -> pd.api.extensions.ExtensionArray:
+        if self.dtype == "integer":
+            return pd.arrays.IntegerArray(values, mask)
+        if self.dtype == "boolean":
+            return pd.arrays.BooleanArray(values, mask)
+        values[mask] = pd.NA
+        return pd.arrays.StringArray(values)
+
+
+class ArrowStrings:
+    """Wrap of string (or binary) columns: null padded fixed width bytes to an Arrow array
+
+    The offsets are the cumulative lengths of the rows and the data their non null bytes, both
+    computed with vectorized numpy, and the null mask becomes the validity bitmap; no python
+    string is created. pandas receives the Arrow array as a "string[pyarrow]" array, without a copy.
+    The generated alphabets exclude NUL, so a row's length is its count of non null bytes.
+    """
+    def __init__(self, binary: bool = False):
+        self.binary = binary
+
+    def array(self, values: np.ndarray, mask: np.ndarray = None) -> pa.ChunkedArray:
+        """Arrow "string" ("binary") chunked array of the fixed width `values`, null where `mask`"""
+        width = max(values.dtype.itemsize, 1)
+        step = max(_ARROW_CHUNK_BYTES // width - 1, 1)
+        chars = values.view(np.uint8).reshape(len(values), values.dtype.itemsize)
+        chunks = []
+        for lo in range(0, len(values), step):
+            present = chars[lo:lo + step] != 0
+            offsets = np.zeros(len(present) + 1, dtype=np.int32)
+            np.cumsum(present.sum(axis=1), out=offsets[1:])
+            validity, nulls = None, 0
+            if mask is not None:
+                validity = pa.py_buffer(np.packbits(~mask[lo:lo + step], bitorder="little"))
+                nulls = int(mask[lo:lo + step].sum())
+            buffers = [validity, pa.py_buffer(offsets), pa.py_buffer(chars[lo:lo + step][present])]
+            chunks.append(pa.Array.from_buffers(pa.binary() if self.binary else pa.string(),
+                                                len(present), buffers, null_count=nulls))
+        return pa.chunked_array(chunks, type=pa.binary() if self.binary else pa.string())
+
+    def __call__(self, values: np.ndarray, mask: np.ndarray = None) -> pd.arrays.ArrowStringArray:
+        assert not self.binary, "binary Arrow columns have no pandas string array"
+        return pd.arrays.ArrowStringArray(self.array(values, mask))
+
+
+_DECODERS = {"decode_ascii": decode_ascii, "to_objects": to_objects}
+
+
+def wrap_spec(wrap) -> dict:
+    """JSON serializable description of a wrap function, see `wrap_from_spec`"""
+    if wrap is None:
+        return None
+    if isinstance(wrap, Categorize):
+        return {"kind": "categorical", "categories": wrap.categories}
+    if isinstance(wrap, Localize):
+        return {"kind": "datetimetz", "tz": wrap.tz}
+    if isinstance(wrap, Nullable):
+        return {"kind": "nullable", "dtype": wrap.dtype}
+    if isinstance(wrap, ArrowStrings):
+        return {"kind": "arrow_strings", "binary": wrap.binary}
+    return {"kind": wrap.__name__}
+
+
+def wrap_from_spec(spec: dict):
+    """Wrap function described by `spec`"""
+    if spec is None:
+        return None
+    if spec["kind"] == "categorical":
+        return Categorize(spec["categories"])
+    if spec["kind"] == "datetimetz":
+        return Localize(spec["tz"])
+    if spec["kind"] == "nullable":
+        return Nullable(spec["dtype"])
+    if spec["kind"] == "arrow_strings":
+        return ArrowStrings(spec["binary"])
+    return _DECODERS[spec["kind"]]
+
+
+def to_numpy(values: np.ndarray, wrap=None, mask: np.ndarray = None) -> np.ndarray:
+    """NumPy counterpart of `wrap(values)` or `wrap(values, mask)`, for NumPy output
+
+    Categorical codes are looked up in their categories, the -1 null code giving None. Timezone
+    aware datetimes stay UTC datetime64[ns] values, and columns with a null mask become
+    np.ma.MaskedArray views of their values and mask.
+    """
+    if isinstance(wrap, Categorize):
+        categories = np.empty(len(wrap.categories) + 1, dtype=object)
+        categories[:-1] = wrap.categories
+        return categories[values]
+    if mask is not None:
+        return np.ma.MaskedArray(values, mask, copy=False)
+    return values
+
+
+def to_arrow(values: np.ndarray, wrap=None,
+             mask: np.ndarray = None) -> Union[pa.Array, pa.ChunkedArray]:
+    """Arrow counterpart of `wrap(values)` or `wrap(values, mask)`, for Arrow output
+
+    Numeric and datetime buffers are handed to Arrow without a copy (booleans are bit packed),
+    NaN, NaT and masked rows become nulls, categorical codes a dictionary array over their
+    categories and fixed width strings an Arrow string array, see `ArrowStrings`.
+    """
+    if isinstance(wrap, ArrowStrings):
+        return wrap.array(values, mask)
+    if isinstance(wrap, Categorize):
+        return pa.DictionaryArray.from_arrays(pa.array(values, mask=values < 0),
+                                              pa.array(wrap.categories))
+    if isinstance(wrap, Localize):
+        return pa.array(values, type=pa.timestamp("ns", tz=wrap.tz), mask=mask, from_pandas=True)
+    return pa.array(values, mask=mask, from_pandas=True)
+
+
+def to_structured(arrays: Dict[str, np.ndarray]) -> np.ndarray:
+    """Copy columns into a NumPy structured array, a masked one if any column is masked"""
+    nrows = len(next(iter(arrays.values()))) if arrays else 0
+    values = np.empty(nrows, dtype=[(name, column.dtype) for name, column in arrays.items()])
+    for name, column in arrays.items():
+        values[name] = np.ma.getdata(column)
+    if not any(isinstance(column, np.ma.MaskedArray) for column in arrays.values()):
+        return values
+    mask = np.empty(nrows, dtype=[(name, np.bool_) for name in arrays])
+    for name, column in arrays.items():
+        mask[name] = np.ma.getmaskarray(column)
+    return np.ma.MaskedArray(values, mask)
+
+
+def assemble_table(arrays: List[Union[pa.Array, pa.ChunkedArray]], columns: Sequence) -> pa.Table:
+    """Arrow table of the column arrays, which it references without a copy"""
+    return pa.Table.from_arrays([pa.chunked_array([array]) if isinstance(array, pa.Array) else array
+                                 for array in arrays], names=list(columns))
+
+
+def assemble_frame(blocks: List[tuple], columns: Sequence, index: pd.Index) -> pd.DataFrame:
+    """Wrap block buffers as a DataFrame without copying them
+
+    Args:
+        blocks (List[tuple]): (values, placement) of every block; values are either a
+            (len(placement), nrows) ndarray or a 1-D extension array of a single column
+        columns (Sequence): Column names of the dataframe
+        index (pd.Index): Row index of the dataframe
+
+    Returns:
+        pd.DataFrame:
+    """
+    from pandas.core.internals import BlockManager
+    try:
+        from pandas.core.internals.api import make_block
+    except ImportError:  # pandas < 1.3
+        from pandas.core.internals import make_block
+
+    blocks = [make_block(values, placement=placement, ndim=2) for values, placement in blocks]
+    return pd.DataFrame(BlockManager(blocks, [pd.Index(columns), index]))
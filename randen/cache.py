@@ -0,0 +1,155 @@
+"""
+Randen: Random DataFrame Generator
+    On-disk cache of generated datasets, shared by processes, e.g. pytest-xdist workers
+
+    Each dataset is a memmap directory (`.npy` buffers and a manifest, see `randen.memmap`) named
+    after a digest of what generates it, and is loaded back memory-mapped on a hit. The manifest is
+    written last and atomically, so a directory without one is never read. Generating, and
+    evicting, a dataset holds one of _LOCK_STRIPES file locks chosen by its key, so concurrent
+    requests for the same dataset generate it once while the others wait and then hit. Least
+    recently used datasets are evicted past the cache size, by the mtime of their manifest.
+"""
+
+from __future__ import annotations
+
+__appname__ = "randen"
+
+import os
+import shutil
+import logging
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from randen import memmap
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__appname__)
+
+# Lock files guarding dataset creation and eviction; keys share them by their first two hex digits
+_LOCK_STRIPES = 256
+
+
+@contextmanager
+def _file_lock(path: str, blocking: bool = True) -> Iterator[bool]:
+    """Hold an exclusive lock on the file `path`; yields False if not `blocking` and the lock is taken
+
+    The lock is released by the OS if the process dies, so a crashed worker never blocks the others.
+    """
+    with open(path, "a+b") as handle:
+        try:
+            if msvcrt is None:
+                fcntl.flock(handle, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            else:
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        except OSError:
+            if blocking:
+                raise
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            if msvcrt is None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _directory_size(directory: str) -> int:
+    return sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+
+
+class DatasetCache:
+    """Content-addressed cache of generated datasets in `directory`
+
+    Usage:
+    -----
+        dfg = DataFrameGenerator(seed=42, cache=DatasetCache("/tmp/randen", max_bytes=20 * 2 ** 30))
+        df = dfg.get_dataframe(10 ** 7, [int, str])  # generated once, memory-mapped from the cache after
+
+    Args:
+        directory (str): Cache directory, created if missing
+        max_bytes (int, optional): Size past which least recently used datasets are evicted. The dataset
+            just generated is always kept. Defaults to None (unbounded).
+    """
+    def __init__(self, directory: str, max_bytes: int = None):
+        assert max_bytes is None or max_bytes >= 0, "max_bytes must be non-negative"
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.join(directory, "locks"), exist_ok=True)
+
+    def _lock_path(self, key: str) -> str:
+        return os.path.join(self.directory, "locks", f"{int(key[:2], 16) % _LOCK_STRIPES}.lock")
+
+    def _entries(self) -> list:
+        return [entry for entry in os.scandir(self.directory) if entry.is_dir() and entry.name != "locks"]
+
+    def get(self, key: str, generate: Callable[[str], object]):
+        """The dataset of `key`, generated into the cache by `generate(directory)` on a miss
+
+        Args:
+            key (str): Hex digest identifying the dataset
+            generate (Callable[[str], object]): Generates the dataset into a memmap directory
+
+        Returns:
+            pd.DataFrame: The dataset, memory-mapped copy-on-write, so changes to it stay in memory
+        """
+        directory = os.path.join(self.directory, key)
+        manifest = os.path.join(directory, memmap.MANIFEST)
+        while True:
+            if not os.path.exists(manifest):
+                with _file_lock(self._lock_path(key)):
+                    if not os.path.exists(manifest):
+                        logger.info(f"Dataset {key} not cached, generating it")
+                        generate(directory)
+                self.evict(keep=key)
+            try:
+                os.utime(manifest)
+                return memmap.open_memmap(directory, mode="c")
+            except FileNotFoundError:  # evicted by another process in between, generate it again
+                continue
+
+    def evict(self, keep: str = None) -> None:
+        """Remove least recently used datasets until the cache fits `max_bytes`, and abandoned partial ones
+
+        Args:
+            keep (str, optional): Key of a dataset never to evict. Defaults to None.
+        """
+        entries = []
+        for entry in self._entries():
+            manifest = os.path.join(entry.path, memmap.MANIFEST)
+            if os.path.exists(manifest):
+                entries.append((os.stat(manifest).st_mtime, _directory_size(entry.path), entry))
+            elif entry.name != keep:
+                self._remove(entry)  # skipped while its generation holds the lock
+        if self.max_bytes is None:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            if entry.name != keep and self._remove(entry):
+                total -= size
+
+    def _remove(self, entry: os.DirEntry) -> bool:
+        with _file_lock(self._lock_path(entry.name), blocking=False) as locked:
+            if not locked:
+                return False
+            logger.info(f"Evicting dataset {entry.name}")
+            manifest = os.path.join(entry.path, memmap.MANIFEST)
+            if os.path.exists(manifest):
+                os.remove(manifest)
+            shutil.rmtree(entry.path, ignore_errors=True)
+            return True
+
+    def clear(self) -> None:
+        """Remove every dataset not being generated"""
+        for entry in self._entries():
+            self._remove(entry)
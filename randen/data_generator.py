@@ -8,36 +8,440 @@ Randen: Random DataFrame Generator
     - int
     - float
     - bool
+    - categorical
     - mix(provide column types)
 
 TODO:
-    - Add Null ratio support
     - Add Documentation build(readdocs? )
 """
 
+from __future__ import annotations
+
 __author__ = "Kanishk Varshney"
 __date__ = "05-10-2020"
 __appname__ = "randen"
 
+import sys
+import json
 import time
-import random
-import secrets
+import zlib
+import hashlib
 
 import logging
-from typing import List
-from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Union
 from datetime import datetime
-from random import random, choice
+from functools import partial
+from contextlib import contextmanager
 from collections import Counter
 from string import ascii_letters, ascii_lowercase, ascii_uppercase, digits
 
 import numpy as np
-import pandas as pd
 
+from randen import __version__, blocks, memmap, sinks, telemetry
+from randen.cache import DatasetCache
+from randen.lazy import LazyModule, require
+from randen.permutation import FeistelPermutation
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from randen.schema import Schema
+    from randen.stream import Stream
+
+# pandas, and the process pool machinery, are only imported when a DataFrame, a timezone or a
+# process worker is actually needed
+pd = LazyModule("pandas")
+secrets = LazyModule("secrets")
+shared_memory = LazyModule("multiprocessing.shared_memory")
 
-logging_format = "%(asctime)s [%(levelname)s] %(name)s : %(message)s in %(pathname)s:%(lineno)d"
-logging.basicConfig(level=logging.DEBUG, format=logging_format)
+
+# Logging is left to the application: the library only attaches a NullHandler to its logger
 logger = logging.getLogger(__appname__)
+logger.addHandler(logging.NullHandler())
+
+_CTYPE_DTYPES = {
+    int: np.int64,
+    float: np.float64,
+    bool: np.bool_,
+    str: object,
+    bytes: object,
+    datetime: "datetime64[ns]",
+}
+
+# Rows per random stream. Every (column, block of _STREAM_BLOCK rows) pair draws from a stream of
+# its own, so a row range is reproduced byte for byte however the frame is split or scheduled.
+_STREAM_BLOCK = 1 << 16
+
+# Rows per parallel task; columns longer than this are split into row ranges across the workers
+_TASK_ROWS = 4 * _STREAM_BLOCK
+
+# Spawn key word of the vocabulary stream of a categorical column, next to its stream blocks
+_VOCABULARY_KEY = 0x766F6361
+
+# Spawn key word of the null mask stream of a stream block, out of range of the children spawned by kernels
+_NULL_KEY = 0x6E756C6C
+
+# Fixed default range of datetime columns (rather than now(), or the local epoch) so that seeded frames are
+# reproducible whatever the host clock and timezone
+_DEFAULT_START = datetime(1970, 1, 1)
+_DEFAULT_END = datetime(2020, 10, 5)
+
+# Nanoseconds per unit of the supported timestamp resolutions
+_RESOLUTIONS = {"s": 10 ** 9, "ms": 10 ** 6, "us": 10 ** 3, "ns": 1}
+
+# Hourly buckets of a weekday/hour skewed timestamp profile, bounding its memory to ~160MB (~1100 years)
+_MAX_PROFILE_HOURS = 10 ** 7
+
+# Integer dtypes from the narrowest, the candidates of downcast integer columns
+_INT_DTYPES = [np.int8, np.uint8, np.int16, np.uint16, np.int32, np.uint32, np.int64, np.uint64]
+
+SeedLike = Union[None, int, List[int], np.random.SeedSequence, np.random.Generator]
+DTypeLike = Union[None, str, type, np.dtype]
+
+
+def _secure_randbelow(bound: int, size: int) -> np.ndarray:
+    """Vectorized `secrets.randbelow`: `size` integers in [0, bound) from the OS CSPRNG
+
+    Raw bytes are rejection sampled so that the result carries no modulo bias.
+    """
+    dtype = np.uint8 if bound <= 1 << 8 else np.uint32
+    span = int(np.iinfo(dtype).max) + 1
+    limit = span - span % bound
+    out = np.empty(size, dtype=np.int64)
+    filled = 0
+    while filled < size:
+        draw = np.frombuffer(secrets.token_bytes((size - filled) * np.dtype(dtype).itemsize), dtype=dtype)
+        draw = draw[draw < limit][:size - filled]
+        out[filled:filled + len(draw)] = draw % bound
+        filled += len(draw)
+    return out
+
+
+def _as_seed_sequence(seed: SeedLike) -> np.random.SeedSequence:
+    """Root SeedSequence of a generator; a np.random.Generator seeds it with entropy drawn from itself"""
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        return np.random.SeedSequence(seed.integers(0, 1 << 63, size=4).tolist())
+    return np.random.SeedSequence(seed)
+
+
+def _permutation_key(seed: np.random.SeedSequence) -> int:
+    """Key of the unique-value permutation of the column seeded by `seed`"""
+    return int(seed.generate_state(1, dtype=np.uint64)[0])
+
+
+def _int_dtype(_min: int, _max: int, dtype: DTypeLike = None, downcast: bool = False) -> np.dtype:
+    """Integer dtype of a column of values in [_min, _max): `dtype`, else the narrowest dtype holding
+    the range if `downcast`, else int64
+
+    Raises:
+        ValueError: If dtype is not an integer dtype or does not hold [_min, _max)
+    """
+    if dtype is None:
+        candidates = _INT_DTYPES if downcast else [np.int64, np.uint64]
+        dtype = next((d for d in candidates if np.iinfo(d).min <= _min and _max - 1 <= np.iinfo(d).max), np.int64)
+    dtype = np.dtype(dtype)
+    if dtype.kind not in "iu" or not np.iinfo(dtype).min <= _min <= _max - 1 <= np.iinfo(dtype).max:
+        logger.error(f"Integers in [{_min}, {_max}) do not fit dtype {dtype}")
+        raise ValueError(f"Integers in [{_min}, {_max}) do not fit dtype {dtype}")
+    return dtype
+
+
+def _int_range(_min: int = None, _max: int = None, dtype: DTypeLike = None) -> tuple:
+    """Range [_min, _max) of an int column: the bounds given, else the default [-100000, 100000) clipped
+    to what an explicit integer dtype holds"""
+    limits = np.iinfo(dtype) if dtype is not None and np.dtype(dtype).kind in "iu" else None
+    if _min is None:
+        _min = -100000 if limits is None else max(-100000, int(limits.min))
+    if _max is None:
+        _max = 100000 if limits is None else min(100000, int(limits.max) + 1)
+    return _min, _max
+
+
+def _strata(rows: np.ndarray, size: int, total: int) -> np.ndarray:
+    """floor(rows * size / total) in int64, the first value of stratum `rows` of `total` equal strata of
+    [0, size), without overflowing the product"""
+    quotient, remainder = divmod(size, max(total, 1))
+    if remainder * max(total, 1) < 1 << 63:
+        return rows * quotient + rows * remainder // max(total, 1)
+    return rows * quotient + np.floor(rows * (remainder / total)).astype(np.int64)
+
+
+def _float_dtype(dtype: DTypeLike = None) -> np.dtype:
+    """Float dtype of a column, float64 by default
+
+    Raises:
+        ValueError: If dtype is not a float16, float32 or float64 dtype
+    """
+    dtype = np.dtype(np.float64 if dtype is None else dtype)
+    if dtype not in (np.float16, np.float32, np.float64):
+        logger.error(f"Unsupported float dtype {dtype} requested")
+        raise ValueError(f"Unsupported float dtype {dtype} requested")
+    return dtype
+
+
+def _code_dtype(ncategories: int) -> np.dtype:
+    """Dtype pandas keeps the codes of `ncategories` categories in, so that wrapping them needs no copy"""
+    for dtype in (np.int8, np.int16, np.int32):
+        if ncategories < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def _is_categorical(ctype: type) -> bool:
+    """`ctype is pd.Categorical`, checked without importing pandas, which the caller of pd.Categorical has imported"""
+    return "pandas" in sys.modules and ctype is pd.Categorical
+
+
+def _column_dtypes(dtype: Union[DTypeLike, List[DTypeLike]], ncols: int) -> List[DTypeLike]:
+    """Per-column dtypes from one dtype shared by all columns or a list of one dtype per column"""
+    if isinstance(dtype, (list, tuple)):
+        assert len(dtype) == ncols, "provide one dtype per column"
+        return list(dtype)
+    return [dtype] * ncols
+
+
+def _null_seed(seed: np.random.SeedSequence) -> np.random.SeedSequence:
+    """Seed of the null mask stream of the block (or column) seeded by `seed`"""
+    return np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key + (_NULL_KEY,), pool_size=seed.pool_size)
+
+
+def _date_bounds(start: datetime = None, end: datetime = None, tz: str = None) -> tuple:
+    """Resolve the default datetime range [_DEFAULT_START, _DEFAULT_END]; naive bounds are taken in `tz`, if given
+
+    Naive python datetimes without `tz` are converted by numpy, anything else by pandas.
+
+    Returns:
+        tuple: (start, end) in ns since the epoch (UTC) and the timezone of the column, None if naive
+    """
+    bounds = [start or _DEFAULT_START, end or _DEFAULT_END]
+    if tz is None and all(type(value) is datetime and value.tzinfo is None for value in bounds):
+        start, end = (int(np.datetime64(value, "ns").astype(np.int64)) for value in bounds)
+        return start, end, None
+    bounds = [pd.Timestamp(value) for value in bounds]
+    if tz is not None:
+        bounds = [value.tz_localize(tz) if value.tz is None else value for value in bounds]
+    return bounds[0].value, bounds[1].value, tz if tz is not None else bounds[0].tz
+
+
+def _time_profile(start: int, end: int, weekday_weights: List[float] = None, hour_weights: List[float] = None,
+                  tz: str = None) -> tuple:
+    """Inverse CDF table of timestamps in [start, end] skewed by day of week and hour of day
+
+    The range is cut into hourly buckets, weighted by the weights of their local weekday and hour
+    times their length. A uniform u in [0, 1) then maps to the bucket where the cumulative weight
+    crosses u, and linearly within it, which keeps the mapping monotonic in u.
+
+    Args:
+        start (int): First timestamp, ns since the epoch (UTC)
+        end (int): Last timestamp, ns since the epoch (UTC)
+        weekday_weights (List[float], optional): Relative weight of Monday ... Sunday. Defaults to None.
+        hour_weights (List[float], optional): Relative weight of the hours 0 ... 23. Defaults to None.
+        tz (str, optional): Timezone of the weekdays and hours. Defaults to None (UTC).
+
+    Returns:
+        tuple: (bucket edges in ns, cumulative bucket weights ending at 1)
+    """
+    hour = 3600 * 10 ** 9
+    first = start - start % hour
+    nbuckets = max(-(-(end - first) // hour), 1)
+    assert nbuckets <= _MAX_PROFILE_HOURS, "datetime range too long for weekday/hour weights"
+    edges = np.clip(first + hour * np.arange(nbuckets + 1, dtype=np.int64), start, end)
+
+    local = pd.DatetimeIndex(edges[:-1].view("datetime64[ns]"), tz="UTC")
+    local = local.tz_convert(tz) if tz is not None else local
+    weights = np.diff(edges).astype(np.float64)
+    for factors, index, size in [(weekday_weights, local.dayofweek, 7), (hour_weights, local.hour, 24)]:
+        if factors is not None:
+            factors = np.asarray(factors, dtype=np.float64)
+            assert len(factors) == size and (factors >= 0).all(), f"provide {size} non-negative weights"
+            weights *= factors[np.asarray(index)]
+    cdf = np.cumsum(weights)
+    assert cdf[-1] > 0, "weights leave no timestamp in the datetime range"
+    return edges, cdf / cdf[-1]
+
+
+class _Column:
+    """Generation plan of one column
+
+    `kernel(seed, offset, nrows)` returns the values of rows [offset, offset + nrows) as an array
+    castable to `dtype`; `offset` is always the first row of a stream block and `seed` the
+    SeedSequence of that block. `wrap`, if given, turns the filled column buffer into an
+    extension array, e.g. categorical codes into a pd.Categorical.
+
+    Object columns also carry a `raw` plan generating their values as fixed width bytes, which
+    can be written to shared memory or a memmap file, and whose `wrap` decodes them into the
+    object values.
+
+    Nullable columns whose dtype has no missing value sentinel carry a `mask` plan generating
+    their null mask into a bool buffer of its own; `wrap(values, mask)` then builds the masked
+    array, or, for object columns without a wrap, the null rows are set to None.
+    """
+    __slots__ = ("name", "seed", "kernel", "dtype", "wrap", "raw", "mask")
+
+    def __init__(self, name: str, seed: np.random.SeedSequence, kernel: Callable, dtype: Union[type, str],
+                 wrap: Callable = None, raw: "_Column" = None, mask: "_Column" = None):
+        self.name = name
+        self.seed = seed
+        self.kernel = kernel
+        self.dtype = dtype
+        self.wrap = wrap
+        self.raw = raw
+        self.mask = mask
+
+
+def _with_nulls(seed: np.random.SeedSequence, offset: int, nrows: int, kernel: Callable, nulls: Callable,
+                na) -> np.ndarray:
+    """Kernel of a column with a missing value sentinel: the values of `kernel` with the null rows set to `na`"""
+    values = kernel(seed, offset, nrows)
+    values[nulls(seed, offset, nrows)] = na
+    return values
+
+
+def _fill_column(out: np.ndarray, column: _Column, start: int = 0) -> None:
+    """Generate rows [start, start + len(out)) of `column` into `out`, one stream block at a time
+
+    Blocks cut by the row range are drawn from their first row, so the values of a row never
+    depend on where the requested range begins or ends.
+    """
+    stop = start + len(out)
+    for block in range(start // _STREAM_BLOCK, -(-stop // _STREAM_BLOCK)):
+        first = block * _STREAM_BLOCK
+        lo, hi = max(start, first), min(stop, first + _STREAM_BLOCK)
+        seed = np.random.SeedSequence(column.seed.entropy, spawn_key=column.seed.spawn_key + (block,),
+                                      pool_size=column.seed.pool_size)
+        out[lo - start:hi - start] = column.kernel(seed, first, hi - first)[lo - first:]
+
+
+def _engine(kernel: Callable) -> str:
+    """Telemetry name of a column kernel, e.g. "ints", "unique ints" or "strings+nulls" """
+    nulls, unique = "", False
+    while isinstance(kernel, partial):
+        if kernel.func is _with_nulls:
+            nulls = "+nulls"
+            kernel = kernel.keywords["kernel"]
+            continue
+        unique = unique or kernel.keywords.get("unique", False)
+        kernel = kernel.func
+    name = getattr(kernel, "__name__", type(kernel).__name__).replace("_generate_", "")
+    return ("unique " if unique else "") + name + nulls
+
+
+def _partition_bounds(nrows: int, partition: int, npartitions: int) -> tuple:
+    """Rows [start, stop) of partition `partition` of `npartitions` of a frame of `nrows` rows
+
+    Partitions split whole stream blocks when there are enough of them, so that no block is drawn by
+    two partitions, and otherwise rows; their sizes differ by at most a block, or a row.
+    """
+    assert npartitions > 0, "provide a positive number of partitions"
+    assert 0 <= partition < npartitions, "partition must be in [0, npartitions)"
+    unit = _STREAM_BLOCK if nrows >= npartitions * _STREAM_BLOCK else 1
+    units = -(-nrows // unit)
+    return (min(nrows, units * partition // npartitions * unit),
+            min(nrows, units * (partition + 1) // npartitions * unit))
+
+
+def _fingerprint(value) -> object:
+    """JSON serializable description of a column plan, or of a value in it, see `_plan_key`"""
+    if isinstance(value, _Column):
+        return {name: _fingerprint(getattr(value, name)) for name in _Column.__slots__}
+    if isinstance(value, np.random.SeedSequence):
+        return ["seed", str(value.entropy), list(value.spawn_key), value.pool_size]
+    if isinstance(value, partial):
+        return ["partial", _fingerprint(value.func), [_fingerprint(arg) for arg in value.args],
+                {name: _fingerprint(arg) for name, arg in sorted(value.keywords.items())}]
+    if isinstance(value, np.ndarray):
+        return ["array", str(value.dtype), hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()]
+    if isinstance(value, (list, tuple)):
+        return [_fingerprint(item) for item in value]
+    if isinstance(value, (blocks.Categorize, blocks.Localize, blocks.Nullable, blocks.ArrowStrings)):
+        return blocks.wrap_spec(value)
+    if isinstance(value, (type, np.dtype)):
+        return str(np.dtype(value))
+    if isinstance(value, np.generic):
+        return str(value)
+    if callable(value):
+        return f"{value.__module__}.{value.__qualname__}"
+    return value if isinstance(value, (bool, int, float, str, type(None))) else repr(value)
+
+
+def _plan_key(plan: List[_Column], nrows: int, start: int = 0) -> str:
+    """Cache key of a frame: digest of its column plans, seeds included, row range and the randen version"""
+    description = {"version": __version__, "nrows": nrows, "start": start,
+                   "plan": [_fingerprint(column) for column in plan]}
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+
+def _is_secure(column: _Column) -> bool:
+    """Whether a column plan draws from the OS CSPRNG, see `_generate_strings`"""
+    kernels = [column.kernel] + ([column.raw.kernel] if column.raw is not None else [])
+    for kernel in kernels:
+        while isinstance(kernel, partial):
+            if kernel.keywords.get("secure"):
+                return True
+            kernel = kernel.keywords.get("kernel", kernel.func)
+    return False
+
+
+def _arrow_column(column: _Column, binary: bool = False) -> _Column:
+    """Plan generating a string column, or a bytes column if `binary`, straight into Arrow buffers
+
+    The column's raw fixed width bytes become its values, wrapped by `blocks.ArrowStrings` instead
+    of being decoded to python objects. Other columns are returned as they are.
+    """
+    decode = column.raw.wrap if column.raw is not None else None
+    if decode is blocks.decode_ascii or (binary and decode is blocks.to_objects):
+        return _Column(column.name, column.seed, column.raw.kernel, column.raw.dtype,
+                       blocks.ArrowStrings(binary=decode is blocks.to_objects), mask=column.mask)
+    return column
+
+
+class _SharedArray:
+    """Array source keeping a shared memory segment mapped for as long as an array views it
+
+    `np.asarray(_SharedArray(...))` views the segment through `__array_interface__`, which makes this
+    object, and with it the segment, the base of the array and of every view pandas takes of it.
+    The mapping is released when the last of them is collected.
+    """
+    def __init__(self, shm: shared_memory.SharedMemory, shape: tuple, dtype: Union[type, str]):
+        self._shm = shm
+        view = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        self.__array_interface__ = view.__array_interface__
+
+
+def _fill_buffer(handle: tuple, shape: tuple, dtype: Union[type, str], row: int, column: _Column,
+                 offset: int, start: int, stop: int, timed: bool = False) -> Union[float, None]:
+    """Process pool task: generate buffer rows [start, stop) of `column` into a buffer shared with the parent
+
+    Args:
+        handle (tuple): ("shm", shared memory segment name) or ("npy", memmap file path) of the buffer
+        shape (tuple): Shape of the buffer
+        dtype (Union[type, str]): dtype of the buffer
+        row (int): Row of a 2-D (ncols, nrows) block buffer, None for a 1-D column buffer
+        column (_Column): Plan of the column
+        offset (int): Row index of the first buffer row
+        start (int): First buffer row to generate
+        stop (int): Buffer row after the last row to generate
+        timed (bool, optional): Time the generation. Defaults to False.
+
+    Returns:
+        Union[float, None]: Seconds spent generating the rows if timed, else None
+    """
+    t0 = time.perf_counter() if timed else None
+    kind, name = handle
+    if kind == "npy":
+        values = np.load(name, mmap_mode="r+")
+        _fill_column((values if row is None else values[row])[start:stop], column, offset + start)
+        del values
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            values = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            _fill_column((values if row is None else values[row])[start:stop], column, offset + start)
+            del values
+        finally:
+            shm.close()
+    return time.perf_counter() - t0 if timed else None
 
 
 class DataFrameGenerator:
@@ -56,11 +460,21 @@ class DataFrameGenerator:
                         Float  float64
                         dtype: object
 
+        Reproducible output:
+        > DataFrameGenerator(seed=42).get_dataframe(...)  # same frame on every run
+
+        NumPy output, without importing pandas:
+        > DataFrameGenerator(output="numpy").get_dataframe(10, [int, str])  # {"Int0": ndarray, "Str1": ndarray}
+
 
     Supported APIs:
     ---------------
         dfg.get_dataframe(...)
 
+        dfg.iter_dataframe(...)
+
+        dfg.write_parquet(...), dfg.write_feather(...), dfg.write_csv(...)
+
         dfg.get_integer_dataframe(...)
 
         dfg.get_float_dataframe(...)
@@ -71,42 +485,652 @@ class DataFrameGenerator:
 
         dfg.get_dates_dataframe(...)
 
+        dfg.get_categorical_dataframe(...)
+
         dfg.get_bool_dataframe(...)
 
+        Telemetry:
+        > with dfg.profile() as profile:
+        >     dfg.get_dataframe(...)
+        > profile.summary()  # seconds, rows, bytes and rows/s per column, slowest first
+
     """
-    def __init__(self):
-        self._numrows = None
-
-    def _generate_ints(self, _min: int = -100000, _max: int = 100000) -> np.ndarray:
-        return np.random.randint(low=_min, high=_max, size=self._numrows)
-
-    def _generate_floats(self, _min: float = -1.0, _max: float = 1.0) -> np.ndarray:
-        return ((_max - _min) * np.random.random(size=self._numrows)) + _min
-
-    def _generate_strings(self, _min: int = 10, _max: int = 20) -> List[str]:
-        keys = set()
-        pickchar = partial(secrets.choice, ascii_letters + digits)
-        while len(keys) < self._numrows:
-            keys |= {''.join([pickchar()
-                              for _ in range(np.random.randint(low=_min, high=_max))])
-                     for _ in range(self._numrows - len(keys))}
-        return list(keys)
-
-    def _generate_dates(self, start: datetime = None, end: datetime = None) -> pd.DatetimeIndex:
-        if not start:
-            start = datetime.fromtimestamp(0)
-        if not end:
-            end = datetime.now()
-        return pd.date_range(start=start, end=end, periods=self._numrows)
-
-    def _generate_bools(self) -> List[bool]:
-        return [not random() >= 0.5 for _ in range(self._numrows)]
-
-    def _generate_chars(self, lowercase: bool = True) -> List[str]:
-        if lowercase:
-            return [choice(ascii_lowercase) for _ in range(self._numrows)]
+    def __init__(self, seed: SeedLike = None, workers: int = 1, executor: str = "thread",
+                 hooks: List[Callable[[telemetry.ColumnEvent], None]] = None, output: str = "pandas",
+                 string_storage: str = "python", cache: Union[str, DatasetCache] = None):
+        """
+        Args:
+            seed (SeedLike, optional): Seed of all generated data: an int (or list of ints),
+                a np.random.SeedSequence or a np.random.Generator. Defaults to None (fresh OS entropy).
+                Each get_*dataframe call draws from its own child of the seed, and within a call each
+                column from an independent stream derived, like SeedSequence.spawn, from its name.
+            workers (int, optional): Threads generating columns, and row ranges of long columns, in
+                parallel. numpy releases the GIL in its bulk random routines, so numeric columns scale
+                with the cores; the output does not depend on the number of workers. Defaults to 1.
+            executor (str, optional): "thread" or "process". Process workers generate row ranges into
+                shared memory buffers, which also parallelizes the Python-level parts of string and
+                object columns that threads cannot. Defaults to "thread".
+            hooks (List[Callable[[telemetry.ColumnEvent], None]], optional): Callables receiving a
+                `randen.telemetry.ColumnEvent` per column and row range generated. Defaults to None.
+            output (str, optional): What the get_*dataframe methods return: "pandas" a DataFrame,
+                "numpy" a dict of column name to ndarray, or "structured" a NumPy structured array,
+                both generated by the same engines without importing pandas, see
+                `blocks.to_numpy`, or "arrow" a pyarrow.Table, see `blocks.to_arrow`.
+                Defaults to "pandas".
+            string_storage (str, optional): Storage of the string columns of DataFrames, "python"
+                object arrays of python strings or "pyarrow" "string[pyarrow]" arrays built straight
+                from Arrow offsets and data buffers, as pandas' `mode.string_storage` option.
+                Defaults to "python".
+            cache (Union[str, DatasetCache], optional): Cache of generated DataFrames, or its directory
+                for an unbounded one. Seeded generators then generate a get_dataframe or get_*_dataframe
+                frame once and load it back memory-mapped, from any process, whenever the same call is
+                made again with the same seed and randen version, see `randen.cache`. Chunks, partitions,
+                streams and sinks are never cached. Defaults to None (no cache).
+        """
+        assert workers is not None and workers > 0, "provide a positive number of workers"
+        assert executor in ("thread", "process"), "executor must be 'thread' or 'process'"
+        assert output in ("pandas", "numpy", "structured", "arrow"), \
+            "output must be 'pandas', 'numpy', 'structured' or 'arrow'"
+        assert string_storage in ("python", "pyarrow"), "string_storage must be 'python' or 'pyarrow'"
+        if output == "arrow" or string_storage == "pyarrow":
+            require("pyarrow", "Arrow output")
+        self._seed = _as_seed_sequence(seed)
+        self._seeded = seed is not None
+        self._workers = workers
+        self._executor = executor
+        self._hooks = list(hooks or [])
+        self._output = output
+        self._string_storage = string_storage
+        self._cache = DatasetCache(cache) if isinstance(cache, str) else cache
+
+    def __getstate__(self) -> dict:
+        # Kernels bound to the generator are pickled to process workers, which report through the parent
+        state = self.__dict__.copy()
+        state["_hooks"] = []
+        return state
+
+    def add_hook(self, hook: Callable[[telemetry.ColumnEvent], None]) -> None:
+        """Report every column and row range generated from now on to `hook`, see `randen.telemetry`"""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[telemetry.ColumnEvent], None]) -> None:
+        """Stop reporting to `hook`"""
+        self._hooks.remove(hook)
+
+    @contextmanager
+    def profile(self) -> Iterator[telemetry.Profile]:
+        """Collect the telemetry of the generation calls within the block
+
+        Usage:
+        -----
+            with dfg.profile() as profile:
+                dfg.get_dataframe(...)
+            profile.summary()
+
+        Yields:
+            telemetry.Profile: Events of the block, with a per column summary
+        """
+        profile = telemetry.Profile()
+        self.add_hook(profile)
+        try:
+            yield profile
+        finally:
+            self.remove_hook(profile)
+
+    def _emit(self, column: str, start: int, nrows: int, seconds: float, nbytes: int, engine: str,
+              executor: str) -> None:
+        event = telemetry.ColumnEvent(column, start, nrows, seconds, nbytes, engine, executor)
+        for hook in self._hooks:
+            hook(event)
+
+    def _timed_fill(self, out: np.ndarray, column: _Column, start: int = 0) -> None:
+        """`_fill_column` reporting its wall time to the hooks"""
+        t0 = time.perf_counter()
+        _fill_column(out, column, start)
+        self._emit(column.name, start, len(out), time.perf_counter() - t0, out.nbytes, _engine(column.kernel),
+                   "serial" if self._workers == 1 else "thread")
+
+    def _first_call_seed(self) -> np.random.SeedSequence:
+        """Seed of the first generation call of a generator of this seed, drawn without spawning it"""
+        return np.random.SeedSequence(self._seed.entropy, spawn_key=self._seed.spawn_key + (0,),
+                                      pool_size=self._seed.pool_size)
+
+    def _column_seeds(self, columns: List[str], call: np.random.SeedSequence = None) -> List[np.random.SeedSequence]:
+        """Independent SeedSequences of the columns of one generation call
+
+        The call spawns a child of the generator seed, unless given its own `call` seed, and each
+        column extends the call seed's spawn key with its name (and occurrence, for repeated names),
+        so a column's values do not depend on its position, the other columns or the order the
+        columns are generated in.
+        """
+        call = self._seed.spawn(1)[0] if call is None else call
+        occurrences = Counter()
+        seeds = []
+        for name in columns:
+            name = str(name)
+            key = call.spawn_key + (zlib.crc32(name.encode()), occurrences[name])
+            seeds.append(np.random.SeedSequence(call.entropy, spawn_key=key, pool_size=call.pool_size))
+            occurrences[name] += 1
+        return seeds
+
+    def _generate_ints(self, seed: np.random.SeedSequence, offset: int, nrows: int, _min: int = -100000,
+                       _max: int = 100000, unique: bool = False, key: int = None,
+                       dtype: DTypeLike = np.int64) -> np.ndarray:
+        """Integers in [_min, _max), drawn straight at the width of `dtype`"""
+        if unique:
+            return self._generate_unique_ints(offset, nrows, _min=_min, _max=_max, key=key, dtype=dtype)
+        return np.random.default_rng(seed).integers(low=_min, high=_max, size=nrows, dtype=dtype)
+
+    def _generate_unique_ints(self, offset: int, nrows: int, _min: int, _max: int, key: int = None,
+                              dtype: DTypeLike = np.int64) -> np.ndarray:
+        """Guaranteed-unique integers in [_min, _max)
+
+        Row i maps to `_min + perm(i)` for a keyed permutation `perm` of [0, _max - _min),
+        so uniqueness needs no dedup set and holds across chunks generated with the same key.
+
+        Args:
+            offset (int): Row index of the first generated row
+            nrows (int): Number of rows
+            _min (int): Minimum value of the integers
+            _max (int): Maximum value of the integers (exclusive)
+            key (int, optional): Permutation key, reuse it across chunks of one column. Defaults to random.
+            dtype (DTypeLike, optional): Integer dtype holding [_min, _max). Defaults to int64.
+
+        Raises:
+            ValueError: If [_min, _max) holds fewer values than the requested rows
+
+        Returns:
+            np.ndarray: array of distinct values
+        """
+        if offset + nrows > _max - _min:
+            logger.error(f"Cannot draw {offset + nrows} unique integers from [{_min}, {_max})")
+            raise ValueError(f"Cannot draw {offset + nrows} unique integers from [{_min}, {_max})")
+        perm = FeistelPermutation(_max - _min, key=secrets.randbits(64) if key is None else key)
+        values = perm(np.arange(offset, offset + nrows))
+        if _min >= 0:
+            return (values + np.uint64(_min)).astype(dtype, copy=False)
+        return (values.astype(np.int64) + _min).astype(dtype, copy=False)
+
+    def _unique_string_codes(self, offset: int, codes: np.ndarray, lengths: np.ndarray, _min: int, _max: int,
+                             nsymbols: int, total: int = None, key: int = None) -> None:
+        """Make rows of alphabet codes distinct, in place: a keyed permutation of the row index, written in base
+        `nsymbols` over the last characters of each row
+
+        The permutation runs over `total` values, the rows of the whole column, or over every string of
+        `_min` to `_max` characters if the column has no known size. With D the digits of its largest
+        value, a row of length L holds its value in its last min(L, D) characters, zero padded, after L -
+        min(L, D) random characters, and rows too short for their value are lengthened to its digit count:
+        rows of equal length then differ in their value and rows of different lengths differ anyway.
+        Columns larger than the strings of `_max` characters alone take their lengths from the value
+        instead, to reach every string of the range.
+
+        Args:
+            offset (int): Row index of the first generated row
+            codes (np.ndarray): (nrows, _max) alphabet codes of the rows
+            lengths (np.ndarray): Lengths of the rows
+            _min (int): Minimum string length
+            _max (int): Maximum string length
+            nsymbols (int): Alphabet size
+            total (int, optional): Rows of the whole column. Defaults to None (unbounded).
+            key (int, optional): Permutation key, reuse it across chunks. Defaults to random.
+
+        Raises:
+            ValueError: If the column has more rows than there are strings of `_min` to `_max` characters
+        """
+        nrows = len(lengths)
+        space = sum(nsymbols ** length for length in range(_min, _max + 1))
+        size = min(space if not total else total, 1 << 63)
+        if offset + nrows > size or (total or 0) > space:
+            logger.error(f"Cannot draw {max(offset + nrows, total or 0)} unique strings of {_min} to {_max} characters")
+            raise ValueError(f"Cannot draw {max(offset + nrows, total or 0)} unique strings of {_min} to {_max} "
+                             f"characters")
+
+        perm = FeistelPermutation(size, key=secrets.randbits(64) if key is None else key)
+        values = perm(np.arange(offset, offset + nrows))
+        base = np.uint64(nsymbols)
+        if size > nsymbols ** _max:
+            # every length is needed: value v is the v-th string in (length, characters) order
+            starts = np.cumsum([0] + [nsymbols ** length for length in range(_min, _max)], dtype=np.uint64)
+            index = np.searchsorted(starts, values, side="right") - 1
+            lengths[:] = _min + index
+            values = values - starts[index]
+            ndigits = lengths
+        else:
+            ndigits = 0
+            while nsymbols ** ndigits < size:
+                ndigits += 1
+            digits, rest = np.zeros(nrows, dtype=np.int64), values.copy()
+            while rest.any():
+                digits += rest > 0
+                rest //= base
+            np.maximum(lengths, digits, out=lengths)
+            ndigits = np.minimum(lengths, ndigits)
+
+        for i in range(int(np.max(ndigits, initial=0))):
+            rows = np.flatnonzero(ndigits > i)
+            codes[rows, lengths[rows] - 1 - i] = values[rows] % base
+            values //= base
+
+    def _generate_floats(self, seed: np.random.SeedSequence, offset: int, nrows: int, _min: float = -1.0,
+                         _max: float = 1.0, dtype: DTypeLike = np.float64) -> np.ndarray:
+        """Floats in [_min, _max), drawn and scaled in place at the width of `dtype`
+
+        numpy draws float32 or float64 only; float16 columns are drawn as float32 and cast.
+        """
+        dtype = np.dtype(dtype)
+        values = np.random.default_rng(seed).random(size=nrows, dtype=np.float32 if dtype == np.float16 else dtype)
+        values *= _max - _min
+        values += _min
+        return values.astype(dtype, copy=False)
+
+    def _generate_strings(self, seed: np.random.SeedSequence, offset: int, nrows: int, _min: int = 10,
+                          _max: int = 20, alphabet: str = ascii_letters + digits, secure: bool = False,
+                          unique: bool = False, total: int = None, key: int = None, decode: bool = True) -> np.ndarray:
+        """Vectorized string engine
+
+        All characters of the column are drawn in one call as a (nrows, _max) byte matrix,
+        the bytes past each row's drawn length are zeroed and the rows are reinterpreted as
+        null padded fixed width byte strings, which numpy trims when decoding them to str.
+
+        Args:
+            seed (np.random.SeedSequence): Seed of the stream block
+            offset (int): Row index of the first generated row
+            nrows (int): Number of rows
+            _min (int, optional): Minimum string length. Defaults to 10.
+            _max (int, optional): Maximum string length (inclusive). Defaults to 20.
+            alphabet (str, optional): ASCII characters to build strings from. Defaults to letters + digits.
+            secure (bool, optional): Draw from the OS CSPRNG (`secrets`) instead of numpy. Defaults to False.
+            unique (bool, optional): Guarantee distinct strings, see `_unique_string_codes`. The last
+                characters of every string then encode a keyed permutation of its row index, and short
+                strings may be lengthened to hold it. Defaults to False.
+            total (int, optional): Rows of the whole unique column, which sizes the permutation. Defaults to
+                None (every string of `_min` to `_max` characters).
+            key (int, optional): Permutation key of unique strings, reuse it across chunks. Defaults to random.
+            decode (bool, optional): Decode to python strings rather than returning the null padded
+                fixed width bytes. Defaults to True.
+
+        Returns:
+            np.ndarray: object array of python strings
+        """
+        assert 0 <= _min <= _max, "minimum string length must be in [0, maximum string length]"
+        assert alphabet and alphabet.isascii() and "\0" not in alphabet, "alphabet must be non-empty ASCII"
+
+        width = max(_max, 1)
+        table = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)
+        if secure:
+            lengths = _min + _secure_randbelow(_max - _min + 1, nrows)
+            codes = _secure_randbelow(len(table), nrows * width)
+        else:
+            # separate streams keep the first rows of a block identical however many rows are drawn
+            chars_rng, lengths_rng = (np.random.default_rng(s) for s in seed.spawn(2))
+            lengths = lengths_rng.integers(low=_min, high=_max + 1, size=nrows)
+            codes = chars_rng.integers(low=0, high=len(table), size=nrows * width, dtype=np.uint8)
+
+        codes = codes.reshape(nrows, width)
+        if unique:
+            self._unique_string_codes(offset, codes, lengths, _min, _max, len(table), total=total, key=key)
+
+        chars = table[codes]
+        chars[np.arange(width) >= lengths[:, None]] = 0
+        chars = chars.view(f"S{width}").ravel()
+        return blocks.decode_ascii(chars) if decode else chars
+
+    def _generate_dates(self, seed: np.random.SeedSequence, offset: int, nrows: int, periods: int,
+                        start: int, end: int, resolution: str = "ns") -> np.ndarray:
+        """Row `offset + i` of `pd.date_range(start, end, periods=periods)`, as datetime64[ns]
+
+        `start` and `end` are in ns since the epoch (UTC). As in `pd.date_range`, only the offsets from
+        `start`, at most the range, go through float64, so present-day timestamps keep their nanoseconds.
+        """
+        rows = np.arange(offset, offset + nrows)
+        values = (rows * ((end - start) / max(periods - 1, 1))).astype(np.int64)
+        values[rows == periods - 1] = end - start
+        values += start
+        return (values - values % _RESOLUTIONS[resolution]).view("datetime64[ns]")
+
+    def _generate_timestamps(self, seed: np.random.SeedSequence, offset: int, nrows: int, start: int, end: int,
+                             resolution: str = "ns", order: str = "unsorted", total: int = None,
+                             jitter: float = 10.0, profile: tuple = None) -> np.ndarray:
+        """Random timestamp engine: int64 epoch offsets drawn in [start, end], viewed as datetime64[ns]
+
+        Unsorted timestamps without a profile are drawn as exact integers at the resolution. The other
+        modes place row i at u_i in [0, 1) of the range, or of the profile's inverse CDF, then truncate
+        to the resolution; both maps are monotonic, so sorted rows stay sorted, exact to about 2**-53
+        of the range. Sorted rows without a profile are placed in exact integer strata of the range
+        instead. Offsets from `start` are added to it as int64. No python datetime object is created.
+
+        Args:
+            seed (np.random.SeedSequence): Seed of the stream block
+            offset (int): Row index of the first generated row
+            nrows (int): Number of rows
+            start (int): First timestamp, ns since the epoch (UTC)
+            end (int): Last timestamp (inclusive), ns since the epoch (UTC)
+            resolution (str, optional): "s", "ms", "us" or "ns". Defaults to "ns".
+            order (str, optional): Ordering of the rows. Defaults to "unsorted".
+                "unsorted": independent uniform timestamps
+                "sorted": non-decreasing timestamps, row i uniform in the i-th of `total` equal strata
+                "jitter": the sorted trend with each row displaced by up to `jitter` rows either way
+            total (int, optional): Rows of the whole column, needed by "sorted" and "jitter". Defaults to None.
+            jitter (float, optional): Maximum displacement of "jitter" rows, in rows. Defaults to 10.0.
+            profile (tuple, optional): Weekday/hour skew, see `_time_profile`. Defaults to None (uniform).
+
+        Returns:
+            np.ndarray: datetime64[ns] array
+        """
+        unit = _RESOLUTIONS[resolution]
+        lo, hi = -(-start // unit) * unit, end // unit * unit
+        rng = np.random.default_rng(seed)
+        if order == "unsorted" and profile is None:
+            return (rng.integers(lo // unit, hi // unit, size=nrows, endpoint=True) * unit).view("datetime64[ns]")
+
+        if order == "sorted" and profile is None:
+            # integer strata of the hi - lo + 1 timestamps, row i uniform in its own one
+            bounds = _strata(np.arange(offset, offset + nrows + 1, dtype=np.int64), hi - lo + 1, total)
+            widths = np.diff(bounds)
+            values = bounds[:-1] + np.minimum(np.floor(rng.random(size=nrows) * widths).astype(np.int64),
+                                              np.maximum(widths - 1, 0))
+            values -= values % unit
+            values += lo
+            return values.view("datetime64[ns]")
+
+        rows = np.arange(offset, offset + nrows, dtype=np.float64)
+        if order == "unsorted":
+            u = rng.random(size=nrows)
+        elif order == "sorted":
+            u = (rows + rng.random(size=nrows)) / total
         else:
-            return [choice(ascii_uppercase) for _ in range(self._numrows)]
+            u = np.clip((rows + 0.5 + jitter * rng.uniform(-1, 1, size=nrows)) / total, 0, np.nextafter(1, 0))
+
+        if profile is None:
+            values = np.minimum(np.floor(u * (hi - lo)).astype(np.int64), hi - lo)
+        else:
+            edges, cdf = profile
+            bucket = np.minimum(np.searchsorted(cdf, u, side="right"), len(cdf) - 1)
+            below = np.concatenate([[0.0], cdf])[bucket]
+            fraction = np.clip((u - below) / (cdf[bucket] - below), 0, 1)
+            values = edges[bucket] - lo + np.floor(fraction * np.diff(edges)[bucket]).astype(np.int64)
+            values = np.clip(values, 0, hi - lo)
+        values -= values % unit
+        values += lo
+        return values.view("datetime64[ns]")
+
+    def _generate_bools(self, seed: np.random.SeedSequence, offset: int, nrows: int) -> np.ndarray:
+        """Bit level bool kernel: one random byte yields eight rows, unpacked straight into a bool array"""
+        packed = np.random.default_rng(seed).integers(low=0, high=1 << 8, size=(nrows + 7) // 8, dtype=np.uint8)
+        return np.unpackbits(packed, count=nrows).view(bool)
+
+    def _generate_chars(self, seed: np.random.SeedSequence, offset: int, nrows: int, lowercase: bool = True,
+                        chartype: str = "str") -> np.ndarray:
+        """Char kernel: a uint8 draw of alphabet positions mapped onto the alphabet bytes
+
+        Args:
+            seed (np.random.SeedSequence): Seed of the stream block
+            offset (int): Row index of the first generated row
+            nrows (int): Number of rows
+            lowercase (bool, optional): Characters lowercase or uppercase. Defaults to True.
+            chartype (str, optional): Representation of the characters. Defaults to "str".
+                "str": object array of python strings
+                "S1": 1-byte fixed width numpy bytes array
+                "category": alphabet positions, the codes of a pd.Categorical over the alphabet
+
+        Raises:
+            ValueError: If requested chartype is unsupported
+
+        Returns:
+            np.ndarray:
+        """
+        alphabet = ascii_lowercase if lowercase else ascii_uppercase
+        codes = np.random.default_rng(seed).integers(low=0, high=len(alphabet), size=nrows, dtype=np.uint8)
+        if chartype == "category":
+            return codes.view(np.int8)
+
+        chars = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)[codes].view("S1")
+        if chartype == "S1":
+            return chars
+        elif chartype == "str":
+            return blocks.decode_ascii(chars)
+        logger.error(f"Unsupported chartype {chartype} requested")
+        raise ValueError(f"Unsupported chartype {chartype} requested")
+
+    def _generate_categories(self, seed: np.random.SeedSequence, offset: int, nrows: int, ncategories: int,
+                             cdf: np.ndarray = None, dtype: DTypeLike = np.int32) -> np.ndarray:
+        """Categorical codes kernel: integer codes in [0, ncategories), no per-row python object
+
+        Args:
+            seed (np.random.SeedSequence): Seed of the stream block
+            offset (int): Row index of the first generated row
+            nrows (int): Number of rows
+            ncategories (int): Number of categories
+            cdf (np.ndarray, optional): Cumulative category frequencies, ending at 1; the codes are then
+                drawn by inverse transform sampling. Defaults to None (uniform codes).
+            dtype (DTypeLike, optional): Integer dtype of the codes, see `_code_dtype`. Defaults to int32.
+
+        Returns:
+            np.ndarray:
+        """
+        rng = np.random.default_rng(seed)
+        if cdf is None:
+            return rng.integers(low=0, high=ncategories, size=nrows, dtype=dtype)
+        return np.searchsorted(cdf, rng.random(size=nrows), side="right").astype(dtype)
+
+    def _generate_nulls(self, seed: np.random.SeedSequence, offset: int, nrows: int, nullratio: float,
+                        total: int = None, key: int = None) -> np.ndarray:
+        """Null mask kernel: one vectorized Bernoulli(nullratio) draw per row
+
+        Args:
+            seed (np.random.SeedSequence): Seed of the stream block; the mask is drawn from a stream
+                of its own, so it does not disturb the values
+            offset (int): Row index of the first generated row
+            nrows (int): Number of rows
+            nullratio (float): Probability of a row being null
+            total (int, optional): Rows of the whole column, to null exactly round(nullratio * total)
+                of them: the rows whose keyed permutation of the row index falls below that count.
+                Defaults to None (Bernoulli draw).
+            key (int, optional): Permutation key of the exact count, reuse it across chunks. Defaults to random.
+
+        Returns:
+            np.ndarray: bool array, True for null rows
+        """
+        if total is not None:
+            perm = FeistelPermutation(max(total, 1), key=secrets.randbits(64) if key is None else key)
+            return perm(np.arange(offset, offset + nrows)) < np.uint64(round(nullratio * total))
+        return np.random.default_rng(_null_seed(seed)).random(size=nrows) < nullratio
+
+    def _fill_columns(self, tasks: List[tuple], start: int = 0) -> None:
+        """Run `_fill_column(out, column, start)` tasks, in a thread pool when the generator has several workers
+
+        Each column is split into row ranges of _TASK_ROWS rows, written by the workers straight into
+        disjoint slices of the preallocated output buffers.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        fill = self._timed_fill if self._hooks else _fill_column
+        if self._workers == 1:
+            for out, column in tasks:
+                fill(out, column, start)
+            return
+
+        ranges = [(out[lo:lo + _TASK_ROWS], column, start + lo)
+                  for out, column in tasks for lo in range(0, len(out), _TASK_ROWS)]
+        with ThreadPoolExecutor(max_workers=self._workers) as pool:
+            for future in [pool.submit(fill, *task) for task in ranges]:
+                future.result()
+
+    def _fill_shared(self, tasks: List[tuple], nrows: int, start: int = 0) -> None:
+        """Run `_fill_buffer` tasks, split into row ranges of _TASK_ROWS rows, in a process pool
+
+        The workers attach to the buffers by their handle and write straight into them, so no
+        column is pickled back to the parent.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        timed = bool(self._hooks)
+        ranges = [(task, lo, min(lo + _TASK_ROWS, nrows)) for task in tasks for lo in range(0, nrows, _TASK_ROWS)]
+        with ProcessPoolExecutor(max_workers=self._workers) as pool:
+            futures = [pool.submit(_fill_buffer, handle, values.shape, values.dtype, row, column, start, lo, hi, timed)
+                       for (handle, values, row, column), lo, hi in ranges]
+            try:
+                for future, ((_, values, row, column), lo, hi) in zip(futures, ranges):
+                    seconds = future.result()
+                    if timed:
+                        self._emit(column.name, start + lo, hi - lo, seconds, (hi - lo) * values.dtype.itemsize,
+                                   _engine(column.kernel), "process")
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _cached_dataframe(self, nrows: int, plan: List[_Column], memmap_dir: str = None) -> pd.DataFrame:
+        """`_build_dataframe` of a whole frame, through the cache if the generator has one
+
+        Only seeded generators cache, as a fresh seed never repeats a call, and never frames with
+        `secure` string columns, which the seed does not reproduce.
+        """
+        if self._cache is None or not self._seeded or memmap_dir is not None or self._output != "pandas" \
+                or any(_is_secure(column) for column in plan):
+            return self._build_dataframe(nrows, plan, memmap_dir=memmap_dir)
+        cached = [_arrow_column(column) for column in plan] if self._string_storage == "pyarrow" else plan
+        return self._cache.get(_plan_key(cached, nrows),
+                               lambda directory: self._build_dataframe(nrows, plan, memmap_dir=directory))
+
+    def _build_dataframe(self, nrows: int, plan: List[_Column], start: int = 0, memmap_dir: str = None,
+                         output: str = None) -> Union[pd.DataFrame, Dict[str, np.ndarray], np.ndarray, pa.Table]:
+        """Generate the columns into one preallocated 2-D block per dtype and wrap the blocks as a DataFrame
+
+        Every column is written straight into its row of the (ncols_of_dtype, nrows) block, which is
+        the layout pandas keeps internally, so the frame is built once with no copy, no
+        consolidation and peak memory close to the final frame size.
+
+        The blocks are allocated in RAM, in `multiprocessing.shared_memory` segments the process
+        workers attach to by name, or as `.npy` memmap files under `memmap_dir`. In the latter two
+        cases object columns are generated as fixed width bytes, which the buffers can hold, and
+        decoded by the parent. Segment names are unlinked as soon as the workers are done, or have
+        failed, and the memory itself is released when the last array viewing it is collected.
+
+        Args:
+            nrows (int): Number of rows
+            plan (List[_Column]): Columns of the dataframe. Wrapped(extension array) columns
+                are kept in a block of their own
+            start (int, optional): Row index of the first generated row, e.g. of a chunk. Defaults to 0.
+            memmap_dir (str, optional): Directory to generate the blocks into as memmap files,
+                with a manifest for `randen.open_memmap`. Defaults to None (in memory).
+            output (str, optional): "pandas", "numpy", "structured" or "arrow". Defaults to None (the
+                generator's output).
+
+        Returns:
+            Union[pd.DataFrame, Dict[str, np.ndarray], np.ndarray, pa.Table]:
+        """
+        output = output or self._output
+        if output == "arrow" or (output == "pandas" and self._string_storage == "pyarrow"):
+            plan = [_arrow_column(column, binary=output == "arrow") for column in plan]
+        positions = {}
+        for i, column in enumerate(plan):
+            positions.setdefault(("extension", i) if column.wrap else np.dtype(column.dtype), []).append(i)
+
+        store = memmap.MemmapStore(memmap_dir) if memmap_dir is not None else None
+        shared = store is not None or self._executor == "process"
+        segments = []
+
+        def allocate(shape: tuple, dtype: Union[type, str]) -> tuple:
+            if store is not None:
+                path, values = store.allocate(shape, dtype)
+                return ("npy", path), values
+            if self._executor == "process":
+                nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+                segments.append(shared_memory.SharedMemory(create=True, size=max(nbytes, 1)))
+                return ("shm", segments[-1].name), np.asarray(_SharedArray(segments[-1], shape, dtype))
+            return None, np.empty(shape, dtype=dtype)
+
+        try:
+            buffers, tasks, decodes, masks, entries = [], [], [], [], []
+
+            def allocate_mask(column: _Column) -> tuple:
+                if column.mask is None:
+                    return None, None
+                handle, mask = allocate((nrows,), np.bool_)
+                tasks.append((handle, mask, None, column.mask))
+                return handle and handle[1], mask
+
+            for placement in positions.values():
+                column = plan[placement[0]]
+                if column.wrap is not None:
+                    source = column.raw if shared and column.raw is not None else column
+                    handle, values = allocate((nrows,), source.dtype)
+                    tasks.append((handle, values, None, source))
+                    mask_file, mask = allocate_mask(column)
+                    entries.append({"placement": placement, "file": handle and handle[1],
+                                    "wrap": blocks.wrap_spec(column.wrap), "mask": mask_file,
+                                    "decode": blocks.wrap_spec(source.wrap) if source is not column else None})
+                    buffers.append((values, placement, source.wrap if source is not column else None, mask))
+                    continue
+
+                if column.raw is not None and shared:
+                    values = np.empty((len(placement), nrows), dtype=column.dtype)
+                    entries.append({"placement": placement, "files": [], "wraps": [], "masks": []})
+                    for row, i in enumerate(placement):
+                        handle, raw = allocate((nrows,), plan[i].raw.dtype)
+                        tasks.append((handle, raw, None, plan[i].raw))
+                        decodes.append((values[row], plan[i].raw, raw))
+                        entries[-1]["files"].append(handle[1])
+                        entries[-1]["wraps"].append(blocks.wrap_spec(plan[i].raw.wrap))
+                else:
+                    handle, values = allocate((len(placement), nrows), column.dtype)
+                    tasks.extend((handle, values, row, plan[i]) for row, i in enumerate(placement))
+                    entries.append({"placement": placement, "file": handle and handle[1]})
+                for row, i in enumerate(placement):
+                    mask_file, mask = allocate_mask(plan[i])
+                    if mask is not None:
+                        masks.append((values[row], mask))
+                    if "masks" in entries[-1]:
+                        entries[-1]["masks"].append(mask_file)
+                buffers.append((values, placement, None, None))
+
+            if self._executor == "process":
+                self._fill_shared(tasks, nrows, start=start)
+            else:
+                self._fill_columns([(values if row is None else values[row], column)
+                                    for _, values, row, column in tasks], start=start)
+            for out, raw_column, raw in decodes:
+                t0 = time.perf_counter() if self._hooks else None
+                out[:] = raw_column.wrap(raw)
+                if self._hooks:
+                    self._emit(raw_column.name, start, nrows, time.perf_counter() - t0, raw.nbytes, "decode",
+                               "parent")
+            for out, mask in masks:
+                out[mask] = None
+        finally:
+            for shm in segments:
+                shm.unlink()
+
+        columns = [column.name for column in plan]
+        if store is not None:
+            store.save(columns, nrows, entries)
+        frame_blocks, arrays = [], {}
+        for values, placement, decode, mask in buffers:
+            if values.ndim == 2:
+                if output == "pandas":
+                    frame_blocks.append((np.asarray(values), placement))
+                else:
+                    for row, i in enumerate(placement):
+                        arrays[i] = blocks.to_arrow(values[row]) if output == "arrow" else values[row]
+                continue
+            if decode is not None:
+                t0 = time.perf_counter() if self._hooks else None
+                raw, values = values, decode(values)
+                if self._hooks:
+                    self._emit(plan[placement[0]].name, start, nrows, time.perf_counter() - t0, raw.nbytes, "decode",
+                               "parent")
+            wrap = plan[placement[0]].wrap
+            if output == "pandas":
+                frame_blocks.append((wrap(values) if mask is None else wrap(values, mask), placement))
+            else:
+                arrays[placement[0]] = (blocks.to_arrow if output == "arrow" else blocks.to_numpy)(values, wrap, mask)
+        if output == "pandas":
+            return blocks.assemble_frame(frame_blocks, columns, pd.RangeIndex(start, start + nrows))
+        if output == "arrow":
+            return blocks.assemble_table([arrays[i] for i in range(len(columns))], columns)
+        arrays = {name: arrays[i] for i, name in enumerate(columns)}
+        return arrays if output == "numpy" else blocks.to_structured(arrays)
 
     def _get_column_names(self, ctypes: List[type], columns: List[str] = None) -> List[str]:
         """
@@ -121,68 +1145,601 @@ class DataFrameGenerator:
         """
         if columns is not None and len(ctypes) == len(columns):
             return columns
-        columns = []
-        _ctypes_count = Counter(ctypes)
-        for i, _ctype in enumerate(ctypes):
-            _column_name = f"{_ctype.__name__.capitalize()}{i}"
-            columns.append(_column_name)
-        return columns
-
-    def get_dataframe(self, nrows: int, ctypes: List[type], columns: List[str] = None) -> pd.DataFrame:
+        return [f"{_ctype.__name__.capitalize()}{i}" for i, _ctype in enumerate(ctypes)]
+
+    def _string_column(self, name: str, seed: np.random.SeedSequence, nrows: int = 0, **params) -> _Column:
+        """Plan of a string column of `nrows` rows in total (0 if unbounded), `params` being the
+        `_generate_strings` parameters"""
+        if params.get("unique") and nrows:
+            params["total"] = nrows
+        kernel = partial(self._generate_strings, key=_permutation_key(seed), **params)
+        raw = _Column(name, seed, partial(kernel, decode=False), f"S{max(params.get('_max', 20), 1)}",
+                      blocks.decode_ascii)
+        return _Column(name, seed, kernel, object, raw=raw)
+
+    def _char_column(self, name: str, seed: np.random.SeedSequence, lowercase: bool = True,
+                     chartype: str = "str") -> _Column:
+        """Plan of a char column, see `_generate_chars`
+
+        Raises:
+            ValueError: If requested chartype is unsupported
+        """
+        # checked here, as the raw plans of the Arrow, shared memory and memmap paths never pass "str" or "category"
+        if chartype not in ("str", "S1", "category"):
+            logger.error(f"Unsupported chartype {chartype} requested")
+            raise ValueError(f"Unsupported chartype {chartype} requested")
+        kernel = partial(self._generate_chars, lowercase=lowercase, chartype=chartype)
+        if chartype == "category":
+            # int8 is the code dtype pandas keeps, so the codes buffer is wrapped without a copy
+            categories = list(ascii_lowercase if lowercase else ascii_uppercase)
+            return _Column(name, seed, kernel, np.int8, blocks.Categorize(categories))
+        decode = blocks.decode_ascii if chartype == "str" else blocks.to_objects
+        raw = _Column(name, seed, partial(kernel, chartype="S1"), "S1", decode)
+        return _Column(name, seed, kernel, object, raw=raw)
+
+    def _categorical_column(self, name: str, seed: np.random.SeedSequence, categories: List[str] = None,
+                            ncategories: int = 100, weights: Union[str, List[float]] = None,
+                            **params) -> _Column:
+        """Plan of a categorical column: codes over a vocabulary generated once per column
+
+        Args:
+            name (str): Column name
+            seed (np.random.SeedSequence): Column seed; the vocabulary is drawn from a stream of its own
+            categories (List[str], optional): Vocabulary of the column. Defaults to None (generated).
+            ncategories (int, optional): Size of the generated vocabulary. Defaults to 100.
+            weights (Union[str, List[float]], optional): Relative frequency of each category, or "zipf"
+                for frequencies falling as 1/rank. Defaults to None (uniform).
+            **params: `_generate_strings` parameters of the generated vocabulary
+
+        Returns:
+            _Column:
+        """
+        if categories is None:
+            assert ncategories > 0, "provide a positive number of categories"
+            vocabulary_seed = np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key + (_VOCABULARY_KEY,),
+                                                     pool_size=seed.pool_size)
+            params.setdefault("_min", 10)
+            categories = self._generate_strings(vocabulary_seed, 0, ncategories, unique=True, total=ncategories,
+                                                key=_permutation_key(vocabulary_seed), **params).tolist()
+        assert len(categories) > 0, "provide a non-empty list of categories"
+
+        cdf = None
+        if isinstance(weights, str):
+            if weights != "zipf":
+                logger.error(f"Unsupported weights {weights} requested")
+                raise ValueError(f"Unsupported weights {weights} requested")
+            weights = 1.0 / np.arange(1, len(categories) + 1)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+            assert len(weights) == len(categories), "provide one weight per category"
+            assert (weights >= 0).all() and weights.sum() > 0, "weights must be non-negative, not all zero"
+            cdf = np.cumsum(weights / weights.sum())
+            cdf[-1] = 1.0
+
+        dtype = _code_dtype(len(categories))
+        kernel = partial(self._generate_categories, ncategories=len(categories), cdf=cdf, dtype=dtype)
+        return _Column(name, seed, kernel, dtype, blocks.Categorize(categories))
+
+    def _datetime_column(self, name: str, seed: np.random.SeedSequence, nrows: int, start: datetime = None,
+                         end: datetime = None, resolution: str = "ns", order: str = "unsorted", jitter: float = 10.0,
+                         tz: str = None, weekday_weights: List[float] = None,
+                         hour_weights: List[float] = None) -> _Column:
+        """Plan of a datetime column of `nrows` rows in total, see `_generate_timestamps`
+
+        Raises:
+            ValueError: If requested resolution or order is unsupported
+        """
+        if resolution not in _RESOLUTIONS:
+            logger.error(f"Unsupported resolution {resolution} requested")
+            raise ValueError(f"Unsupported resolution {resolution} requested")
+        start, end, tz = _date_bounds(start, end, tz)
+        assert start <= end, "start must not be after end"
+
+        if order == "range":
+            kernel = partial(self._generate_dates, periods=nrows, start=start, end=end, resolution=resolution)
+        elif order in ("unsorted", "sorted", "jitter"):
+            profile = None
+            if weekday_weights is not None or hour_weights is not None:
+                profile = _time_profile(start, end, weekday_weights, hour_weights, tz)
+            kernel = partial(self._generate_timestamps, start=start, end=end, resolution=resolution, order=order,
+                             total=nrows, jitter=jitter, profile=profile)
+        else:
+            logger.error(f"Unsupported order {order} requested")
+            raise ValueError(f"Unsupported order {order} requested")
+        return _Column(name, seed, kernel, _CTYPE_DTYPES[datetime], blocks.Localize(tz) if tz is not None else None)
+
+    def _default_column(self, name: str, seed: np.random.SeedSequence, ctype: type, nrows: int,
+                        dtype: DTypeLike = None, downcast: bool = False, **params) -> _Column:
+        """Plan of a `get_dataframe` column of type `ctype`
+
+        Args:
+            name (str): Column name
+            seed (np.random.SeedSequence): Column seed
+            ctype (type): Column type
+            nrows (int): Rows of the whole frame
+            dtype (DTypeLike, optional): numpy dtype of an int or float column. Defaults to None.
+            downcast (bool, optional): Narrowest integer dtype for an int column without a dtype. Defaults to False.
+            **params: Generation parameters of the column type, named as in the get_*dataframe methods:
+                minval, maxval and unique for int, minval and maxval for float, minstrlen, maxstrlen,
+                alphabet, secure and unique for str, lowercase and chartype for bytes, categories,
+                ncategories, weights, minstrlen, maxstrlen and alphabet for pd.Categorical, and start,
+                end, resolution, order, jitter, tz, weekday_weights and hour_weights for datetime.
+                Defaults to the get_dataframe parameters.
+
+        Raises:
+            ValueError: If requested Column datatype is unsupported, or dtype or a parameter is given for a column
+                of another type
+        """
+        if dtype is not None and ctype not in (int, float):
+            logger.error(f"dtype {dtype} requested for a column of type {ctype}")
+            raise ValueError(f"dtype {dtype} requested for a column of type {ctype}")
+        supported = {int: ("minval", "maxval", "unique"), float: ("minval", "maxval"),
+                     str: ("minstrlen", "maxstrlen", "alphabet", "secure", "unique"), bytes: ("lowercase", "chartype"),
+                     datetime: ("start", "end", "resolution", "order", "jitter", "tz", "weekday_weights",
+                                "hour_weights")}
+        allowed = ("categories", "ncategories", "weights", "minstrlen", "maxstrlen", "alphabet") \
+            if _is_categorical(ctype) else supported.get(ctype, ())
+        unsupported = sorted(set(params) - set(allowed))
+        if unsupported:
+            logger.error(f"Parameters {unsupported} requested for a column of type {ctype}")
+            raise ValueError(f"Parameters {unsupported} requested for a column of type {ctype}")
+        strings = {"_min": params.pop("minstrlen", 10), "_max": params.pop("maxstrlen", 20)} \
+            if ctype == str or _is_categorical(ctype) else {}
+
+        if ctype == int:
+            _min, _max = _int_range(params.get("minval"), params.get("maxval"), dtype)
+            dtype = _int_dtype(_min, _max, dtype, downcast)
+            kernel = partial(self._generate_ints, _min=_min, _max=_max, unique=params.get("unique", False),
+                             key=_permutation_key(seed), dtype=dtype)
+            return _Column(name, seed, kernel, dtype)
+        elif ctype == float:
+            dtype = _float_dtype(dtype)
+            kernel = partial(self._generate_floats, _min=params.get("minval", -1.0), _max=params.get("maxval", 1.0),
+                             dtype=dtype)
+            return _Column(name, seed, kernel, dtype)
+        elif ctype == bool:
+            kernel = self._generate_bools
+        elif ctype == str:
+            return self._string_column(name, seed, nrows, **strings, **params)
+        elif ctype == bytes:
+            return self._char_column(name, seed, **params)
+        elif _is_categorical(ctype):
+            return self._categorical_column(name, seed, **strings, **params)
+        elif ctype == datetime:
+            return self._datetime_column(name, seed, nrows, **params)
+        else:
+            logger.error(f"Unsuported datatype {ctype} requested")
+            raise ValueError(f"Unsupported datatype {ctype} requested")
+        return _Column(name, seed, kernel, _CTYPE_DTYPES[ctype])
+
+    def _nullable(self, plan: List[_Column], nrows: int, nullratio: float = 0,
+                  exact_nulls: bool = False) -> List[_Column]:
+        """Nullable versions of column plans, each with a null mask of its own, see `_generate_nulls`
+
+        Float, datetime and categorical columns keep their dtype and mark nulls with NaN, NaT and
+        the -1 code. Integer, bool and string columns become pandas "Int64" (or narrower integer),
+        "boolean" and "string" masked arrays, and bytes columns object columns holding None.
+
+        Args:
+            plan (List[_Column]): Column plans
+            nrows (int): Rows of the whole frame
+            nullratio (float, optional): Ratio of null values per column. Defaults to 0.
+            exact_nulls (bool, optional): Null exactly round(nullratio * nrows) rows of every column
+                instead of drawing each row independently. Defaults to False.
+
+        Returns:
+            List[_Column]:
+        """
+        assert 0 <= nullratio <= 1, "nullratio must be in [0, 1]"
+        if not nullratio:
+            return plan
+        return [self._nullable_column(column, nullratio, total=nrows if exact_nulls else None) for column in plan]
+
+    def _nullable_column(self, column: _Column, nullratio: float, total: int = None, masked: bool = False,
+                         string: bool = None) -> _Column:
+        """Nullable version of a column plan, see `_nullable`
+
+        Args:
+            column (_Column): Column plan
+            nullratio (float): Ratio of null values
+            total (int, optional): Rows of the whole column, to null an exact count, see `_generate_nulls`.
+                Defaults to None.
+            masked (bool, optional): Give integer, bool and string columns their masked dtype even without
+                nulls. Defaults to False.
+            string (bool, optional): Whether an object column becomes a "string" masked array. Defaults to
+                None (if its raw values are ASCII bytes).
+
+        Returns:
+            _Column:
+        """
+        if not nullratio and not masked:
+            return column
+        nulls = partial(self._generate_nulls, nullratio=nullratio, total=total,
+                        key=_permutation_key(_null_seed(column.seed)))
+        kind = np.dtype(column.dtype).kind
+        if isinstance(column.wrap, blocks.Categorize) or kind in "fM":
+            na = np.datetime64("NaT") if kind == "M" else -1 if column.wrap else np.nan
+            kernel = partial(_with_nulls, kernel=column.kernel, nulls=nulls, na=na)
+            return _Column(column.name, column.seed, kernel, column.dtype, column.wrap)
+
+        if string is None:
+            string = column.raw is not None and column.raw.wrap is blocks.decode_ascii
+        mask = _Column(column.name, column.seed, nulls, np.bool_)
+        if kind in "iu":
+            wrap = blocks.Nullable("integer")
+        elif kind == "b":
+            wrap = blocks.Nullable("boolean")
+        elif string:
+            wrap = blocks.Nullable("string")
+        else:
+            wrap = None
+        return _Column(column.name, column.seed, column.kernel, column.dtype, wrap, column.raw, mask)
+
+    def _plan_dataframe(self, nrows: int, ctypes: List[type], columns: List[str] = None, nullratio: float = 0,
+                        exact_nulls: bool = False, dtype: List[DTypeLike] = None, downcast: bool = False,
+                        call: np.random.SeedSequence = None) -> List[_Column]:
+        """Column plans of a `get_dataframe`/`iter_dataframe` frame of `nrows` rows in total, see `_column_seeds`"""
+        assert ctypes is not None, "provide columns' data types"
+        if columns is not None:
+            assert len(columns) == len(ctypes), "provide all or No Columns names"
+        assert dtype is None or isinstance(dtype, (list, tuple)), "provide dtype as a list, one entry per column"
+
+        columns = self._get_column_names(ctypes, columns)
+        plan = [self._default_column(name, seed, _ctype, nrows, dtype=_dtype, downcast=downcast)
+                for name, seed, _ctype, _dtype in zip(columns, self._column_seeds(columns, call), ctypes,
+                                                      _column_dtypes(dtype, len(ctypes)))]
+        return self._nullable(plan, nrows, nullratio, exact_nulls)
+
+    def get_dataframe(self, nrows: int, ctypes: List[type], columns: List[str] = None,
+                      memmap_dir: str = None, nullratio: float = 0, exact_nulls: bool = False,
+                      dtype: List[DTypeLike] = None, downcast: bool = False) -> pd.DataFrame:
         """Generate random data frame of shape 'nrows x len(ctypes)'
 
         Args:
             nrows (int): Number of rows
             ctypes (List[type]): Column types of the dataframe
             columns (List[str], optional): Column names of the dataframe. Defaults to None.
+            memmap_dir (str, optional): Generate the columns into `.npy` memmap files in this directory,
+                for frames larger than RAM; see `randen.open_memmap` to reopen them. Defaults to None.
+            nullratio (float, optional): Ratio of null values per column, see `_nullable`. Defaults to 0.
+            exact_nulls (bool, optional): Null exactly round(nullratio * nrows) rows per column instead of a
+                Bernoulli(nullratio) draw per row. Defaults to False.
+            dtype (List[DTypeLike], optional): numpy dtype of each column, None keeping the default:
+                int8 ... uint64 for int columns, whose range is clipped to the dtype, float16, float32 or
+                float64 for float columns. Defaults to None.
+            downcast (bool, optional): Give int columns without a dtype the narrowest integer dtype
+                holding their range, e.g. int32 for the default [-100000, 100000). Defaults to False.
 
         Raises:
-            ValueError: If requested Column datatype is unsupported
+            ValueError: If requested Column datatype is unsupported, or a dtype does not fit its column
 
         Returns:
             pd.DataFrame:
         """        
+        plan = self._plan_dataframe(nrows, ctypes, columns, nullratio=nullratio, exact_nulls=exact_nulls,
+                                    dtype=dtype, downcast=downcast)
+        return self._cached_dataframe(nrows, plan, memmap_dir=memmap_dir)
 
-        assert ctypes is not None, "provide columns' data types"
-        if columns is not None:
-            assert len(columns) == len(ctypes), "provide all or No Columns names"
+    def iter_dataframe(self, nrows: int, ctypes: List[type], chunksize: int, columns: List[str] = None,
+                       nullratio: float = 0, exact_nulls: bool = False, dtype: List[DTypeLike] = None,
+                       downcast: bool = False) -> Iterator[pd.DataFrame]:
+        """Generate the `get_dataframe` frame of shape 'nrows x len(ctypes)' as chunks of `chunksize` rows
 
-        columns = self._get_column_names(ctypes, columns)
-        self._numrows = nrows
-        out_df = pd.DataFrame()
-        for i, _ctype in enumerate(ctypes):
-            _col_name = columns[i]
-            if _ctype == int:
-                _data_list = self._generate_ints()
-            elif _ctype == float:
-                _data_list = self._generate_floats()
-            elif _ctype == bool:
-                _data_list = self._generate_bools()
-            elif _ctype == str:
-                _data_list = self._generate_strings()
-            elif _ctype == bytes:
-                _data_list = self._generate_chars()
-            elif _ctype == datetime:
-                _data_list = self._generate_dates()
-            else:
-                logger.error(f"Unsuported datatype {_ctype} requested")
-                raise ValueError(f"Unsupported datatype {_ctype} requested")
+        Only one chunk is held in memory at a time. The chunks are the consecutive row ranges of one
+        logical frame: datetime ranges continue across them, unique columns stay unique, exact null
+        counts hold over the whole frame, the index runs on, and a seeded generator yields, chunk for
+        chunk, the rows `get_dataframe` returns.
+        Multiples of 65536 rows make the cheapest chunk sizes, as rows are drawn in blocks of that size.
 
-            out_df[_col_name] = _data_list
+        Args:
+            nrows (int): Total number of rows
+            ctypes (List[type]): Column types of the dataframe
+            chunksize (int): Number of rows per chunk, the last chunk may be shorter
+            columns (List[str], optional): Column names of the dataframe. Defaults to None.
+            nullratio (float, optional): Ratio of null values per column. Defaults to 0.
+            exact_nulls (bool, optional): Null exactly round(nullratio * nrows) rows per column. Defaults to False.
+            dtype (List[DTypeLike], optional): numpy dtype of each int or float column. Defaults to None.
+            downcast (bool, optional): Narrowest integer dtype for int columns without a dtype. Defaults to False.
 
-        return out_df
+        Raises:
+            ValueError: If requested Column datatype is unsupported
+
+        Returns:
+            Iterator[pd.DataFrame]: chunks of the dataframe
+        """
+        plan = self._plan_dataframe(nrows, ctypes, columns, nullratio=nullratio, exact_nulls=exact_nulls,
+                                    dtype=dtype, downcast=downcast)
+        return self._iter_chunks(nrows, plan, chunksize)
+
+    def get_partition(self, nrows: int, ctypes: List[type], partition: int, npartitions: int,
+                      columns: List[str] = None, memmap_dir: str = None, nullratio: float = 0,
+                      exact_nulls: bool = False, dtype: List[DTypeLike] = None, downcast: bool = False) -> pd.DataFrame:
+        """Generate partition `partition` of `npartitions` of a frame of shape 'nrows x len(ctypes)'
+
+        Nodes building one large dataset each generate their partition, with generators of the same
+        seed and no coordination. The partitions are consecutive row ranges, indexed by their rows in
+        the frame, and concatenate, byte for byte, into the frame the first `get_dataframe` call of a
+        generator of that seed returns: every row range draws from the streams of its stream blocks,
+        unique keys are a permutation of the whole frame, datetime ranges continue across partitions.
+        The generator seed must be given, as fresh OS entropy differs from node to node, and every
+        `get_partition` call of a generator, unlike the `get_dataframe` calls, draws from the same child
+        of the seed.
+
+        Usage:
+        -----
+            dfg = DataFrameGenerator(seed=42, workers=8)
+            part = dfg.get_partition(10 ** 10, [int, str, datetime], partition=k, npartitions=1000)
+
+        Args:
+            nrows (int): Total number of rows of the frame
+            ctypes (List[type]): Column types of the dataframe
+            partition (int): Index of the partition, in [0, npartitions)
+            npartitions (int): Number of partitions, which split whole blocks of 65536 rows when there
+                are enough rows
+            columns (List[str], optional): Column names of the dataframe. Defaults to None.
+            memmap_dir (str, optional): Generate the columns into `.npy` memmap files in this directory.
+                Defaults to None.
+            nullratio (float, optional): Ratio of null values per column. Defaults to 0.
+            exact_nulls (bool, optional): Null exactly round(nullratio * nrows) rows per column, over the whole
+                frame. Defaults to False.
+            dtype (List[DTypeLike], optional): numpy dtype of each int or float column. Defaults to None.
+            downcast (bool, optional): Narrowest integer dtype for int columns without a dtype. Defaults to False.
+
+        Raises:
+            ValueError: If the generator has no seed, or requested Column datatype is unsupported
+
+        Returns:
+            pd.DataFrame: the partition's rows of the frame, about nrows / npartitions of them, indexed
+                by row number in the frame
+        """
+        if not self._seeded:
+            logger.error("Partitions requested from a generator without a seed")
+            raise ValueError("Partitions requested from a generator without a seed, they would not stitch together")
+        start, stop = _partition_bounds(nrows, partition, npartitions)
+        plan = self._plan_dataframe(nrows, ctypes, columns, nullratio=nullratio, exact_nulls=exact_nulls,
+                                    dtype=dtype, downcast=downcast, call=self._first_call_seed())
+        logger.info(f"Generating rows {start} to {stop} of a {nrows}x{len(ctypes)} dataframe")
+        return self._build_dataframe(stop - start, plan, start=start, memmap_dir=memmap_dir)
+
+    def get_dataframe_like(self, nrows: int, sample: Union[pd.DataFrame, list],
+                           memmap_dir: str = None) -> pd.DataFrame:
+        """Generate a frame of `nrows` rows looking like a sample frame, e.g. 1000 times larger
+
+        Columns keep the sample's names and dtypes, null ratios, ranges and distributions, and the
+        value frequencies of columns with few distinct values, see `randen.fit`. The sample is
+        reduced to a compact summary first; pass `randen.fit.summarize(sample)` instead of the
+        sample to summarize it once and drop it.
+
+        Args:
+            nrows (int): Number of rows
+            sample (Union[pd.DataFrame, list]): Sample frame, or its `randen.fit.summarize` summaries
+            memmap_dir (str, optional): Generate the columns into `.npy` memmap files in this directory.
+                Defaults to None.
+
+        Raises:
+            ValueError: If a column type of the sample is unsupported
+
+        Returns:
+            pd.DataFrame:
+        """
+        from randen.fit import plan_like
+        return self._build_dataframe(nrows, plan_like(self, sample, nrows), memmap_dir=memmap_dir)
+
+    def iter_dataframe_like(self, nrows: int, sample: Union[pd.DataFrame, list],
+                            chunksize: int) -> Iterator[pd.DataFrame]:
+        """Generate the `get_dataframe_like` frame as chunks of `chunksize` rows, see `iter_dataframe`
+
+        Args:
+            nrows (int): Total number of rows
+            sample (Union[pd.DataFrame, list]): Sample frame, or its `randen.fit.summarize` summaries
+            chunksize (int): Number of rows per chunk, the last chunk may be shorter
+
+        Raises:
+            ValueError: If a column type of the sample is unsupported
+
+        Returns:
+            Iterator[pd.DataFrame]: chunks of the dataframe
+        """
+        from randen.fit import plan_like
+        return self._iter_chunks(nrows, plan_like(self, sample, nrows), chunksize)
+
+    def compile(self, ctypes: List[type], columns: List[str] = None, params: Dict[str, dict] = None,
+                nullratio: float = 0, exact_nulls: bool = False, dtype: List[DTypeLike] = None,
+                downcast: bool = False) -> Schema:
+        """Compile a schema once, to generate its frames repeatedly without planning them again, see `Schema`
+
+        Args:
+            ctypes (List[type]): Column types of the dataframe
+            columns (List[str], optional): Column names of the dataframe. Defaults to None.
+            params (Dict[str, dict], optional): Generation parameters by column name, see `_default_column`,
+                plus "nullratio" and "dtype" overriding the frame's. Defaults to None.
+            nullratio (float, optional): Ratio of null values per column. Defaults to 0.
+            exact_nulls (bool, optional): Null exactly round(nullratio * nrows) rows per column. Defaults to False.
+            dtype (List[DTypeLike], optional): numpy dtype of each int or float column. Defaults to None.
+            downcast (bool, optional): Narrowest integer dtype for int columns without a dtype. Defaults to False.
+
+        Raises:
+            ValueError: If requested Column datatype or a parameter is unsupported
+
+        Returns:
+            Schema:
+        """
+        from randen.schema import Schema
+        return Schema(self, ctypes, columns, params=params, nullratio=nullratio, exact_nulls=exact_nulls,
+                      dtype=dtype, downcast=downcast)
+
+    def stream(self, ctypes: List[type] = (), columns: List[str] = None, id_column: str = "id",
+               time_column: str = "ts", key_column: str = "key", start: datetime = None, event_rate: float = 1000.0,
+               nkeys: int = 1000, zipf: float = 1.0, drift: int = None, nullratio: float = 0,
+               state: dict = None) -> Stream:
+        """Stateful stream of batches continuing one another, for simulated streaming ingestion, see `Stream`
+
+        Columns are an id counting up from 1, an event time that only increases, a Zipf skewed key
+        whose hot keys drift every `drift` rows, then the `ctypes` columns. A column name of None
+        drops that column.
+
+        Args:
+            ctypes (List[type], optional): Types of the data columns, as in `get_dataframe`, but datetime.
+                Defaults to ().
+            columns (List[str], optional): Names of the data columns. Defaults to None.
+            id_column (str, optional): Name of the id column. Defaults to "id".
+            time_column (str, optional): Name of the event time column. Defaults to "ts".
+            key_column (str, optional): Name of the key column. Defaults to "key".
+            start (datetime, optional): Event time of the first row. Defaults to None (now).
+            event_rate (float, optional): Events per second of event time. Defaults to 1000.
+            nkeys (int, optional): Number of distinct keys. Defaults to 1000.
+            zipf (float, optional): Zipf exponent of the key popularity. Defaults to 1.0.
+            drift (int, optional): Rows after which the hot keys shift by one key. Defaults to None (no drift).
+            nullratio (float, optional): Ratio of null values per data column. Defaults to 0.
+            state (dict, optional): `Stream.state` checkpoint to resume from. Defaults to None.
+
+        Raises:
+            ValueError: If requested Column datatype is unsupported
+
+        Returns:
+            Stream:
+        """
+        from randen.stream import Stream
+        return Stream(self, ctypes, columns, id_column=id_column, time_column=time_column, key_column=key_column,
+                      start=start, event_rate=event_rate, nkeys=nkeys, zipf=zipf, drift=drift, nullratio=nullratio,
+                      state=state)
+
+    def _iter_chunks(self, nrows: int, plan: List[_Column], chunksize: int, output: str = None) -> Iterator:
+        """Chunks of `chunksize` rows of the frame planned by `plan`, see `_build_dataframe`"""
+        assert chunksize > 0, "provide a positive chunksize"
+        return (self._build_dataframe(min(chunksize, nrows - start), plan, start=start, output=output)
+                for start in range(0, nrows, chunksize))
+
+    def write_parquet(self, path: str, nrows: int, ctypes: List[type], columns: List[str] = None,
+                      row_group_size: int = 1 << 20, compression: str = "snappy", background: bool = False,
+                      nullratio: float = 0) -> None:
+        """Generate the `get_dataframe` frame straight into a Parquet file, one row group at a time
+
+        Memory stays bounded by one row group (two to four with `background`) whatever `nrows` is.
+        Row groups are generated as Arrow tables, so strings never become python objects, and carry
+        the pandas metadata of the frame, so that pandas reads back the `get_dataframe` dtypes.
+
+        Args:
+            path (str): Output file path
+            nrows (int): Number of rows
+            ctypes (List[type]): Column types of the dataframe
+            columns (List[str], optional): Column names of the dataframe. Defaults to None.
+            row_group_size (int, optional): Rows per row group. Defaults to 1048576.
+            compression (str, optional): Parquet compression codec. Defaults to "snappy".
+            background (bool, optional): Compress and write from a background thread while the next
+                row group is generated. Defaults to False.
+            nullratio (float, optional): Ratio of null values per column. Defaults to 0.
+        """
+        logger.info(f"Writing {nrows}x{len(ctypes)} dataframe to {path}")
+        plan = self._plan_dataframe(nrows, ctypes, columns, nullratio=nullratio)
+        chunks = self._iter_chunks(nrows, plan, row_group_size, output="arrow")
+        sinks.write_parquet(chunks, path, compression=compression, background=background,
+                            like=self._build_dataframe(0, plan, output="pandas"))
+
+    def write_feather(self, path: str, nrows: int, ctypes: List[type], columns: List[str] = None,
+                      chunksize: int = 1 << 20, compression: str = "lz4", background: bool = False,
+                      nullratio: float = 0) -> None:
+        """Generate the `get_dataframe` frame straight into a Feather V2 (Arrow IPC) file, one record batch at a time
+
+        Args:
+            path (str): Output file path
+            nrows (int): Number of rows
+            ctypes (List[type]): Column types of the dataframe
+            columns (List[str], optional): Column names of the dataframe. Defaults to None.
+            chunksize (int, optional): Rows per record batch. Defaults to 1048576.
+            compression (str, optional): "lz4", "zstd" or None. Defaults to "lz4".
+            background (bool, optional): Compress and write from a background thread. Defaults to False.
+            nullratio (float, optional): Ratio of null values per column. Defaults to 0.
+        """
+        logger.info(f"Writing {nrows}x{len(ctypes)} dataframe to {path}")
+        plan = self._plan_dataframe(nrows, ctypes, columns, nullratio=nullratio)
+        chunks = self._iter_chunks(nrows, plan, chunksize, output="arrow")
+        sinks.write_feather(chunks, path, compression=compression, background=background,
+                            like=self._build_dataframe(0, plan, output="pandas"))
+
+    def write_csv(self, path: str, nrows: int, ctypes: List[type], columns: List[str] = None,
+                  chunksize: int = 1 << 20, background: bool = False, nullratio: float = 0, **to_csv_kwargs) -> None:
+        """Generate the `get_dataframe` frame straight into a CSV file, one chunk at a time
+
+        Args:
+            path (str): Output file path
+            nrows (int): Number of rows
+            ctypes (List[type]): Column types of the dataframe
+            columns (List[str], optional): Column names of the dataframe. Defaults to None.
+            chunksize (int, optional): Rows per chunk. Defaults to 1048576.
+            background (bool, optional): Format and write from a background thread. Defaults to False.
+            nullratio (float, optional): Ratio of null values per column. Defaults to 0.
+            **to_csv_kwargs: Passed on to `pd.DataFrame.to_csv`
+        """
+        logger.info(f"Writing {nrows}x{len(ctypes)} dataframe to {path}")
+        plan = self._plan_dataframe(nrows, ctypes, columns, nullratio=nullratio)
+        chunks = self._iter_chunks(nrows, plan, chunksize, output="pandas")
+        sinks.write_csv(chunks, path, background=background, **to_csv_kwargs)
+
+    def write_sql(self, connection, table: str, nrows: int, ctypes: List[type], columns: List[str] = None,
+                  chunksize: int = 1 << 16, if_exists: str = "fail", indexes: List[Union[str, List[str]]] = None,
+                  nullratio: float = 0) -> None:
+        """Generate the `get_dataframe` frame straight into a database table, one chunk at a time
+
+        Chunks are inserted with batched `executemany` calls, one transaction per chunk, into a table
+        created from the frame's dtypes; see `sinks.write_sql`. Far faster than `pd.DataFrame.to_sql`
+        for SQLite, see benchmark/benchmark_sql.py.
+
+        Args:
+            connection: DB-API 2.0 connection, or the path of a SQLite database to connect to
+            table (str): Table name
+            nrows (int): Number of rows
+            ctypes (List[type]): Column types of the dataframe
+            columns (List[str], optional): Column names of the dataframe. Defaults to None.
+            chunksize (int, optional): Rows per chunk and transaction. Defaults to 65536.
+            if_exists (str, optional): "fail", "replace" or "append" to an existing table. Defaults to "fail".
+            indexes (List[Union[str, List[str]]], optional): Columns, or lists of columns, to index after
+                loading. Defaults to None.
+            nullratio (float, optional): Ratio of null values per column. Defaults to 0.
+
+        Raises:
+            ValueError: If requested if_exists is unsupported
+        """
+        logger.info(f"Writing {nrows}x{len(ctypes)} dataframe to table {table}")
+        plan = self._plan_dataframe(nrows, ctypes, columns, nullratio=nullratio)
+        chunks = self._iter_chunks(nrows, plan, chunksize, output="pandas")
+        like = self._build_dataframe(0, plan, output="pandas")
+        if not isinstance(connection, str):
+            sinks.write_sql(chunks, connection, table, like, if_exists=if_exists, indexes=indexes)
+            return
+        import sqlite3
+        database = sqlite3.connect(connection)
+        try:
+            sinks.write_sql(chunks, database, table, like, if_exists=if_exists, indexes=indexes)
+        finally:
+            database.close()
 
     def get_integer_dataframe(self, nrows: int, ncols: int, nullratio=0, columns: List[str] = None,
-                              minval: int = -100000, maxval: int = 100000) -> pd.DataFrame:
+                              minval: int = None, maxval: int = None, unique: bool = False,
+                              memmap_dir: str = None, exact_nulls: bool = False,
+                              dtype: Union[DTypeLike, List[DTypeLike]] = None, downcast: bool = False) -> pd.DataFrame:
         """Generate a dataframe of ONLY integer datatype values
 
         Args:
             nrows (int): Number of rows
             ncols (int): Number of columns of type int
-            nullratio (int, optional): [description]. Defaults to 0.
+            nullratio (float, optional): Ratio of null values per column, see `_nullable`. Defaults to 0.
             columns (List[str], optional): Column names of the dataframe. Defaults to None.
-            minval (int, optional): Minimum value of the integers. Defaults to -100000.
-            maxval (int, optional): Maximum value of the integers. Defaults to 100000.
+            minval (int, optional): Minimum value of the integers. Defaults to None (-100000, clipped to
+                what an explicit dtype holds).
+            maxval (int, optional): Maximum value of the integers (exclusive). Defaults to None (100000,
+                clipped to what an explicit dtype holds).
+            unique (bool, optional): Generate key columns without repeated values. Defaults to False.
+            memmap_dir (str, optional): Generate the columns into memmap files in this directory. Defaults to None.
+            exact_nulls (bool, optional): Null exactly round(nullratio * nrows) rows per column instead of a
+                Bernoulli(nullratio) draw per row. Defaults to False.
+            dtype (Union[DTypeLike, List[DTypeLike]], optional): Integer dtype (int8 ... uint64) of all
+                columns, or a list of one dtype per column. Defaults to None (int64).
+            downcast (bool, optional): Give columns without a dtype the narrowest integer dtype holding
+                [minval, maxval), values are drawn straight at that width. Defaults to False.
+
+        Raises:
+            ValueError: If a dtype does not hold [minval, maxval)
 
         Returns:
             pd.DataFrame:
@@ -191,26 +1748,38 @@ class DataFrameGenerator:
             assert len(columns) == ncols, "provide all or No Columns names"
 
         logger.info(f"Generating {nrows}x{ncols} all integer dataframe")
-        self._numrows = nrows
-
-        out_df = pd.DataFrame()
-        for i in range(ncols):
-            _col_name = columns[i] if columns is not None else f"Integer{i}"
-            out_df[_col_name] = self._generate_ints(_min=minval, _max=maxval)
 
-        return out_df
+        columns = columns if columns is not None else [f"Integer{i}" for i in range(ncols)]
+        ranges = [_int_range(minval, maxval, _dtype) for _dtype in _column_dtypes(dtype, ncols)]
+        dtypes = [_int_dtype(_min, _max, _dtype, downcast)
+                  for (_min, _max), _dtype in zip(ranges, _column_dtypes(dtype, ncols))]
+        plan = [_Column(name, seed, partial(self._generate_ints, _min=_min, _max=_max, unique=unique,
+                                            key=_permutation_key(seed), dtype=_dtype), _dtype)
+                for name, seed, _dtype, (_min, _max) in zip(columns, self._column_seeds(columns), dtypes, ranges)]
+        plan = self._nullable(plan, nrows, nullratio, exact_nulls)
+        return self._cached_dataframe(nrows, plan, memmap_dir=memmap_dir)
 
     def get_float_dataframe(self, nrows: int, ncols: int, nullratio: float = 0, columns: List[str] = None,
-                            minval: float = -1.0, maxval: float = 1.0) -> pd.DataFrame:
+                            minval: float = -1.0, maxval: float = 1.0,
+                            memmap_dir: str = None, exact_nulls: bool = False,
+                            dtype: Union[DTypeLike, List[DTypeLike]] = None) -> pd.DataFrame:
         """Generate a dataframe of ONLY floating point datatype values
 
         Args:
             nrows (int): Number of rows
             ncols (int): Number of columns of type float
-            nullratio (float, optional): [description]. Defaults to 0.
+            nullratio (float, optional): Ratio of null values per column, see `_nullable`. Defaults to 0.
             columns (List[str], optional): Column names of the dataframe. Defaults to None.
             minval (float, optional): Minimum value of the floats. Defaults to -1.0.
             maxval (float, optional): Maximum value of the floats. Defaults to 1.0.
+            memmap_dir (str, optional): Generate the columns into memmap files in this directory. Defaults to None.
+            exact_nulls (bool, optional): Null exactly round(nullratio * nrows) rows per column instead of a
+                Bernoulli(nullratio) draw per row. Defaults to False.
+            dtype (Union[DTypeLike, List[DTypeLike]], optional): float16, float32 or float64 dtype of all
+                columns, or a list of one dtype per column. Defaults to None (float64).
+
+        Raises:
+            ValueError: If a dtype is not a supported float dtype
 
         Returns:
             pd.DataFrame:
@@ -219,23 +1788,26 @@ class DataFrameGenerator:
             assert len(columns) == ncols, "Provide all or No Columns names"
 
         logger.info(f"Generating {nrows}x{ncols} all float dataframe")
-        self._numrows = nrows
 
-        out_df = pd.DataFrame()
-        for i in range(ncols):
-            _col_name = columns[i] if columns is not None else f"Float{i}"
-            out_df[_col_name] = self._generate_floats(_min=minval, _max=maxval)
+        columns = columns if columns is not None else [f"Float{i}" for i in range(ncols)]
+        dtypes = [_float_dtype(_dtype) for _dtype in _column_dtypes(dtype, ncols)]
+        plan = [_Column(name, seed, partial(self._generate_floats, _min=minval, _max=maxval, dtype=_dtype), _dtype)
+                for name, seed, _dtype in zip(columns, self._column_seeds(columns), dtypes)]
+        plan = self._nullable(plan, nrows, nullratio, exact_nulls)
+        return self._cached_dataframe(nrows, plan, memmap_dir=memmap_dir)
 
-        return out_df
-
-    def get_boolean_dataframe(self, nrows: int, ncols: int, nullratio=0, columns=None) -> pd.DataFrame:
+    def get_boolean_dataframe(self, nrows: int, ncols: int, nullratio=0, columns=None,
+                              memmap_dir: str = None, exact_nulls: bool = False) -> pd.DataFrame:
         """Generate a dataframe of ONLY boolean datatype values
 
         Args:
             nrows (int): Number of rows
             ncols (int): Number of columns
-            nullratio (int, optional): [description]. Defaults to 0.
+            nullratio (float, optional): Ratio of null values per column, see `_nullable`. Defaults to 0.
             columns (List[str], optional): Column names of the dataframe. Defaults to None.
+            memmap_dir (str, optional): Generate the columns into memmap files in this directory. Defaults to None.
+            exact_nulls (bool, optional): Null exactly round(nullratio * nrows) rows per column instead of a
+                Bernoulli(nullratio) draw per row. Defaults to False.
 
         Returns:
             pd.DataFrame:
@@ -244,25 +1816,28 @@ class DataFrameGenerator:
             assert len(columns) == ncols, "Provide all or No Columns names"
 
         logger.info(f"Generating {nrows}x{ncols} all boolean dataframe")
-        self._numrows = nrows
-
-        out_df = pd.DataFrame()
-        for i in range(ncols):
-            _col_name = columns[i] if columns is not None else f"Bool{i}"
-            out_df[_col_name] = self._generate_bools()
 
-        return out_df
+        columns = columns if columns is not None else [f"Bool{i}" for i in range(ncols)]
+        plan = [_Column(name, seed, self._generate_bools, np.bool_)
+                for name, seed in zip(columns, self._column_seeds(columns))]
+        plan = self._nullable(plan, nrows, nullratio, exact_nulls)
+        return self._cached_dataframe(nrows, plan, memmap_dir=memmap_dir)
 
     def get_char_dataframe(self, nrows: int, ncols: int, nullratio: float = 0, columns: List[str] = None,
-                           lowercase: bool = True) -> pd.DataFrame:
+                           lowercase: bool = True, chartype: str = "str",
+                           memmap_dir: str = None, exact_nulls: bool = False) -> pd.DataFrame:
         """Generate a dataframe of ONLY character/byte datatype values
 
         Args:
             nrows (int): Number of rows
             ncols (int): Number of columns
-            nullratio (float, optional): [description]. Defaults to 0.
+            nullratio (float, optional): Ratio of null values per column, see `_nullable`. Defaults to 0.
             columns (List[str], optional): Column names of the dataframe. Defaults to None.
             lowercase (bool, optional): Characters lowercase or uppercase. Defaults to True.
+            chartype (str, optional): "str", "S1"(1-byte bytes) or "category" columns. Defaults to "str".
+            memmap_dir (str, optional): Generate the columns into memmap files in this directory. Defaults to None.
+            exact_nulls (bool, optional): Null exactly round(nullratio * nrows) rows per column instead of a
+                Bernoulli(nullratio) draw per row. Defaults to False.
 
         Returns:
             pd.DataFrame:
@@ -271,26 +1846,33 @@ class DataFrameGenerator:
             assert len(columns) == ncols, "Provide all or No Columns names"
 
         logger.info(f"Generating {nrows}x{ncols} all character dataframe")
-        self._numrows = nrows
 
-        out_df = pd.DataFrame()
-        for i in range(ncols):
-            _col_name = columns[i] if columns is not None else f"Char{i}"
-            out_df[_col_name] = self._generate_chars(lowercase=lowercase)
-
-        return out_df
+        columns = columns if columns is not None else [f"Char{i}" for i in range(ncols)]
+        plan = [self._char_column(name, seed, lowercase=lowercase, chartype=chartype)
+                for name, seed in zip(columns, self._column_seeds(columns))]
+        plan = self._nullable(plan, nrows, nullratio, exact_nulls)
+        return self._cached_dataframe(nrows, plan, memmap_dir=memmap_dir)
 
     def get_string_dataframe(self, nrows: int, ncols: int, nullratio: float = 0, columns: List[str] = None,
-                             minstrlen: int = 10, maxstrlen: int = 20) -> pd.DataFrame:
+                             minstrlen: int = 10, maxstrlen: int = 20, alphabet: str = ascii_letters + digits,
+                             secure: bool = False, unique: bool = False,
+                             memmap_dir: str = None, exact_nulls: bool = False) -> pd.DataFrame:
         """Generate a dataframe of ONLY string datatype values
 
         Args:
             nrows (int): Number of rows
             ncols (int): Number of columns
-            nullratio (float, optional): [description]. Defaults to 0.
+            nullratio (float, optional): Ratio of null values per column, see `_nullable`. Defaults to 0.
             columns (List[str], optional): Column names of the dataframe. Defaults to None.
             minstrlen (int, optional): Minimum string length. Defaults to 10.
-            maxstrlen (int, optional): Maximum string length. Defaults to 20.
+            maxstrlen (int, optional): Maximum string length (inclusive). Defaults to 20.
+            alphabet (str, optional): ASCII characters to build strings from. Defaults to letters + digits.
+            secure (bool, optional): Draw characters from `secrets` (CSPRNG) instead of numpy, such
+                columns are never reproducible from the seed. Defaults to False.
+            unique (bool, optional): Generate key columns without repeated values. Defaults to False.
+            memmap_dir (str, optional): Generate the columns into memmap files in this directory. Defaults to None.
+            exact_nulls (bool, optional): Null exactly round(nullratio * nrows) rows per column instead of a
+                Bernoulli(nullratio) draw per row. Defaults to False.
 
         Returns:
             pd.DataFrame:
@@ -299,26 +1881,45 @@ class DataFrameGenerator:
             assert len(columns) == ncols, "Provide all or No Columns names"
 
         logger.info(f"Generating {nrows}x{ncols} all string dataframe")
-        self._numrows = nrows
-
-        out_df = pd.DataFrame()
-        for i in range(ncols):
-            _col_name = columns[i] if columns is not None else f"Str{i}"
-            out_df[_col_name] = self._generate_strings(_min=minstrlen, _max=maxstrlen)
 
-        return out_df.astype(str)
+        columns = columns if columns is not None else [f"Str{i}" for i in range(ncols)]
+        plan = [self._string_column(name, seed, nrows, _min=minstrlen, _max=maxstrlen, alphabet=alphabet,
+                                    secure=secure, unique=unique)
+                for name, seed in zip(columns, self._column_seeds(columns))]
+        plan = self._nullable(plan, nrows, nullratio, exact_nulls)
+        return self._cached_dataframe(nrows, plan, memmap_dir=memmap_dir)
 
     def get_dates_dataframe(self, nrows: int, ncols: int, nullratio: float = 0, columns: List[str] = None,
-                            start: datetime = None, end: datetime = None) -> pd.DataFrame:
+                            start: datetime = None, end: datetime = None,
+                            memmap_dir: str = None, exact_nulls: bool = False, resolution: str = "ns",
+                            order: str = "unsorted", jitter: float = 10.0, tz: str = None,
+                            weekday_weights: List[float] = None, hour_weights: List[float] = None) -> pd.DataFrame:
         """Generate a dataframe of ONLY datetime datatype values
 
         Args:
             nrows (int): Number of rows
             ncols (int): Number of columns
-            nullratio (float, optional): [description]. Defaults to 0.
+            nullratio (float, optional): Ratio of null values per column, see `_nullable`. Defaults to 0.
             columns (List[str], optional): Column names of the dataframe. Defaults to None.
             start (datetime, optional): Starting datetime range. Defaults to None.
             end (datetime, optional): Ending datetime range. Defaults to None.
+            memmap_dir (str, optional): Generate the columns into memmap files in this directory. Defaults to None.
+            exact_nulls (bool, optional): Null exactly round(nullratio * nrows) rows per column instead of a
+                Bernoulli(nullratio) draw per row. Defaults to False.
+            resolution (str, optional): "s", "ms", "us" or "ns", the timestamps are truncated to it. Defaults to "ns".
+            order (str, optional): "unsorted" (independent random timestamps), "sorted" (non-decreasing),
+                "jitter" (sorted, each row displaced by up to `jitter` rows) or "range" (evenly spaced
+                `pd.date_range`, identical in all columns). Defaults to "unsorted".
+            jitter (float, optional): Maximum displacement of "jitter" rows, in rows. Defaults to 10.0.
+            tz (str, optional): Timezone of the columns, e.g. "Europe/Berlin"; naive start/end are taken in
+                it. Defaults to None (naive, or the timezone of start).
+            weekday_weights (List[float], optional): Relative frequency of Monday ... Sunday, e.g.
+                [1] * 5 + [0.2] * 2. Defaults to None (uniform).
+            hour_weights (List[float], optional): Relative frequency of the hours 0 ... 23 (local time),
+                e.g. [0.1] * 9 + [1] * 8 + [0.1] * 7 for business hours. Defaults to None (uniform).
+
+        Raises:
+            ValueError: If requested resolution or order is unsupported
 
         Returns:
             pd.DataFrame:
@@ -327,14 +1928,58 @@ class DataFrameGenerator:
             assert len(columns) == ncols, "Provide all or No Columns names"
 
         logger.info(f"Generating {nrows}x{ncols} all dates dataframe")
-        self._numrows = nrows
 
-        out_df = pd.DataFrame()
-        for i in range(ncols):
-            _col_name = columns[i] if columns is not None else f"Date{i}"
-            out_df[_col_name] = self._generate_dates(start=start, end=end)
+        columns = columns if columns is not None else [f"Date{i}" for i in range(ncols)]
+        plan = [self._datetime_column(name, seed, nrows, start=start, end=end, resolution=resolution, order=order,
+                                      jitter=jitter, tz=tz, weekday_weights=weekday_weights, hour_weights=hour_weights)
+                for name, seed in zip(columns, self._column_seeds(columns))]
+        plan = self._nullable(plan, nrows, nullratio, exact_nulls)
+        return self._cached_dataframe(nrows, plan, memmap_dir=memmap_dir)
+
+    def get_categorical_dataframe(self, nrows: int, ncols: int, nullratio: float = 0, columns: List[str] = None,
+                                  categories: List[str] = None, ncategories: int = 100,
+                                  weights: Union[str, List[float]] = None, minstrlen: int = 10, maxstrlen: int = 20,
+                                  alphabet: str = ascii_letters + digits, memmap_dir: str = None,
+                                  exact_nulls: bool = False) -> pd.DataFrame:
+        """Generate a dataframe of ONLY categorical(low cardinality string) datatype values
+
+        Each column draws integer codes over a vocabulary built once, so the frame costs the codes
+        (1-4 bytes per row) plus one python string per category, and generates at numeric speed.
+
+        Args:
+            nrows (int): Number of rows
+            ncols (int): Number of columns
+            nullratio (float, optional): Ratio of null values per column, see `_nullable`. Defaults to 0.
+            columns (List[str], optional): Column names of the dataframe. Defaults to None.
+            categories (List[str], optional): Vocabulary shared by all columns. Defaults to None (a
+                vocabulary of distinct random strings generated for each column).
+            ncategories (int, optional): Size of the generated vocabularies. Defaults to 100.
+            weights (Union[str, List[float]], optional): Relative frequency of each category, or "zipf"
+                for frequencies falling as 1/rank. Defaults to None (uniform).
+            minstrlen (int, optional): Minimum length of the generated categories. Defaults to 10.
+            maxstrlen (int, optional): Maximum length of the generated categories (inclusive). Defaults to 20.
+            alphabet (str, optional): ASCII characters of the generated categories. Defaults to letters + digits.
+            memmap_dir (str, optional): Generate the columns into memmap files in this directory. Defaults to None.
+            exact_nulls (bool, optional): Null exactly round(nullratio * nrows) rows per column instead of a
+                Bernoulli(nullratio) draw per row. Defaults to False.
+
+        Raises:
+            ValueError: If requested weights are unsupported, or the vocabulary cannot be that large
+
+        Returns:
+            pd.DataFrame:
+        """
+        if columns is not None:
+            assert len(columns) == ncols, "Provide all or No Columns names"
+
+        logger.info(f"Generating {nrows}x{ncols} all categorical dataframe")
 
-        return out_df
+        columns = columns if columns is not None else [f"Category{i}" for i in range(ncols)]
+        plan = [self._categorical_column(name, seed, categories=categories, ncategories=ncategories, weights=weights,
+                                         _min=minstrlen, _max=maxstrlen, alphabet=alphabet)
+                for name, seed in zip(columns, self._column_seeds(columns))]
+        plan = self._nullable(plan, nrows, nullratio, exact_nulls)
+        return self._cached_dataframe(nrows, plan, memmap_dir=memmap_dir)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,266 @@
+"""
+Randen: Random DataFrame Generator
+    Fit-from-sample: a small sample frame summarized into compact per column statistics, from which
+    frames of any size that look like it are generated
+
+    Numeric and datetime columns keep a quantile sketch, sampled by inverting its piecewise linear
+    CDF, or their value frequencies when they hold few distinct values; integer key columns with
+    no repeated value stay unique. Strings keep their value frequencies, when they repeat, or a
+    length histogram and character frequencies, categoricals the frequency of each category, and
+    every column its null ratio. Discrete frequencies are sampled through alias tables, so each row
+    costs two vectorized draws whatever the number of values. The generators are ordinary column
+    kernels: frames are generated in stream blocks, in parallel and in chunks, as any other frame.
+"""
+
+from __future__ import annotations
+
+__appname__ = "randen"
+
+import logging
+from functools import partial
+from typing import List, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from randen import blocks
+from randen.data_generator import DataFrameGenerator, _Column, _code_dtype, _int_dtype, _permutation_key
+from randen.lazy import LazyModule
+
+pd = LazyModule("pandas")
+
+logger = logging.getLogger(__appname__)
+
+# Columns with at most this many distinct values keep their value frequencies rather than a quantile sketch
+_DISCRETE_VALUES = 64
+
+
+class ColumnSummary(NamedTuple):
+    """Compact summary of one sample column, see `summarize`
+
+    `kind` is "quantiles" (`values` is a quantile sketch, the sorted sample at evenly spaced ranks),
+    "discrete" (`values` and their `weights`), "unique" (`values` holds the minimum and maximum),
+    "text" (`weights` of string lengths 0, 1, ... and `values` the ASCII codes of the characters,
+    of frequencies `char_weights`) or "category" (`values` the categories, `weights` their counts).
+    """
+    name: object
+    dtype: str
+    kind: str
+    nullratio: float
+    values: np.ndarray
+    weights: np.ndarray = None
+    char_weights: np.ndarray = None
+
+
+def _alias_table(weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Walker alias table of the discrete distribution of `weights`, see `_alias_draw`
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: acceptance probability and alias of each outcome
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    n = len(weights)
+    scaled = weights * (n / weights.sum())
+    prob, alias = np.ones(n), np.arange(n)
+    small = [i for i in range(n) if scaled[i] < 1]
+    large = [i for i in range(n) if scaled[i] >= 1]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        prob[less], alias[less] = scaled[less], more
+        scaled[more] -= 1 - scaled[less]
+        (small if scaled[more] < 1 else large).append(more)
+    return prob, alias
+
+
+def _alias_draw(seed: np.random.SeedSequence, prob: np.ndarray, alias: np.ndarray, size: int) -> np.ndarray:
+    """`size` outcomes of an alias table: a uniform outcome, kept with its acceptance probability or else its alias"""
+    # separate streams keep the first rows of a block identical however many rows are drawn
+    outcomes_rng, accept_rng = (np.random.default_rng(s) for s in seed.spawn(2))
+    outcomes = outcomes_rng.integers(0, len(prob), size=size)
+    return np.where(accept_rng.random(size) < prob[outcomes], outcomes, alias[outcomes])
+
+
+def _generate_discrete(seed: np.random.SeedSequence, offset: int, nrows: int, values: np.ndarray,
+                       prob: np.ndarray, alias: np.ndarray) -> np.ndarray:
+    """Discrete kernel: `values` drawn after their frequencies"""
+    return values[_alias_draw(seed, prob, alias, nrows)]
+
+
+def _generate_quantiles(seed: np.random.SeedSequence, offset: int, nrows: int, quantiles: np.ndarray,
+                        dtype: str) -> np.ndarray:
+    """Inverse CDF kernel: uniform draws mapped through the piecewise linear CDF of a quantile sketch
+
+    Integers and datetimes interpolate an offset from the quantile below them, so int64 and
+    nanosecond values keep their precision.
+    """
+    position = np.random.default_rng(seed).random(nrows) * (len(quantiles) - 1)
+    below = np.minimum(position.astype(np.intp), len(quantiles) - 2)
+    fraction = position - below
+    dtype = np.dtype(dtype)
+    if dtype.kind == "f":
+        lower = quantiles[below].astype(np.float64)
+        return (lower + (quantiles[below + 1] - lower) * fraction).astype(dtype)
+    steps = np.diff(quantiles.view(np.int64) if dtype.kind == "M" else quantiles).astype(np.float64)
+    values = quantiles[below] + np.rint(steps[below] * fraction).astype(np.int64)
+    return values.astype(dtype)
+
+
+def _generate_text(seed: np.random.SeedSequence, offset: int, nrows: int, lengths: tuple, chars: tuple,
+                   table: np.ndarray, decode: bool = True) -> np.ndarray:
+    """Text kernel: string lengths and characters drawn after their frequencies, as in `_generate_strings`
+
+    Args:
+        seed (np.random.SeedSequence): Seed of the stream block
+        offset (int): Row index of the first generated row
+        nrows (int): Number of rows
+        lengths (tuple): Alias table of the string lengths 0, 1, ...
+        chars (tuple): Alias table of the characters of `table`
+        table (np.ndarray): uint8 ASCII codes of the characters
+        decode (bool, optional): Decode to python strings rather than returning the null padded
+            fixed width bytes. Defaults to True.
+
+    Returns:
+        np.ndarray: object array of python strings
+    """
+    lengths_seed, chars_seed = seed.spawn(2)
+    width = max(len(lengths[0]) - 1, 1)
+    row_lengths = _alias_draw(lengths_seed, *lengths, nrows)
+    codes = table[_alias_draw(chars_seed, *chars, nrows * width)].astype(np.uint8).reshape(nrows, width)
+    codes[np.arange(width) >= row_lengths[:, None]] = 0
+    values = codes.view(f"S{width}").ravel()
+    return blocks.decode_ascii(values) if decode else values
+
+
+def _summarize_values(name, dtype: str, values: np.ndarray, nullratio: float, quantiles: int) -> ColumnSummary:
+    """Summary of the non null `values` of a numeric, boolean or datetime column"""
+    distinct, counts = np.unique(values, return_counts=True)
+    if len(distinct) <= _DISCRETE_VALUES or values.dtype.kind == "b":
+        return ColumnSummary(name, dtype, "discrete", nullratio, distinct, counts)
+    if values.dtype.kind in "iu" and len(distinct) == len(values):
+        return ColumnSummary(name, dtype, "unique", nullratio, distinct[[0, -1]])
+    ranks = np.rint(np.linspace(0, len(values) - 1, quantiles + 1)).astype(np.intp)
+    return ColumnSummary(name, dtype, "quantiles", nullratio, np.sort(values)[ranks])
+
+
+def _summarize_strings(name, dtype: str, values: np.ndarray, nullratio: float, top_k: int) -> ColumnSummary:
+    """Summary of the non null python strings `values` of a string column"""
+    if not all(isinstance(value, str) for value in values):
+        logger.error(f"Unsupported values of column {name}: only strings are supported in object columns")
+        raise ValueError(f"Unsupported values of column {name}: only strings are supported in object columns")
+    counts = pd.Series(values, dtype=object).value_counts()
+    if len(counts) <= min(top_k, len(values) // 2) and all(value.isascii() for value in counts.index):
+        return ColumnSummary(name, dtype, "discrete", nullratio, np.asarray(counts.index, dtype=object),
+                             counts.to_numpy())
+    lengths = np.bincount(np.fromiter(map(len, values), dtype=np.intp, count=len(values)), minlength=1)
+    chars = np.bincount(np.frombuffer("".join(values).encode("ascii", "ignore"), dtype=np.uint8), minlength=128)
+    chars[0] = 0
+    if not chars.any():
+        chars[ord(" ")] = 1
+    table = np.flatnonzero(chars).astype(np.uint8)
+    return ColumnSummary(name, dtype, "text", nullratio, table, lengths, chars[table])
+
+
+def summarize(sample: pd.DataFrame, quantiles: int = 256, top_k: int = 1000) -> List[ColumnSummary]:
+    """Summarize the columns of a sample frame, to generate frames like it without holding the sample
+
+    Args:
+        sample (pd.DataFrame): Sample frame, of int, float, bool, datetime, string (object or
+            "string") or categorical columns, nullable or not
+        quantiles (int, optional): Intervals of the quantile sketch of numeric and datetime columns.
+            Defaults to 256.
+        top_k (int, optional): Distinct values up to which string columns keep their value frequencies,
+            past which they keep length and character frequencies. Defaults to 1000.
+
+    Raises:
+        ValueError: If a column type is unsupported
+
+    Returns:
+        List[ColumnSummary]: one summary per column, in order
+    """
+    assert quantiles > 0, "provide a positive number of quantiles"
+    summaries = []
+    for position in range(sample.shape[1]):
+        name, series = sample.columns[position], sample.iloc[:, position]
+        null = series.isna().to_numpy()
+        nullratio = float(null.mean()) if len(series) else 0.0
+        dtype = str(series.dtype)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+            summaries.append(ColumnSummary(name, dtype, "category", nullratio,
+                                           np.asarray(series.cat.categories, dtype=object), counts))
+            continue
+        values = series[~null]
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            values = np.asarray(values.to_numpy(dtype="datetime64[ns]") if values.dt.tz is None
+                                else values.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy())
+        elif pd.api.types.is_bool_dtype(series.dtype):
+            values = values.to_numpy(dtype=np.bool_)
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            values = values.to_numpy(dtype=getattr(series.dtype, "numpy_dtype", series.dtype))
+        elif pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype):
+            summaries.append(_summarize_strings(name, dtype, values.to_numpy(dtype=object), nullratio, top_k))
+            continue
+        else:
+            logger.error(f"Unsupported datatype {dtype} of column {name} requested")
+            raise ValueError(f"Unsupported datatype {dtype} of column {name} requested")
+        if not len(values):
+            values = np.zeros(1, dtype=values.dtype)
+        summaries.append(_summarize_values(name, dtype, values, nullratio, quantiles))
+    return summaries
+
+
+def _column_like(generator: DataFrameGenerator, summary: ColumnSummary, seed: np.random.SeedSequence,
+                 nrows: int) -> _Column:
+    """Plan of a column generated after its summary, in a frame of `nrows` rows"""
+    name, kind = summary.name, summary.kind
+    dtype = pd.api.types.pandas_dtype(summary.dtype)
+    if kind == "category":
+        weights = summary.weights if summary.weights.any() else np.ones(max(len(summary.values), 1))
+        codes = np.arange(len(weights), dtype=_code_dtype(max(len(summary.values), 1)))
+        prob, alias = _alias_table(weights)
+        kernel = partial(_generate_discrete, values=codes, prob=prob, alias=alias)
+        column = _Column(name, seed, kernel, codes.dtype, blocks.Categorize(list(summary.values)))
+    elif kind == "text" or (kind == "discrete" and summary.values.dtype == object):
+        # the raw kernel draws the same strings, as fixed width bytes, for shared memory and Arrow buffers
+        if kind == "text":
+            kernel = partial(_generate_text, lengths=_alias_table(summary.weights),
+                             chars=_alias_table(summary.char_weights), table=summary.values)
+            raw_kernel, width = partial(kernel, decode=False), max(len(summary.weights) - 1, 1)
+        else:
+            prob, alias = _alias_table(summary.weights)
+            kernel = partial(_generate_discrete, values=summary.values, prob=prob, alias=alias)
+            raw_kernel = partial(kernel, values=summary.values.astype(bytes))
+            width = raw_kernel.keywords["values"].dtype.itemsize
+        raw = _Column(name, seed, raw_kernel, f"S{max(width, 1)}", blocks.decode_ascii)
+        column = _Column(name, seed, kernel, object, raw=raw)
+    else:
+        values = summary.values
+        if kind == "discrete":
+            prob, alias = _alias_table(summary.weights)
+            kernel = partial(_generate_discrete, values=values, prob=prob, alias=alias)
+        elif kind == "unique":
+            # the range widens to hold nrows distinct values, and the dtype with it
+            _min, _max = int(values[0]), int(values[1]) + 1
+            _max = max(_max, _min + nrows)
+            if not np.iinfo(values.dtype).min <= _min < _max <= np.iinfo(values.dtype).max + 1:
+                values = values.astype(_int_dtype(_min, _max))
+            kernel = partial(generator._generate_ints, _min=_min, _max=_max, unique=True,
+                             key=_permutation_key(seed), dtype=values.dtype)
+        else:
+            kernel = partial(_generate_quantiles, quantiles=values, dtype=str(values.dtype))
+        wrap = blocks.Localize(str(dtype.tz)) if getattr(dtype, "tz", None) is not None else None
+        column = _Column(name, seed, kernel, values.dtype, wrap)
+
+    # pandas masked dtypes keep their mask, even without nulls
+    masked = isinstance(dtype, (pd.StringDtype, pd.BooleanDtype)) or (
+        pd.api.types.is_extension_array_dtype(dtype) and dtype.kind in "iu")
+    return generator._nullable_column(column, summary.nullratio, masked=masked,
+                                      string=isinstance(dtype, pd.StringDtype))
+
+
+def plan_like(generator: DataFrameGenerator, sample: Union[pd.DataFrame, List[ColumnSummary]],
+              nrows: int) -> List[_Column]:
+    """Column plans of a frame of `nrows` rows like `sample`, a frame or its `summarize` summaries"""
+    summaries = summarize(sample) if isinstance(sample, pd.DataFrame) else list(sample)
+    seeds = generator._column_seeds([summary.name for summary in summaries])
+    return [_column_like(generator, summary, seed, nrows) for summary, seed in zip(summaries, seeds)]
@@ -0,0 +1,34 @@
+"""
+Randen: Random DataFrame Generator
+    Deferred imports, so that `import randen` and NumPy output do not pay for pandas
+"""
+
+__appname__ = "randen"
+
+import importlib
+
+
+class LazyModule:
+    """Stand-in for a module, imported on first attribute access
+
+    Usage:
+    -----
+        pd = LazyModule("pandas")
+        pd.DataFrame(...)  # imports pandas here, once
+    """
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr: str):
+        return getattr(importlib.import_module(self._name), attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self._name!r}>"
+
+
+def require(name: str, purpose: str):
+    """Import the optional dependency `name`, with an ImportError saying what it is needed for if it is missing"""
+    try:
+        return importlib.import_module(name)
+    except ImportError as error:
+        raise ImportError(f"{purpose} requires {name}: pip install {name}") from error
@@ -0,0 +1,138 @@
+"""
+Randen: Random DataFrame Generator
+    Memory-mapped datasets: generated column buffers kept in `.npy` files instead of RAM
+
+    A dataset directory holds one `.npy` file per block buffer, which the DataFrame views through
+    np.memmap with no copy, and a `manifest.json` describing how the buffers form the frame, so
+    that the dataset can be reopened later, e.g. by another process, without regenerating it.
+"""
+
+from __future__ import annotations
+
+__appname__ = "randen"
+
+import os
+import json
+from typing import Dict, List, Union
+
+import numpy as np
+
+from randen import blocks
+from randen.lazy import LazyModule
+
+pd = LazyModule("pandas")
+
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+
+
+class MemmapStore:
+    """Allocates the block buffers of one dataset as `.npy` memmaps in `directory`
+
+    Usage:
+    -----
+        store = MemmapStore("/data/frame")
+        path, values = store.allocate((ncols, nrows), np.float64)
+        ...  # fill values
+        store.save(columns, nrows, blocks)
+    """
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._nfiles = 0
+        # a stale manifest must not describe buffers that are being overwritten
+        if os.path.exists(os.path.join(directory, MANIFEST)):
+            os.remove(os.path.join(directory, MANIFEST))
+
+    def allocate(self, shape: tuple, dtype: Union[type, str]) -> tuple:
+        """Create a `.npy` buffer file mapped into memory
+
+        Returns:
+            tuple: (file path, np.memmap of the buffer)
+        """
+        path = os.path.join(self.directory, f"buffer{self._nfiles}.npy")
+        self._nfiles += 1
+        return path, np.lib.format.open_memmap(path, mode="w+", dtype=np.dtype(dtype), shape=shape)
+
+    def save(self, columns: List, nrows: int, entries: List[dict]) -> None:
+        """Write the manifest once every buffer is filled
+
+        Args:
+            columns (List): Column names of the dataframe
+            nrows (int): Number of rows
+            entries (List[dict]): One entry per block: "placement" (column positions) and either
+                "file" (path of the block buffer) and, for extension columns, "wrap" (see
+                blocks.wrap_spec), "decode" (wrap of raw values) and "mask" (path of the null mask),
+                or, for blocks of python objects, "files", "wraps" and "masks" with one raw buffer,
+                decode and null mask path (or None) per column
+        """
+        def basename(path: str) -> str:
+            return path and os.path.basename(path)
+
+        for entry in entries:
+            if "file" in entry:
+                entry["file"], entry["mask"] = basename(entry["file"]), basename(entry.get("mask"))
+            else:
+                entry["files"] = [basename(path) for path in entry["files"]]
+                entry["masks"] = [basename(path) for path in entry["masks"]]
+        manifest = {"format": "randen-memmap", "version": FORMAT_VERSION, "nrows": nrows,
+                    "columns": list(columns), "blocks": entries}
+        path = os.path.join(self.directory, MANIFEST)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=1)
+        os.replace(f"{path}.tmp", path)
+
+
+def open_memmap(directory: str, mode: str = "r",
+                as_frame: bool = True) -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
+    """Reopen a dataset generated with `memmap_dir=directory` without regenerating it
+
+    Args:
+        directory (str): Dataset directory
+        mode (str, optional): np.memmap mode, "r" read-only, "r+" read-write or "c" copy-on-write.
+            Defaults to "r".
+        as_frame (bool, optional): Return the DataFrame, with numeric, bool, datetime, categorical
+            and nullable integer/boolean columns viewing the maps and object or string columns decoded
+            into memory, rather than a column name to np.memmap mapping of the raw buffers, in which
+            nullable columns are np.ma.MaskedArray views of their values and null mask. Defaults to True.
+
+    Returns:
+        Union[pd.DataFrame, Dict[str, np.ndarray]]:
+    """
+    with open(os.path.join(directory, MANIFEST), encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    assert manifest.get("format") == "randen-memmap", f"{directory} does not hold a randen dataset"
+
+    def load(file: str) -> np.ndarray:
+        return np.load(os.path.join(directory, file), mmap_mode=mode) if file else None
+
+    def raw_column(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        return values if mask is None else np.ma.MaskedArray(values, mask, copy=False)
+
+    columns, frame_blocks, mapping = manifest["columns"], [], {}
+    for entry in manifest["blocks"]:
+        placement = entry["placement"]
+        if "file" not in entry:
+            raws, masks = [load(file) for file in entry["files"]], [load(file) for file in entry["masks"]]
+            values = np.empty((len(placement), manifest["nrows"]), dtype=object)
+            for row, (raw, spec, mask) in enumerate(zip(raws, entry["wraps"], masks)):
+                mapping[columns[placement[row]]] = raw_column(raw, mask)
+                values[row] = blocks.wrap_from_spec(spec)(raw)
+                if mask is not None:
+                    values[row][mask] = None
+            frame_blocks.append((values, placement))
+            continue
+
+        values, mask = load(entry["file"]), load(entry.get("mask"))
+        if values.ndim == 2:
+            mapping.update((columns[i], values[row]) for row, i in enumerate(placement))
+            frame_blocks.append((values.view(np.ndarray), placement))
+            continue
+        mapping[columns[placement[0]]] = raw_column(values, mask)
+        wrap, decode = blocks.wrap_from_spec(entry["wrap"]), blocks.wrap_from_spec(entry.get("decode"))
+        values = decode(values) if decode else values.view(np.ndarray)
+        frame_blocks.append((wrap(values) if mask is None else wrap(values, mask.view(np.ndarray)), placement))
+
+    if not as_frame:
+        return mapping
+    return blocks.assemble_frame(frame_blocks, columns, pd.RangeIndex(manifest["nrows"]))
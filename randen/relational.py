@@ -0,0 +1,226 @@
+"""
+Randen: Random DataFrame Generator
+    Multi-table generation: parent tables with a unique key column and child tables whose foreign
+    keys reference them, for join and lookup benchmarks
+
+    A parent's key of row i is `1 + perm(i)`, for a keyed permutation `perm` of its rows, the unique
+    integer engine of DataFrameGenerator. A child's foreign key draws a parent row, uniform or Zipf
+    skewed, and maps it through the same permutation, so no parent needs to be generated, or held,
+    to generate its children. Both are ordinary column kernels, so tables stay consistent however
+    they are chunked or scheduled across workers.
+"""
+
+from __future__ import annotations
+
+__appname__ = "randen"
+
+import zlib
+import logging
+from functools import partial
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+from randen.data_generator import DataFrameGenerator, _Column, _permutation_key
+from randen.permutation import FeistelPermutation
+
+logger = logging.getLogger(__appname__)
+
+# Key word of the permutation scattering Zipf ranks over the parent rows, so hot parents are not its first rows
+_RANK_KEY = 0x72616E6B
+
+
+class ForeignKey:
+    """Foreign key column of a child table referencing the key column of a parent table
+
+    Args:
+        parent (str): Name of the parent table
+        skew (str, optional): "uniform" or "zipf": the parent row of rank r is referenced with a
+            weight falling as 1 / (r + 1) ** zipf. Defaults to "uniform".
+        zipf (float, optional): Zipf exponent of a "zipf" skew. Defaults to 1.0.
+        orphans (float, optional): Ratio of rows referencing no parent row, drawn from keys past
+            the parent's. Defaults to 0.
+    """
+    def __init__(self, parent: str, skew: str = "uniform", zipf: float = 1.0, orphans: float = 0.0):
+        if skew not in ("uniform", "zipf"):
+            logger.error(f"Unsupported skew {skew} requested")
+            raise ValueError(f"Unsupported skew {skew} requested")
+        assert zipf > 0, "zipf exponent must be positive"
+        assert 0 <= orphans <= 1, "orphans must be in [0, 1]"
+        self.parent = parent
+        self.skew = skew
+        self.zipf = zipf
+        self.orphans = orphans
+
+
+class _Table:
+    """Definition of one table, see `RelationalGenerator.add_table`"""
+    __slots__ = ("name", "nrows", "ctypes", "columns", "key", "foreign_keys", "nullratio")
+
+    def __init__(self, name: str, nrows: int, ctypes: List[type], columns: List[str], key: str,
+                 foreign_keys: Dict[str, ForeignKey], nullratio: float):
+        self.name = name
+        self.nrows = nrows
+        self.ctypes = ctypes
+        self.columns = columns
+        self.key = key
+        self.foreign_keys = foreign_keys
+        self.nullratio = nullratio
+
+
+def _zipf_ranks(u: np.ndarray, n: int, zipf: float = 1.0) -> np.ndarray:
+    """Ranks in [0, n) of uniform draws `u`, by inverting the CDF of the continuous power law 1 / x ** zipf
+    on [1, n + 1), a close approximation of the discrete Zipf law that needs no table per rank"""
+    if zipf == 1:
+        ranks = np.exp(u * np.log1p(n))
+    else:
+        ranks = (1 + u * ((n + 1) ** (1 - zipf) - 1)) ** (1 / (1 - zipf))
+    return np.clip(ranks.astype(np.int64) - 1, 0, n - 1)
+
+
+def _generate_foreign_keys(seed: np.random.SeedSequence, offset: int, nrows: int, nparents: int, key: int,
+                           skew: str = "uniform", zipf: float = 1.0, orphans: float = 0.0) -> np.ndarray:
+    """Foreign key kernel: keys `1 + perm(row)` of parent rows drawn uniform or Zipf skewed
+
+    Zipf ranks are drawn by `_zipf_ranks` and scattered over the parent rows by a second keyed
+    permutation.
+    Orphan rows take keys in [nparents + 1, 2 * nparents + 1), which no parent holds.
+
+    Args:
+        seed (np.random.SeedSequence): Seed of the stream block
+        offset (int): Row index of the first generated row
+        nrows (int): Number of rows
+        nparents (int): Rows of the parent table
+        key (int): Permutation key of the parent's key column
+        skew (str, optional): "uniform" or "zipf". Defaults to "uniform".
+        zipf (float, optional): Zipf exponent. Defaults to 1.0.
+        orphans (float, optional): Ratio of orphan rows. Defaults to 0.
+
+    Returns:
+        np.ndarray: int64 array of keys
+    """
+    # separate streams keep the first rows of a block identical however many rows are drawn
+    rows_rng, orphans_rng, orphan_keys_rng = (np.random.default_rng(s) for s in seed.spawn(3))
+    if skew == "uniform":
+        rows = rows_rng.integers(0, nparents, size=nrows, dtype=np.int64)
+    else:
+        ranks = _zipf_ranks(rows_rng.random(nrows), nparents, zipf)
+        rows = FeistelPermutation(nparents, key=key ^ _RANK_KEY)(ranks)
+    keys = FeistelPermutation(nparents, key=key)(rows).astype(np.int64) + 1
+    if orphans:
+        orphan = orphans_rng.random(nrows) < orphans
+        orphan_keys = orphan_keys_rng.integers(nparents + 1, 2 * nparents + 1, size=nrows, dtype=np.int64)
+        keys[orphan] = orphan_keys[orphan]
+    return keys
+
+
+class RelationalGenerator:
+    """Generator of related tables built on a DataFrameGenerator
+
+    Usage:
+    -----
+        rg = RelationalGenerator(DataFrameGenerator(seed=42, workers=4))
+        rg.add_table("customers", nrows=10 ** 5, ctypes=[str, datetime])
+        rg.add_table("orders", fanout=20, ctypes=[float, datetime],
+                     foreign_keys={"customer_id": ForeignKey("customers", skew="zipf", orphans=0.01)})
+        customers, orders = rg.get_table("customers"), rg.get_table("orders")
+        for chunk in rg.iter_table("orders", chunksize=1 << 20):  # the same rows, chunk by chunk
+            ...
+
+    Every table draws from a seed of its own derived from its name, so a table is the same
+    whichever tables are generated, in which order and how often. Output, workers, executor and
+    hooks are those of the DataFrameGenerator.
+    """
+    def __init__(self, generator: DataFrameGenerator = None):
+        """
+        Args:
+            generator (DataFrameGenerator, optional): Generator of the tables. Defaults to None
+                (a DataFrameGenerator with fresh OS entropy).
+        """
+        self._generator = generator if generator is not None else DataFrameGenerator()
+        self._seed = self._generator._seed.spawn(1)[0]
+        self._tables: Dict[str, _Table] = {}
+
+    def add_table(self, name: str, nrows: int = None, ctypes: List[type] = (), columns: List[str] = None,
+                  key: str = "id", foreign_keys: Dict[str, ForeignKey] = None, fanout: float = None,
+                  nullratio: float = 0) -> "RelationalGenerator":
+        """Define a table, after the tables it references
+
+        Columns are the key column, then the foreign key columns, then the `ctypes` columns.
+
+        Args:
+            name (str): Table name
+            nrows (int, optional): Number of rows. Defaults to None (given by `fanout`).
+            ctypes (List[type], optional): Types of the data columns, as in `get_dataframe`. Defaults to ().
+            columns (List[str], optional): Names of the data columns. Defaults to None.
+            key (str, optional): Name of the unique key column, holding a permutation of 1 ... nrows,
+                None for no key. Defaults to "id".
+            foreign_keys (Dict[str, ForeignKey], optional): Foreign key columns by name. Defaults to None.
+            fanout (float, optional): Rows per row of the table the first foreign key references,
+                giving nrows. Defaults to None.
+            nullratio (float, optional): Ratio of null values per data column. Defaults to 0.
+
+        Returns:
+            RelationalGenerator: self, to chain definitions
+        """
+        assert name not in self._tables, f"table {name} already defined"
+        foreign_keys = dict(foreign_keys or {})
+        for foreign_key in foreign_keys.values():
+            assert foreign_key.parent in self._tables, f"define table {foreign_key.parent} before {name}"
+            assert self._tables[foreign_key.parent].key is not None, f"table {foreign_key.parent} has no key"
+            assert self._tables[foreign_key.parent].nrows > 0, f"table {foreign_key.parent} has no rows"
+        if nrows is None:
+            assert fanout is not None and foreign_keys, "provide nrows, or fanout with a foreign key"
+            nrows = int(round(fanout * self._tables[next(iter(foreign_keys.values())).parent].nrows))
+        assert nrows >= 0, "provide a non-negative number of rows"
+        self._tables[name] = _Table(name, nrows, list(ctypes), columns, key, foreign_keys, nullratio)
+        return self
+
+    def _table_seed(self, name: str) -> np.random.SeedSequence:
+        return np.random.SeedSequence(self._seed.entropy, spawn_key=self._seed.spawn_key + (zlib.crc32(name.encode()),),
+                                      pool_size=self._seed.pool_size)
+
+    def _plan(self, name: str) -> List[_Column]:
+        """Column plans of table `name`"""
+        assert name in self._tables, f"unknown table {name}"
+        table, dfg = self._tables[name], self._generator
+        data_columns = dfg._get_column_names(table.ctypes, table.columns)
+        names = ([table.key] if table.key is not None else []) + list(table.foreign_keys) + data_columns
+        seeds = dfg._column_seeds(names, call=self._table_seed(name))
+
+        plan = []
+        if table.key is not None:
+            kernel = partial(dfg._generate_ints, _min=1, _max=table.nrows + 1, unique=True,
+                             key=_permutation_key(self._table_seed(name)), dtype=np.int64)
+            plan.append(_Column(table.key, seeds.pop(0), kernel, np.int64))
+        for column, foreign_key in table.foreign_keys.items():
+            parent = self._tables[foreign_key.parent]
+            kernel = partial(_generate_foreign_keys, nparents=parent.nrows,
+                             key=_permutation_key(self._table_seed(parent.name)), skew=foreign_key.skew,
+                             zipf=foreign_key.zipf, orphans=foreign_key.orphans)
+            plan.append(_Column(column, seeds.pop(0), kernel, np.int64))
+        data = [dfg._default_column(column, seed, ctype, table.nrows)
+                for column, seed, ctype in zip(data_columns, seeds, table.ctypes)]
+        return plan + dfg._nullable(data, table.nrows, table.nullratio)
+
+    def get_table(self, name: str, memmap_dir: str = None):
+        """Generate table `name`
+
+        Args:
+            name (str): Table name
+            memmap_dir (str, optional): Generate the columns into `.npy` memmap files in this directory,
+                see `DataFrameGenerator.get_dataframe`. Defaults to None.
+
+        Returns:
+            The table, in the output of the generator: a pd.DataFrame by default
+        """
+        logger.info(f"Generating table {name} of {self._tables[name].nrows} rows")
+        return self._generator._build_dataframe(self._tables[name].nrows, self._plan(name), memmap_dir=memmap_dir)
+
+    def get_tables(self) -> dict:
+        """Generate every table, by name, in definition order"""
+        return {name: self.get_table(name) for name in self._tables}
+
+    def iter_table(self, name: str, chunksize: int) -> Iterator:
+        """Generate table `name` as chunks of `chunksize` rows, see `DataFrameGenerator.iter_dataframe`"""
+        return self._generator._iter_chunks(self._tables[name].nrows, self._plan(name), chunksize)
@@ -0,0 +1,163 @@
+"""
+Randen: Random DataFrame Generator
+    Compiled schemas: column plans built once and reused by every frame generated from them, for
+    loops generating the same kind of frame over and over
+"""
+
+from __future__ import annotations
+
+__appname__ = "randen"
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Union
+
+import numpy as np
+
+from randen.data_generator import DataFrameGenerator, DTypeLike, _Column, _column_dtypes
+
+logger = logging.getLogger(__appname__)
+
+
+class Schema:
+    """Column types, names and generation parameters compiled into column plans
+
+    Compiling validates the schema, names the columns, derives their seeds and builds their kernels,
+    vocabularies and buffer layouts once; `generate` then goes straight to the kernels. Only datetime
+    columns, whose ranges span the whole frame, are planned again when the number of rows changes.
+
+    A schema of a seeded generator generates, for a number of rows, always the same frame: the one
+    the first `get_dataframe` call of a generator of its seed returns for the same arguments. A
+    schema of an unseeded generator draws every frame from a fresh seed, as `get_dataframe` calls
+    do, and so builds its plans again for every frame.
+
+    Usage:
+    -----
+        schema = DataFrameGenerator(seed=42).compile([int, str, datetime], params={"Int0": {"unique": True}})
+        for _ in range(1000):
+            df = schema.generate(10 ** 5)
+
+        buffers = schema.empty(10 ** 5)
+        for _ in range(1000):
+            schema.generate(out=buffers)  # allocates nothing
+
+    Args:
+        generator (DataFrameGenerator): Generator whose seed, workers and output are used
+        ctypes (List[type]): Column types of the dataframe
+        columns (List[str], optional): Column names of the dataframe. Defaults to None.
+        params (Dict[str, dict], optional): Generation parameters by column name, see
+            `DataFrameGenerator._default_column`, plus "nullratio" and "dtype" overriding the frame's.
+            Defaults to None.
+        nullratio (float, optional): Ratio of null values per column. Defaults to 0.
+        exact_nulls (bool, optional): Null exactly round(nullratio * nrows) rows per column. Defaults to False.
+        dtype (List[DTypeLike], optional): numpy dtype of each int or float column. Defaults to None.
+        downcast (bool, optional): Narrowest integer dtype for int columns without a dtype. Defaults to False.
+
+    Raises:
+        ValueError: If requested Column datatype or a parameter is unsupported
+    """
+    def __init__(self, generator: DataFrameGenerator, ctypes: List[type], columns: List[str] = None,
+                 params: Dict[str, dict] = None, nullratio: float = 0, exact_nulls: bool = False,
+                 dtype: List[DTypeLike] = None, downcast: bool = False):
+        assert ctypes is not None, "provide columns' data types"
+        if columns is not None:
+            assert len(columns) == len(ctypes), "provide all or No Columns names"
+        assert dtype is None or isinstance(dtype, (list, tuple)), "provide dtype as a list, one entry per column"
+        self._generator = generator
+        self.columns = generator._get_column_names(ctypes, columns)
+        params = dict(params or {})
+        unknown = set(params) - set(self.columns)
+        assert not unknown, f"params given for unknown columns {sorted(unknown)}"
+
+        self._exact_nulls = exact_nulls
+        self._specs = []
+        for name, ctype, _dtype in zip(self.columns, ctypes, _column_dtypes(dtype, len(ctypes))):
+            column_params = dict(params.get(name, {}))
+            column_nullratio = column_params.pop("nullratio", nullratio)
+            assert 0 <= column_nullratio <= 1, "nullratio must be in [0, 1]"
+            _dtype = column_params.pop("dtype", _dtype)
+            self._specs.append((name, ctype, _dtype, downcast, column_params, column_nullratio))
+        # an unseeded generator's schema draws a fresh call seed per frame, as its get_dataframe calls do
+        self._compile(generator._first_call_seed() if generator._seeded else generator._seed.spawn(1)[0])
+        self._fresh = True
+
+    def _compile(self, call: np.random.SeedSequence) -> None:
+        """Build the column plans of the frames of the call seed `call`, see `DataFrameGenerator._column_seeds`"""
+        generator, self._fields = self._generator, []
+        seeds = generator._column_seeds(self.columns, call=call)
+        for (name, ctype, dtype, downcast, params, nullratio), seed in zip(self._specs, seeds):
+            # datetime ranges span the whole frame, so their columns are planned per number of rows
+            column = None if ctype == datetime else generator._default_column(
+                name, seed, ctype, 0, dtype=dtype, downcast=downcast, **params)
+            self._fields.append((name, seed, ctype, dtype, downcast, params, nullratio, column))
+        self._nrows, self._plan = None, None
+
+    def _next_frame(self) -> None:
+        """Reseed the plans of an unseeded generator's schema for the next frame"""
+        if not self._generator._seeded and not self._fresh:
+            self._compile(self._generator._seed.spawn(1)[0])
+        self._fresh = False
+
+    def plan(self, nrows: int) -> List[_Column]:
+        """Column plans of a frame of `nrows` rows, built at most once per number of rows in a row"""
+        assert nrows >= 0, "provide a non-negative number of rows"
+        if nrows != self._nrows:
+            plan = []
+            for name, seed, ctype, dtype, downcast, params, nullratio, column in self._fields:
+                if column is None:
+                    column = self._generator._default_column(name, seed, ctype, nrows, dtype=dtype,
+                                                             downcast=downcast, **params)
+                plan.extend(self._generator._nullable([column], nrows, nullratio, self._exact_nulls))
+            self._nrows, self._plan = nrows, plan
+        return self._plan
+
+    def empty(self, nrows: int) -> Dict[str, np.ndarray]:
+        """Uninitialized buffers of a frame of `nrows` rows, to pass to `generate(out=...)`
+
+        Buffers have the layout the kernels generate: int, float, bool and datetime (UTC) columns their
+        dtype, string and char columns null padded fixed width bytes, categorical columns their int
+        codes (-1 for nulls), and columns with a null mask are np.ma.MaskedArray of values and mask.
+
+        Args:
+            nrows (int): Number of rows
+
+        Returns:
+            Dict[str, np.ndarray]: buffers by column name
+        """
+        buffers = {}
+        for column in self.plan(nrows):
+            values = np.empty(nrows, dtype=(column.raw if column.raw is not None else column).dtype)
+            if column.mask is not None:
+                values = np.ma.MaskedArray(values, mask=np.empty(nrows, dtype=np.bool_), copy=False)
+            buffers[column.name] = values
+        return buffers
+
+    def generate(self, nrows: int = None, out: Dict[str, np.ndarray] = None) -> Union[object, Dict[str, np.ndarray]]:
+        """Generate a frame of `nrows` rows, or into the buffers `out`
+
+        Args:
+            nrows (int, optional): Number of rows. Defaults to None (the length of the `out` buffers).
+            out (Dict[str, np.ndarray], optional): Buffers from `empty`, filled in place, in their
+                layout, without any allocation but the kernels' own. Defaults to None.
+
+        Returns:
+            The frame, in the output of the generator (a pd.DataFrame by default), or `out`
+        """
+        self._next_frame()
+        if out is None:
+            assert nrows is not None, "provide nrows or out buffers"
+            return self._generator._build_dataframe(nrows, self.plan(nrows))
+        nrows = len(next(iter(out.values()))) if nrows is None and out else nrows or 0
+        plan = self.plan(nrows)
+        assert list(out) == self.columns, "provide the buffers of every column, see empty"
+        tasks = []
+        for column in plan:
+            values = out[column.name]
+            source = column.raw if column.raw is not None else column
+            assert len(values) == nrows and values.dtype == source.dtype, f"wrong buffer of column {column.name}"
+            tasks.append((np.ma.getdata(values), source))
+            if column.mask is not None:
+                assert isinstance(values, np.ma.MaskedArray), f"column {column.name} needs a masked buffer"
+                tasks.append((np.ma.getmaskarray(values), column.mask))
+        self._generator._fill_columns(tasks)
+        return out
@@ -0,0 +1,334 @@
+"""
+Randen: Random DataFrame Generator
+    Writer sinks streaming generated chunks straight to Parquet, Feather(Arrow IPC) and CSV files,
+    and into database tables through DB-API connections
+
+    Each chunk is written as soon as it is generated, so memory stays bounded by one chunk
+    (row group) whatever the size of the file. With `background=True` a writer thread encodes,
+    compresses and writes chunk k while chunk k + 1 is being generated.
+
+    Parquet and Feather need the optional `pyarrow` dependency.
+"""
+
+from __future__ import annotations
+
+__appname__ = "randen"
+
+import sys
+import queue
+import logging
+import threading
+from typing import TYPE_CHECKING, Callable, Iterable, List, Union
+
+import numpy as np
+
+from randen.lazy import LazyModule, require
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+pd = LazyModule("pandas")
+sqlite3 = LazyModule("sqlite3")
+
+logger = logging.getLogger(__appname__)
+
+# Pragmas of SQLite bulk loads, restored once the load is done: no fsync, rollback journal and
+# temporary tables in memory and a 256MB page cache
+_SQLITE_BULK_PRAGMAS = {"synchronous": "OFF", "journal_mode": "MEMORY", "temp_store": "MEMORY",
+                        "cache_size": "-262144"}
+
+# Bound parameters per statement of multi-row inserts, SQLite's limit before 3.32
+_SQL_MAX_PARAMETERS = 999
+
+# Placeholders of the DB-API parameter styles, by style, for the i-th (0-based) parameter
+_PLACEHOLDERS = {"qmark": lambda i: "?", "format": lambda i: "%s", "pyformat": lambda i: "%s",
+                 "numeric": lambda i: f":{i + 1}", "named": lambda i: f":p{i}"}
+
+
+def _import_pyarrow():
+    return require("pyarrow", "writing Parquet/Feather files")
+
+
+def _as_table(chunk: Union[pd.DataFrame, pa.Table], like: pd.DataFrame = None) -> pa.Table:
+    """Arrow table of a chunk; Arrow backend tables get the pandas metadata of `like`"""
+    pa = _import_pyarrow()
+    if isinstance(chunk, pd.DataFrame):
+        return pa.Table.from_pandas(chunk, preserve_index=False)
+    if like is None:
+        return chunk
+    return chunk.replace_schema_metadata(pa.Schema.from_pandas(like, preserve_index=False).metadata)
+
+
+def _drain(chunks: Iterable[pd.DataFrame], write: Callable[[pd.DataFrame], None],
+           background: bool = False, maxsize: int = 2) -> None:
+    """Pass every chunk to `write`, optionally from a background writer thread
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): Chunks to write, generated lazily
+        write (Callable[[pd.DataFrame], None]): Writes one chunk
+        background (bool, optional): Write in a background thread, overlapping generation with
+            encoding and I/O. Defaults to False.
+        maxsize (int, optional): Chunks generated ahead of the writer, bounding memory at
+            maxsize + 2 chunks. Defaults to 2.
+
+    Raises:
+        Exception: The first error raised by `write`, re-raised in the calling thread
+    """
+    if not background:
+        for chunk in chunks:
+            write(chunk)
+        return
+
+    pending = queue.Queue(maxsize=maxsize)
+    errors = []
+
+    def consume():
+        while True:
+            chunk = pending.get()
+            if chunk is None:
+                return
+            if not errors:
+                try:
+                    write(chunk)
+                except BaseException as error:
+                    errors.append(error)
+
+    writer = threading.Thread(target=consume, name=f"{__appname__}-writer", daemon=True)
+    writer.start()
+    try:
+        for chunk in chunks:
+            if errors:
+                break
+            pending.put(chunk)
+    finally:
+        pending.put(None)
+        writer.join()
+    if errors:
+        raise errors[0]
+
+
+def write_parquet(chunks: Iterable[Union[pd.DataFrame, pa.Table]], path: str,
+                  compression: str = "snappy", background: bool = False,
+                  like: pd.DataFrame = None) -> None:
+    """Write the chunks to a Parquet file, one row group per chunk
+
+    Args:
+        chunks (Iterable[Union[pd.DataFrame, pa.Table]]): Chunks of one frame, all with the same
+            schema
+        path (str): Output file path
+        compression (str, optional): Parquet compression codec. Defaults to "snappy".
+        background (bool, optional): Write from a background thread. Defaults to False.
+        like (pd.DataFrame, optional): Frame, e.g. empty, with the pandas dtypes of Arrow table
+            chunks, stored as their pandas metadata so that pandas reads them back with these
+            dtypes. Defaults to None.
+    """
+    pa = _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    writer = None
+
+    def write(chunk: Union[pd.DataFrame, pa.Table]):
+        nonlocal writer
+        table = _as_table(chunk, like)
+        if writer is None:
+            writer = pq.ParquetWriter(path, table.schema, compression=compression)
+        writer.write_table(table, row_group_size=len(chunk))
+
+    try:
+        _drain(chunks, write, background=background)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_feather(chunks: Iterable[Union[pd.DataFrame, pa.Table]], path: str,
+                  compression: str = "lz4", background: bool = False,
+                  like: pd.DataFrame = None) -> None:
+    """Write the chunks to a Feather V2 (Arrow IPC file format) file, one record batch per chunk
+
+    Args:
+        chunks (Iterable[Union[pd.DataFrame, pa.Table]]): Chunks of one frame, all with the same
+            schema
+        path (str): Output file path
+        compression (str, optional): "lz4", "zstd" or None. Defaults to "lz4".
+        background (bool, optional): Write from a background thread. Defaults to False.
+        like (pd.DataFrame, optional): Frame with the pandas dtypes of Arrow table chunks, see
+            `write_parquet`. Defaults to None.
+    """
+    pa = _import_pyarrow()
+
+    writer = None
+
+    def write(chunk: Union[pd.DataFrame, pa.Table]):
+        nonlocal writer
+        table = _as_table(chunk, like)
+        if writer is None:
+            options = pa.ipc.IpcWriteOptions(compression=compression)
+            writer = pa.ipc.new_file(path, table.schema, options=options)
+        writer.write_table(table)
+
+    try:
+        _drain(chunks, write, background=background)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_csv(chunks: Iterable[pd.DataFrame], path: str, background: bool = False,
+              **to_csv_kwargs) -> None:
+    """Write the chunks to a CSV file, with the header written once
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): Chunks of one frame, all with the same columns
+        path (str): Output file path
+        background (bool, optional): Write from a background thread. Defaults to False.
+        **to_csv_kwargs: Passed on to `pd.DataFrame.to_csv`, e.g. sep or date_format
+    """
+    header = True
+
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        def write(chunk: pd.DataFrame):
+            nonlocal header
+            chunk.to_csv(handle, header=header, index=False, **to_csv_kwargs)
+            header = False
+
+        _drain(chunks, write, background=background)
+
+
+def _quote(name) -> str:
+    """SQL identifier of a table or column name, double quoted"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _sql_type(dtype) -> str:
+    """SQL column type of a pandas dtype, in names SQLite and the common databases understand"""
+    if pd.api.types.is_bool_dtype(dtype):
+        return "BOOLEAN"
+    if pd.api.types.is_integer_dtype(dtype):
+        wide = dtype.itemsize > 4 or (dtype.kind == "u" and dtype.itemsize == 4)
+        return "BIGINT" if wide else "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "DOUBLE PRECISION"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "TIMESTAMP"
+    return "TEXT"
+
+
+def _sql_values(series: pd.Series) -> np.ndarray:
+    """Object array of the python values of a column, as DB-API drivers bind them: None for nulls,
+    ISO 8601 strings for datetimes"""
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        timestamps = series
+        if series.dt.tz is not None:
+            timestamps = series.dt.tz_convert("UTC").dt.tz_localize(None)
+        values = timestamps.to_numpy(dtype="datetime64[us]")
+        strings = np.datetime_as_string(values, unit="us")
+        # "YYYY-MM-DD HH:MM:SS.ffffff", as pandas and the databases format timestamps
+        chars = strings.view(np.uint32).reshape(len(strings), -1)
+        if chars.shape[1] > 10:
+            chars[chars[:, 10] == ord("T"), 10] = ord(" ")
+        strings = strings.astype(object)
+        strings[np.isnat(values)] = None
+        return strings
+    return series.to_numpy(dtype=object, na_value=None)
+
+
+def _paramstyle(connection) -> str:
+    """DB-API parameter style of the driver of `connection`, "qmark" if it does not say"""
+    module = sys.modules.get(type(connection).__module__.split(".")[0])
+    return getattr(module, "paramstyle", "qmark")
+
+
+def write_sql(chunks: Iterable[pd.DataFrame], connection, table: str, like: pd.DataFrame,
+              if_exists: str = "fail", indexes: List[Union[str, List[str]]] = None,
+              batch_size: int = 10000, rows_per_statement: int = None) -> int:
+    """Insert the chunks into table `table` through a DB-API connection, with batched `executemany`
+
+    The table is created from the dtypes of `like`, and each chunk inserted in one transaction,
+    `batch_size` rows per `executemany` call of multi-row `INSERT ... VALUES (...), (...)`
+    statements, which halve the per row cost of SQLite. Rows are converted to python values a
+    column at a time and laid out as statement parameters by reshaping one object array.
+    SQLite connections load with bulk pragmas (no fsync, in-memory journal, large page cache),
+    restored afterwards. Indexes are built once the rows are loaded, which is much cheaper than
+    maintaining them row by row.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): Chunks of one frame, all with the columns of `like`
+        connection: DB-API 2.0 connection, e.g. `sqlite3.connect(path)`
+        table (str): Table name
+        like (pd.DataFrame): Frame, e.g. empty, with the columns and dtypes of the table
+        if_exists (str, optional): "fail", "replace" or "append" to an existing table, as in
+            `pd.DataFrame.to_sql`. Defaults to "fail".
+        indexes (List[Union[str, List[str]]], optional): Columns, or lists of columns, to index
+            after loading. Defaults to None.
+        batch_size (int, optional): Rows per `executemany` call. Defaults to 10000.
+        rows_per_statement (int, optional): Rows per INSERT statement, 1 for single row statements.
+            Defaults to None (up to 256, within 999 parameters).
+
+    Raises:
+        ValueError: If requested if_exists is unsupported
+
+    Returns:
+        int: Number of rows inserted
+    """
+    if if_exists not in ("fail", "replace", "append"):
+        logger.error(f"Unsupported if_exists {if_exists} requested")
+        raise ValueError(f"Unsupported if_exists {if_exists} requested")
+    assert batch_size > 0, "provide a positive batch_size"
+    ncols = like.shape[1]
+    assert ncols > 0, "provide a frame with columns"
+    placeholder = _PLACEHOLDERS.get(_paramstyle(connection), _PLACEHOLDERS["qmark"])
+    per_statement = rows_per_statement or max(1, min(256, _SQL_MAX_PARAMETERS // ncols))
+    definitions = ", ".join(f"{_quote(name)} {_sql_type(dtype)}"
+                            for name, dtype in like.dtypes.items())
+
+    def insert(nrows: int) -> str:
+        rows = ("(" + ", ".join(placeholder(row * ncols + i) for i in range(ncols)) + ")"
+                for row in range(nrows))
+        return (f"INSERT INTO {_quote(table)} ({', '.join(_quote(name) for name in like.columns)}) "
+                f"VALUES {', '.join(rows)}")
+
+    statements = {1: insert(1), per_statement: insert(per_statement)}
+
+    cursor = connection.cursor()
+    restore = {}
+    if isinstance(connection, sqlite3.Connection):
+        for pragma, value in _SQLITE_BULK_PRAGMAS.items():
+            restore[pragma] = cursor.execute(f"PRAGMA {pragma}").fetchone()[0]
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+    nrows = 0
+    try:
+        if if_exists == "replace":
+            cursor.execute(f"DROP TABLE IF EXISTS {_quote(table)}")
+        exists = "IF NOT EXISTS " if if_exists == "append" else ""
+        cursor.execute(f"CREATE TABLE {exists}{_quote(table)} ({definitions})")
+        connection.commit()
+
+        for chunk in chunks:
+            values = np.empty((len(chunk), ncols), dtype=object)
+            for i in range(ncols):
+                values[:, i] = _sql_values(chunk.iloc[:, i])
+            whole = len(values) // per_statement * per_statement
+            try:
+                for rows, params in ((per_statement, values[:whole]), (1, values[whole:])):
+                    params = params.reshape(-1, rows * ncols)
+                    step = max(batch_size // rows, 1)
+                    for start in range(0, len(params), step):
+                        cursor.executemany(statements[rows], params[start:start + step].tolist())
+                connection.commit()
+            except BaseException:
+                connection.rollback()
+                raise
+            nrows += len(values)
+
+        for index in indexes or []:
+            index = [index] if isinstance(index, str) else list(index)
+            name = _quote(f"ix_{table}_{'_'.join(map(str, index))}")
+            columns = ", ".join(map(_quote, index))
+            cursor.execute(f"CREATE INDEX {name} ON {_quote(table)} ({columns})")
+        connection.commit()
+    finally:
+        for pragma, value in restore.items():
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+        cursor.close()
+    return nrows
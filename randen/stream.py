@@ -0,0 +1,188 @@
+"""
+Randen: Random DataFrame Generator
+    Endless streams of micro-batches, for load tests of ingestion pipelines
+
+    A stream is one unbounded frame whose rows are emitted batch after batch: every column is an
+    ordinary kernel of the row index, so a batch costs O(rows) whatever came before it and its
+    state is its seed and the index of its next row. Ids count up, event timestamps only increase
+    and the popular keys drift through the key space as the stream goes on.
+"""
+
+from __future__ import annotations
+
+__appname__ = "randen"
+
+import time
+import logging
+from datetime import datetime
+from functools import partial
+from typing import Iterator, List
+
+import numpy as np
+
+from randen.data_generator import DataFrameGenerator, _Column, _date_bounds
+from randen.relational import _zipf_ranks
+
+logger = logging.getLogger(__appname__)
+
+
+def _generate_sequence(seed: np.random.SeedSequence, offset: int, nrows: int, first: int = 1) -> np.ndarray:
+    """Id kernel: row i holds `first + i`"""
+    return np.arange(first + offset, first + offset + nrows, dtype=np.int64)
+
+
+def _generate_event_times(seed: np.random.SeedSequence, offset: int, nrows: int, start: int,
+                          interval: int) -> np.ndarray:
+    """Event time kernel: row i is stamped `start + i * interval` plus a uniform jitter in [0, interval)
+
+    Gaps between rows vary in [0, 2 * interval) but never go negative, so timestamps only increase,
+    without any state carried from row to row.
+
+    Args:
+        seed (np.random.SeedSequence): Seed of the stream block
+        offset (int): Row index of the first generated row
+        nrows (int): Number of rows
+        start (int): Timestamp of row 0, ns since the epoch (UTC)
+        interval (int): Mean ns between rows
+
+    Returns:
+        np.ndarray: datetime64[ns] array
+    """
+    jitter = np.random.default_rng(seed).integers(0, interval, size=nrows, dtype=np.int64)
+    values = start + np.arange(offset, offset + nrows, dtype=np.int64) * interval + jitter
+    return values.view("datetime64[ns]")
+
+
+def _generate_drifting_keys(seed: np.random.SeedSequence, offset: int, nrows: int, nkeys: int,
+                            zipf: float = 1.0, drift: int = None) -> np.ndarray:
+    """Key kernel: Zipf ranks of `nkeys` keys, the hottest key moving up by one every `drift` rows
+
+    Args:
+        seed (np.random.SeedSequence): Seed of the stream block
+        offset (int): Row index of the first generated row
+        nrows (int): Number of rows
+        nkeys (int): Number of distinct keys, 0 ... nkeys - 1
+        zipf (float, optional): Zipf exponent of the key popularity. Defaults to 1.0.
+        drift (int, optional): Rows after which the key popularity shifts by one key. Defaults to None (no drift).
+
+    Returns:
+        np.ndarray: int64 array of keys
+    """
+    keys = _zipf_ranks(np.random.default_rng(seed).random(nrows), nkeys, zipf)
+    if drift:
+        keys += np.arange(offset, offset + nrows, dtype=np.int64) // drift
+        keys %= nkeys
+    return keys
+
+
+class Stream:
+    """Stateful generator of the consecutive batches of an endless frame, see `DataFrameGenerator.stream`
+
+    Usage:
+    -----
+        stream = DataFrameGenerator(seed=42).stream([float, str], nkeys=10 ** 4, drift=10 ** 5)
+        batch = stream.next_batch(1000)  # columns id, ts, key, Float0, Str1
+        checkpoint = stream.state  # small, JSON serializable
+        for batch in stream.iter_batches(1000, rows_per_s=50000):
+            ...
+        resumed = DataFrameGenerator().stream([float, str], nkeys=10 ** 4, drift=10 ** 5, state=checkpoint)
+
+    A batch holds the same rows however the stream was batched before it, or whether it was
+    restored from a checkpoint: restore a stream with the columns and parameters it was created with.
+    """
+    def __init__(self, generator: DataFrameGenerator, ctypes: List[type] = (), columns: List[str] = None,
+                 id_column: str = "id", time_column: str = "ts", key_column: str = "key", start: datetime = None,
+                 event_rate: float = 1000.0, nkeys: int = 1000, zipf: float = 1.0, drift: int = None,
+                 nullratio: float = 0, state: dict = None):
+        assert event_rate > 0, "provide a positive event rate"
+        assert nkeys > 0, "provide a positive number of keys"
+        assert drift is None or drift > 0, "drift must be a positive number of rows"
+        assert datetime not in ctypes, "datetime columns are not supported, the stream has its time column"
+        self._generator = generator
+        self._ctypes = list(ctypes)
+        self._columns = columns
+        self._names = (id_column, time_column, key_column)
+        self._start = _date_bounds(start or datetime.now())[0]
+        self._interval = max(int(round(1e9 / event_rate)), 1)
+        self._keys = partial(_generate_drifting_keys, nkeys=nkeys, zipf=zipf, drift=drift)
+        self._nullratio = nullratio
+        self._seed = generator._seed.spawn(1)[0]
+        self._position = 0
+        self._plan = None
+        if state is not None:
+            self.restore(state)
+        else:
+            self._plan = self._plan_stream()
+
+    def _plan_stream(self) -> List[_Column]:
+        """Column plans of the stream: id, time and key columns, then the `ctypes` columns"""
+        dfg = self._generator
+        kernels = [(_generate_sequence, np.int64),
+                   (partial(_generate_event_times, start=self._start, interval=self._interval), "datetime64[ns]"),
+                   (self._keys, np.int64)]
+        special = [(name, kernel, dtype) for name, (kernel, dtype) in zip(self._names, kernels) if name is not None]
+        data = dfg._get_column_names(self._ctypes, self._columns)
+        seeds = dfg._column_seeds([name for name, _, _ in special] + data, call=self._seed)
+        plan = [_Column(name, seed, kernel, dtype) for (name, kernel, dtype), seed in zip(special, seeds)]
+        # data columns are planned unbounded; none of their kernels depend on the number of rows
+        columns = [dfg._default_column(name, seed, ctype, 0)
+                   for name, seed, ctype in zip(data, seeds[len(special):], self._ctypes)]
+        return plan + dfg._nullable(columns, 0, self._nullratio)
+
+    @property
+    def position(self) -> int:
+        """Index of the next row of the stream, the number of rows emitted so far"""
+        return self._position
+
+    @property
+    def state(self) -> dict:
+        """Checkpoint of the stream, JSON serializable: its seed, event time origin and the index of its next row"""
+        return {"entropy": str(self._seed.entropy), "spawn_key": list(self._seed.spawn_key),
+                "pool_size": self._seed.pool_size, "start": self._start, "position": self._position}
+
+    def restore(self, state: dict) -> None:
+        """Resume the stream from a `state` checkpoint of a stream created with the same arguments"""
+        self._seed = np.random.SeedSequence(int(state["entropy"]), spawn_key=tuple(state["spawn_key"]),
+                                            pool_size=state["pool_size"])
+        self._start = state["start"]
+        self._position = state["position"]
+        self._plan = self._plan_stream()
+
+    def next_batch(self, nrows: int):
+        """Generate the next `nrows` rows of the stream, indexed by row number in the stream
+
+        Args:
+            nrows (int): Number of rows
+
+        Returns:
+            The batch, in the output of the generator: a pd.DataFrame by default
+        """
+        assert nrows >= 0, "provide a non-negative number of rows"
+        batch = self._generator._build_dataframe(nrows, self._plan, start=self._position)
+        self._position += nrows
+        return batch
+
+    def iter_batches(self, nrows: int, rows_per_s: float = None, max_batches: int = None) -> Iterator:
+        """Emit batches of `nrows` rows, endlessly or `max_batches` of them, at most at `rows_per_s`
+
+        Batches are paced against a schedule started at the first batch, so the rate holds on
+        average whatever the time spent generating or consuming them.
+
+        Args:
+            nrows (int): Rows per batch
+            rows_per_s (float, optional): Target rate, in rows per second. Defaults to None (no limit).
+            max_batches (int, optional): Number of batches to emit. Defaults to None (endless).
+
+        Returns:
+            Iterator: batches, see `next_batch`
+        """
+        assert rows_per_s is None or rows_per_s > 0, "provide a positive rows_per_s"
+        t0, emitted, batches = time.monotonic(), 0, 0
+        while max_batches is None or batches < max_batches:
+            if rows_per_s is not None:
+                delay = t0 + emitted / rows_per_s - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            yield self.next_batch(nrows)
+            emitted += nrows
+            batches += 1
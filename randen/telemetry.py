@@ -0,0 +1,76 @@
+"""
+Randen: Random DataFrame Generator
+    Generation telemetry: per column, per row range timings reported to user hooks
+
+    A hook is any callable taking a ColumnEvent. Hooks attached to a DataFrameGenerator are called
+    once per (column, row range) generated, i.e. per column per chunk, or per task of _TASK_ROWS
+    rows when the generator has several workers, and once per decode of fixed width columns. With
+    thread workers hooks are called from the worker threads. No timing is taken when no hook is
+    attached.
+"""
+
+from __future__ import annotations
+
+__appname__ = "randen"
+
+import threading
+from typing import List, NamedTuple
+
+from randen.lazy import LazyModule
+
+pd = LazyModule("pandas")
+
+
+class ColumnEvent(NamedTuple):
+    """Generation of one row range of one column
+
+    Attributes:
+        column (str): Column name
+        start (int): Row index of the first generated row
+        nrows (int): Number of generated rows
+        seconds (float): Wall time of the generation
+        nbytes (int): Bytes written to the column buffer (fixed width bytes for object columns
+            generated for shared memory or memmap buffers, object pointers otherwise)
+        engine (str): Kernel generating the values, e.g. "ints", "strings+nulls" or "decode"
+        executor (str): "serial", "thread", "process" or, for decodes, "parent"
+    """
+    column: str
+    start: int
+    nrows: int
+    seconds: float
+    nbytes: int
+    engine: str
+    executor: str
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.nrows / self.seconds if self.seconds > 0 else float("inf")
+
+
+class Profile:
+    """Hook collecting every event, see `DataFrameGenerator.profile`
+
+    Usage:
+    -----
+        with dfg.profile() as profile:
+            dfg.get_dataframe(...)
+        profile.summary().head()  # slowest columns first
+    """
+    def __init__(self):
+        self.events: List[ColumnEvent] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, event: ColumnEvent) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def summary(self) -> pd.DataFrame:
+        """Total seconds, rows, bytes and rows/s per column and engine, slowest first
+
+        Returns:
+            pd.DataFrame:
+        """
+        events = pd.DataFrame(self.events, columns=ColumnEvent._fields)
+        summary = events.groupby(["column", "engine"], sort=False)[["seconds", "nrows", "nbytes"]].sum()
+        summary["rows_per_s"] = summary["nrows"] / summary["seconds"]
+        return summary.sort_values("seconds", ascending=False)
@@ -0,0 +1,102 @@
+"""
+Randen: Random DataFrame Generator
+    Testcases for the on-disk dataset cache
+"""
+
+import os
+import multiprocessing
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from randen import DataFrameGenerator, DatasetCache
+
+CTYPES = [int, float, str, bytes, datetime, pd.Categorical]
+
+
+def _get(directory: str, max_bytes: int = None, nrows: int = 1000, seed: int = 1) -> pd.DataFrame:
+    dfg = DataFrameGenerator(seed=seed, cache=DatasetCache(directory, max_bytes=max_bytes))
+    return dfg.get_dataframe(nrows, CTYPES, nullratio=0.1)
+
+
+def _entries(directory: str) -> list:
+    return sorted(name for name in os.listdir(directory) if name != "locks")
+
+
+def test_hit(tmp_path):
+    """
+    Test cached datasets
+        - Test a miss and a hit equal the uncached frame
+        - Test a hit is memory-mapped, generates nothing and is copy-on-write
+        - Test a different call of the generator is another dataset
+    """
+    expected = DataFrameGenerator(seed=1).get_dataframe(1000, CTYPES, nullratio=0.1)
+    pd.testing.assert_frame_equal(_get(str(tmp_path)), expected)
+
+    dfg = DataFrameGenerator(seed=1, cache=str(tmp_path))
+    with dfg.profile() as profile:
+        hit = dfg.get_dataframe(1000, CTYPES, nullratio=0.1)
+    assert not profile.events, "Cache hit generated columns"
+    values = hit["Float1"].values
+    while values.base is not None and not isinstance(values, np.memmap):
+        values = values.base
+    assert isinstance(values, np.memmap), "Cache hit not memory-mapped"
+    pd.testing.assert_frame_equal(hit, expected)
+
+    hit.iloc[0, 0] = -1
+    pd.testing.assert_frame_equal(_get(str(tmp_path)), expected)
+    dfg.get_dataframe(1000, CTYPES, nullratio=0.1)
+    assert len(_entries(str(tmp_path))) == 2, "Second call of a generator hit the first"
+
+
+def test_eviction(tmp_path):
+    """
+    Test least recently used datasets are evicted past max_bytes, but the dataset just generated
+    """
+    _get(str(tmp_path), seed=1)
+    size = sum(file.stat().st_size for file in tmp_path.rglob("*") if file.is_file() and file.parent.name != "locks")
+    _get(str(tmp_path), max_bytes=2 * size, seed=2)
+    first, second = _entries(str(tmp_path))
+    _get(str(tmp_path), max_bytes=2 * size, seed=1)  # hit, now the most recently used
+    _get(str(tmp_path), max_bytes=2 * size, seed=3)
+    assert len(_entries(str(tmp_path))) == 2, "Cache not evicted"
+    _get(str(tmp_path), max_bytes=0, seed=4)
+    assert len(_entries(str(tmp_path))) == 1, "Dataset just generated evicted"
+    DatasetCache(str(tmp_path)).clear()
+    assert not _entries(str(tmp_path)), "Cache not cleared"
+
+
+def test_uncached_calls(tmp_path, tmp_path_factory):
+    """
+    Test only whole seeded frames are cached
+        - Test chunks, partitions, streams and sinks leave no dataset
+        - Test unseeded generators and secure string columns leave no dataset
+    """
+    dfg = DataFrameGenerator(seed=1, cache=str(tmp_path))
+    list(dfg.iter_dataframe(1000, CTYPES, chunksize=300))
+    dfg.get_partition(1000, CTYPES, 0, 2)
+    stream = dfg.stream([int, str])
+    for _ in range(5):
+        stream.next_batch(100)
+    dfg.write_csv(str(tmp_path_factory.mktemp("csv") / "frame.csv"), 1000, [int, str])
+    DataFrameGenerator(cache=str(tmp_path)).get_dataframe(1000, CTYPES)
+    dfg.get_string_dataframe(1000, 2, secure=True)
+    assert not _entries(str(tmp_path)), "Dataset cached"
+    dfg.get_integer_dataframe(1000, 2)
+    assert len(_entries(str(tmp_path))) == 1, "Typed frame not cached"
+
+
+def _worker(directory: str) -> pd.DataFrame:
+    return _get(directory, nrows=50000)
+
+
+def test_concurrent(tmp_path):
+    """
+    Test processes asking for the same dataset at once generate it once and all get it
+    """
+    with multiprocessing.get_context("spawn").Pool(3) as pool:
+        frames = pool.map(_worker, [str(tmp_path)] * 3)
+    assert len(_entries(str(tmp_path))) == 1, "Dataset cached more than once"
+    for frame in frames[1:]:
+        pd.testing.assert_frame_equal(frame, frames[0])
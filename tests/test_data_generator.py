@@ -2,15 +2,25 @@
 Randen: Random DataFrame Generator
     Testcases for randen
 TODO: Add testcases for provided column names
-TODO: Test for nullratio funcionality
 """
 __author__ = "Kanishk Varshney"
 __date__ = "05-10-2020"
 __appname__ = "randen"
 
+import os
+import sys
+import warnings
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from string import ascii_uppercase
 from pandas.api.types import is_datetime64_any_dtype as is_datetime
 
+import pytest
+import numpy as np
+import pandas as pd
+
 from randen import DataFrameGenerator
 
 def test_get_integer_dataframe():
@@ -122,3 +132,378 @@ def test_get_dataframe():
     df = dfg.get_dataframe(10, ctypes=[str, bytes, int, float, bool, datetime])
     assert df.shape == (10, 6), "Wrong size dataframe generated"
     assert list(df.columns) == ["Str0", "Bytes1", "Int2", "Float3", "Bool4", "Datetime5"], "Wrong column names"
+
+
+def test_get_string_dataframe_lengths_and_alphabet():
+    """
+    Test the vectorized string engine
+        - Test the string lengths stay within [minstrlen, maxstrlen]
+        - Test only characters of the requested alphabet are used
+        - Test the secure(CSPRNG) mode honours the same constraints
+    Returns:
+
+    """
+    dfg = DataFrameGenerator()
+    for secure in (False, True):
+        df = dfg.get_string_dataframe(1000, 2, minstrlen=3, maxstrlen=5, alphabet="abc", secure=secure)
+        lengths = df["Str0"].str.len()
+        assert lengths.min() >= 3 and lengths.max() <= 5, "String length out of range"
+        assert set("".join(df["Str1"])) <= set("abc"), "Characters outside the alphabet"
+
+
+def test_unique_key_columns():
+    """
+    Test guaranteed-unique key columns
+        - Test integers are distinct and within [minval, maxval) even when the range is tight
+        - Test strings are distinct even when the key space is nearly exhausted, variable lengths included
+    Returns:
+
+    """
+    dfg = DataFrameGenerator()
+    df = dfg.get_integer_dataframe(1000, 2, minval=10, maxval=1010, unique=True)
+    assert df["Integer0"].is_unique and df["Integer1"].is_unique, "Repeated integer keys"
+    assert df.values.min() >= 10 and df.values.max() < 1010, "Integer keys out of range"
+
+    df = dfg.get_string_dataframe(1000, 1, minstrlen=2, maxstrlen=4, alphabet="abcdefghijklmnopqrstuvwxyz0123456789",
+                                  unique=True)
+    assert df["Str0"].is_unique, "Repeated string keys"
+    assert df["Str0"].str.len().between(2, 4).all(), "String length out of range"
+
+    df = DataFrameGenerator(seed=5).get_string_dataframe(100000, 1, minstrlen=1, maxstrlen=20, unique=True)
+    assert df["Str0"].is_unique and df["Str0"].str.len().between(1, 20).all(), "Repeated variable-length keys"
+    assert df["Str0"].str.len().min() < 5, "Short keys all lengthened"
+    # every string of 1 to 3 characters over "ab": 2 + 4 + 8 keys
+    df = dfg.get_string_dataframe(14, 1, minstrlen=1, maxstrlen=3, alphabet="ab", unique=True)
+    assert df["Str0"].is_unique and df["Str0"].str.len().between(1, 3).all(), "Key space not exhausted"
+    with pytest.raises(ValueError):
+        dfg.get_string_dataframe(15, 1, minstrlen=1, maxstrlen=3, alphabet="ab", unique=True)
+
+
+def test_get_char_dataframe_chartypes():
+    """
+    Test the char kernel representations
+        - Test "S1" gives 1-byte bytes values
+        - Test "category" gives categorical columns over the alphabet
+        - Test uppercase characters are drawn from the uppercase alphabet
+        - Test an unsupported chartype is rejected whatever the output and executor
+    Returns:
+
+    """
+    dfg = DataFrameGenerator()
+    df = dfg.get_char_dataframe(100, 2, chartype="S1")
+    assert all(isinstance(c, bytes) and len(c) == 1 for c in df["Char0"]), "Wrong char representation"
+
+    df = dfg.get_char_dataframe(100, 2, lowercase=False, chartype="category")
+    assert (df.dtypes == "category").all(), "Wrong data types"
+    assert set(df["Char1"]) <= set(ascii_uppercase), "Characters outside the alphabet"
+
+    for generator in (dfg, DataFrameGenerator(output="numpy"), DataFrameGenerator(workers=2, executor="process")):
+        with pytest.raises(ValueError):
+            generator.get_char_dataframe(100, 1, chartype="garbage")
+
+
+def test_wide_dataframe_single_block():
+    """
+    Test wide frames are assembled from one block per dtype
+        - Test no fragmentation PerformanceWarning is raised
+        - Test mixed frames keep the requested column order
+    Returns:
+
+    """
+    dfg = DataFrameGenerator()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        df = dfg.get_float_dataframe(10, 2000)
+    assert df.shape == (10, 2000) and df._mgr.nblocks == 1, "Frame not built from a single block"
+
+    df = dfg.get_dataframe(10, ctypes=[int, float, int, str, float, bool, datetime, bytes])
+    assert list(df.columns) == ["Int0", "Float1", "Int2", "Str3", "Float4", "Bool5", "Datetime6", "Bytes7"]
+    assert list(df.dtypes) == [int, float, int, object, float, bool, "datetime64[ns]", object], "Wrong data types"
+
+
+def test_seeded_dataframe_is_reproducible():
+    """
+    Test seeded generation
+        - Test the same seed gives byte-identical frames
+        - Test a column's values do not depend on the column order
+        - Test repeated calls on one generator give different frames
+    Returns:
+
+    """
+    ctypes, columns = [str, bytes, int, float, bool, datetime], list("abcdef")
+    df = DataFrameGenerator(seed=42).get_dataframe(100, ctypes, columns)
+    assert df.equals(DataFrameGenerator(seed=42).get_dataframe(100, ctypes, columns)), "Seeded frames differ"
+
+    reordered = DataFrameGenerator(seed=42).get_dataframe(100, ctypes[::-1], columns[::-1])
+    assert df.equals(reordered[columns]), "Column values depend on the column order"
+
+    dfg = DataFrameGenerator(seed=42)
+    assert not dfg.get_float_dataframe(10, 1).equals(dfg.get_float_dataframe(10, 1)), "Repeated calls repeat data"
+
+
+def test_seeded_dataframe_ignores_timezone():
+    """
+    Test seeded datetime columns
+        - Test the same seed gives the same timestamps whatever the host timezone
+    Returns:
+
+    """
+    code = "from datetime import datetime; from randen import DataFrameGenerator; " \
+           "print(DataFrameGenerator(seed=42).get_dataframe(3, [datetime, int]).to_json())"
+    outputs = {subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True,
+                              env={**os.environ, "TZ": tz}).stdout for tz in ("UTC", "Asia/Kolkata")}
+    assert len(outputs) == 1, "Seeded timestamps depend on the timezone"
+
+
+def test_parallel_dataframe_matches_serial():
+    """
+    Test multi-threaded generation
+        - Test the output does not depend on the number of workers, long columns included
+    Returns:
+
+    """
+    ctypes = [str, bytes, int, float, bool, datetime]
+    serial = DataFrameGenerator(seed=3).get_dataframe(300000, ctypes)
+    parallel = DataFrameGenerator(seed=3, workers=4).get_dataframe(300000, ctypes)
+    assert serial.equals(parallel), "Output depends on the number of workers"
+
+
+def test_process_dataframe_shared_memory():
+    """
+    Test process-pool generation into shared memory
+        - Test the output matches serial generation
+        - Test no shared memory segment is left behind when generation fails
+    Returns:
+
+    """
+    ctypes = [str, bytes, int, float, bool, datetime]
+    serial = DataFrameGenerator(seed=5).get_dataframe(1000, ctypes)
+    shared = DataFrameGenerator(seed=5, workers=2, executor="process").get_dataframe(1000, ctypes)
+    assert serial.equals(shared), "Process generation differs from serial generation"
+
+    segments = set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+    dfg = DataFrameGenerator(workers=2, executor="process")
+    with pytest.raises(ValueError):
+        dfg.get_integer_dataframe(1000, 2, minval=0, maxval=10, unique=True)
+    if os.path.isdir("/dev/shm"):
+        assert set(os.listdir("/dev/shm")) <= segments, "Shared memory segments leaked"
+
+
+def test_iter_dataframe():
+    """
+    Test chunked generation
+        - Test the chunk sizes, column names and index
+        - Test the concatenated chunks equal the seeded get_dataframe frame
+    Returns:
+
+    """
+    ctypes = [str, bytes, int, float, bool, datetime]
+    chunks = list(DataFrameGenerator(seed=9).iter_dataframe(100000, ctypes, chunksize=30000))
+    assert [len(chunk) for chunk in chunks] == [30000, 30000, 30000, 10000], "Wrong chunk sizes"
+    assert all(list(chunk.columns) == ["Str0", "Bytes1", "Int2", "Float3", "Bool4", "Datetime5"] for chunk in chunks)
+
+    df = DataFrameGenerator(seed=9).get_dataframe(100000, ctypes)
+    assert pd.concat(chunks).equals(df), "Chunks do not stitch into the frame"
+
+
+def _partition(partition: int) -> pd.DataFrame:
+    return DataFrameGenerator(seed=11).get_partition(200000, PARTITION_CTYPES, partition, 3, nullratio=0.1,
+                                                     exact_nulls=True)
+
+
+PARTITION_CTYPES = [str, bytes, int, float, bool, datetime, pd.Categorical]
+
+
+def test_partitions():
+    """
+    Test partition-addressable generation
+        - Test partitions generated in separate processes concatenate into the seeded get_dataframe frame
+        - Test partitions split whole stream blocks, or rows when there are too few blocks
+        - Test a generator returns the same partition however often it is asked
+        - Test a generator without a seed is rejected
+    Returns:
+
+    """
+    with ProcessPoolExecutor(3, mp_context=multiprocessing.get_context("spawn")) as pool:
+        partitions = list(pool.map(_partition, range(3)))
+    assert [len(partition) for partition in partitions] == [65536, 65536, 68928], "Partitions not block aligned"
+    df = DataFrameGenerator(seed=11).get_dataframe(200000, PARTITION_CTYPES, nullratio=0.1, exact_nulls=True)
+    assert pd.concat(partitions).equals(df), "Partitions do not stitch into the frame"
+    assert df.isna().sum().eq(20000).all(), "Exact null counts broken across partitions"
+
+    dfg = DataFrameGenerator(seed=4)
+    parts = [dfg.get_partition(10, [int, datetime], partition, 4) for partition in (3, 0, 1, 2, 3)]
+    assert [len(part) for part in parts] == [3, 2, 3, 2, 3], "Wrong row partitions"
+    assert parts[0].equals(parts[-1]), "Partition depends on the calls before it"
+    assert pd.concat(parts[1:]).equals(DataFrameGenerator(seed=4).get_dataframe(10, [int, datetime]))
+    with pytest.raises(ValueError):
+        DataFrameGenerator().get_partition(10, [int], 0, 4)
+
+
+def test_nullratio():
+    """
+    Test null values
+        - Test the nullable dtypes, no column is upcast to float or object
+        - Test exact null counts, holding across chunks and process workers
+        - Test the Bernoulli null ratio
+    Returns:
+
+    """
+    ctypes = [str, bytes, int, float, bool, datetime]
+    df = DataFrameGenerator(seed=6).get_dataframe(10000, ctypes, nullratio=0.2, exact_nulls=True)
+    assert [str(dtype) for dtype in df.dtypes] == ["string", "string", "Int64", "float64", "boolean",
+                                                   "datetime64[ns]"], "Wrong nullable dtypes"
+    assert (df.isna().sum() == 2000).all(), "Wrong exact null count"
+
+    chunks = DataFrameGenerator(seed=6).iter_dataframe(10000, ctypes, chunksize=3000, nullratio=0.2, exact_nulls=True)
+    assert pd.concat(chunks).equals(df), "Chunks do not stitch into the frame"
+    shared = DataFrameGenerator(seed=6, workers=2, executor="process")
+    assert shared.get_dataframe(10000, ctypes, nullratio=0.2, exact_nulls=True).equals(df), "Process nulls differ"
+
+    df = DataFrameGenerator(seed=6).get_char_dataframe(100000, 2, nullratio=0.3, chartype="S1")
+    assert df.dtypes.eq(object).all(), "Wrong bytes dtype"
+    assert ((df.isna().mean() - 0.3).abs() < 0.01).all(), "Wrong null ratio"
+
+
+def test_dtype():
+    """
+    Test numeric column widths
+        - Test explicit per-column dtypes and downcast integers
+        - Test values stay in range at the narrow width, the default range clipped to the dtype
+        - Test a dtype that cannot hold the range is rejected
+    Returns:
+
+    """
+    dfg = DataFrameGenerator(seed=7)
+    df = dfg.get_integer_dataframe(1000, 3, minval=0, maxval=200, dtype=["int16", None, None], downcast=True)
+    assert [str(dtype) for dtype in df.dtypes] == ["int16", "uint8", "uint8"], "Wrong integer dtypes"
+    assert ((df >= 0) & (df < 200)).all().all(), "Integers out of range"
+
+    df = dfg.get_float_dataframe(1000, 2, dtype="float32")
+    assert (df.dtypes == "float32").all(), "Wrong float dtype"
+    assert df.min().min() >= -1.0 and df.max().max() < 1.0, "Floats out of range"
+
+    df = dfg.get_dataframe(1000, [int, float, str], dtype=["int8", "float16", None])
+    assert [str(dtype) for dtype in df.dtypes] == ["int8", "float16", "object"], "Wrong dataframe dtypes"
+    assert dfg.get_dataframe(10, [int], downcast=True).dtypes.iloc[0] == "int32", "Default range not downcast"
+    df = dfg.get_integer_dataframe(1000, 2, dtype="int8")
+    assert (df.dtypes == "int8").all() and df.min().min() < -100 and df.max().max() > 100, "Default range not clipped"
+
+    with pytest.raises(ValueError):
+        dfg.get_integer_dataframe(10, 1, minval=-5, maxval=5, dtype="uint8")
+
+
+def test_categorical_dataframe():
+    """
+    Test categorical columns
+        - Test the vocabulary size and the narrow code dtype
+        - Test weighted category frequencies
+        - Test the categorical ctype of get_dataframe
+    Returns:
+
+    """
+    dfg = DataFrameGenerator(seed=8)
+    df = dfg.get_categorical_dataframe(10000, 2, ncategories=50)
+    assert (df.dtypes == "category").all(), "Columns are not categorical"
+    assert all(len(df[column].cat.categories) == 50 for column in df), "Wrong vocabulary size"
+    assert df["Category0"].cat.codes.dtype == "int8", "Codes not kept at their narrowest width"
+
+    df = dfg.get_categorical_dataframe(100000, 1, categories=["a", "b", "c"], weights=[0.6, 0.4, 0])
+    frequencies = df["Category0"].value_counts(normalize=True)
+    assert frequencies["c"] == 0 and abs(frequencies["a"] - 0.6) < 0.01, "Wrong category frequencies"
+
+    df = dfg.get_dataframe(100, [pd.Categorical, int])
+    assert list(df.columns) == ["Categorical0", "Int1"] and df.dtypes.iloc[0] == "category", "Wrong categorical ctype"
+
+
+def test_timestamps():
+    """
+    Test the random timestamp engine
+        - Test columns are random, independent and within [start, end] at the resolution
+        - Test sorted, jitter and timezone aware columns
+        - Test weekday and hour weights
+    Returns:
+
+    """
+    dfg = DataFrameGenerator(seed=10)
+    start, end = datetime(2020, 1, 1), datetime(2020, 12, 31)
+    df = dfg.get_dates_dataframe(10000, 2, start=start, end=end, resolution="ms")
+    assert not (df["Date0"] == df["Date1"]).all(), "Datetime columns are identical"
+    assert df.min().min() >= pd.Timestamp(start) and df.max().max() <= pd.Timestamp(end), "Timestamps out of range"
+    assert (df["Date0"].dt.microsecond % 1000 == 0).all() and (df["Date0"].dt.nanosecond == 0).all(), "Wrong resolution"
+
+    assert dfg.get_dates_dataframe(10000, 1, order="sorted")["Date0"].is_monotonic_increasing, "Not sorted"
+    start, end = pd.Timestamp("2024-03-01 00:00:00.000000001"), pd.Timestamp("2024-03-09 12:34:56.789012345")
+    ranged = dfg.get_dates_dataframe(100003, 1, start=start, end=end, order="range")["Date0"]
+    assert (ranged.values == pd.date_range(start, end, periods=100003).values).all(), "Range lost nanoseconds"
+    tight = dfg.get_dates_dataframe(10000, 1, start=start, end=start + pd.Timedelta(20000, "ns"), order="sorted")
+    assert tight["Date0"].is_monotonic_increasing and tight["Date0"].is_unique, "Sorted strata tie"
+    assert tight["Date0"].min() >= start and tight["Date0"].max() <= start + pd.Timedelta(20000, "ns")
+    jittered = dfg.get_dates_dataframe(10000, 1, order="jitter", jitter=3)["Date0"]
+    assert not jittered.is_monotonic_increasing, "No jitter"
+    assert abs(jittered.sort_values().index.values - jittered.index.values).max() <= 6, "Jitter too large"
+
+    df = dfg.get_dates_dataframe(10000, 1, start=start, end=end, tz="Europe/Berlin", weekday_weights=[1] * 5 + [0] * 2,
+                                 hour_weights=[0] * 9 + [1] * 8 + [0] * 7)
+    assert str(df.dtypes.iloc[0]) == "datetime64[ns, Europe/Berlin]", "Wrong timezone"
+    assert df["Date0"].dt.dayofweek.max() < 5, "Weekend timestamps despite zero weight"
+    assert df["Date0"].dt.hour.between(9, 16).all(), "Timestamps outside business hours"
+
+
+def test_numpy_output():
+    """
+    Test NumPy output
+        - Test `import randen` and NumPy generation do not import pandas
+        - Test the arrays hold the values of the DataFrame of the same seed, nullable columns masked
+        - Test the structured array output
+    Returns:
+
+    """
+    code = ("import sys; from datetime import datetime; from randen import DataFrameGenerator; "
+            "DataFrameGenerator(output='numpy').get_dataframe(10, [int, float, bool, str, bytes, datetime]); "
+            "assert 'pandas' not in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    ctypes = [int, float, bool, str, datetime, pd.Categorical]
+    df = DataFrameGenerator(seed=11).get_dataframe(1000, ctypes, nullratio=0.1)
+    arrays = DataFrameGenerator(seed=11, output="numpy").get_dataframe(1000, ctypes, nullratio=0.1)
+    assert list(arrays) == list(df.columns), "Wrong columns"
+    for name, values in arrays.items():
+        assert len(values) == 1000, f"Wrong length of {name}"
+        valid = df[name].notna().values
+        if isinstance(values, np.ma.MaskedArray):
+            assert (values.mask == ~valid).all(), f"Wrong mask of {name}"
+        np.testing.assert_array_equal(np.ma.getdata(values)[valid], df[name][valid].to_numpy(dtype=values.dtype))
+    categories = arrays["Categorical5"]
+    assert categories.dtype == object and categories[df["Categorical5"].isna().values][0] is None, "Wrong null category"
+
+    structured = DataFrameGenerator(seed=11, output="structured").get_dataframe(1000, [int, float])
+    assert structured.dtype.names == ("Int0", "Float1"), "Wrong structured fields"
+    expected = DataFrameGenerator(seed=11).get_dataframe(1000, [int, float])
+    np.testing.assert_array_equal(structured["Float1"], expected["Float1"])
+
+
+def test_arrow_output():
+    """
+    Test the Arrow backend
+        - Test Arrow output equals the Arrow conversion of the DataFrame of the same seed, nulls included
+        - Test "string[pyarrow]" string columns hold the strings of the object columns
+    Returns:
+
+    """
+    pa = pytest.importorskip("pyarrow")
+    ctypes = [int, float, bool, str, bytes, datetime, pd.Categorical]
+    df = DataFrameGenerator(seed=12).get_dataframe(1000, ctypes, nullratio=0.1)
+    table = DataFrameGenerator(seed=12, output="arrow").get_dataframe(1000, ctypes, nullratio=0.1)
+    assert isinstance(table, pa.Table), "Not an Arrow table"
+    assert table.equals(pa.Table.from_pandas(df, preserve_index=False).replace_schema_metadata(None)), "Wrong table"
+
+    binary = DataFrameGenerator(seed=12, output="arrow").get_char_dataframe(100, 1, chartype="S1")
+    assert binary.schema.field("Char0").type == pa.binary(), "Bytes column not binary"
+    with pytest.raises(ValueError):
+        DataFrameGenerator(output="arrow").get_char_dataframe(100, 1, chartype="bytes")
+
+    strings = DataFrameGenerator(seed=12, string_storage="pyarrow").get_dataframe(1000, ctypes, nullratio=0.1)
+    assert str(strings["Str3"].dtype) == "string" and strings["Str3"].dtype.storage == "pyarrow", "Wrong string dtype"
+    assert (strings["Str3"].isna() == df["Str3"].isna()).all(), "Wrong string nulls"
+    assert (strings["Str3"].dropna().astype(object) == df["Str3"].dropna().astype(object)).all(), "Wrong strings"
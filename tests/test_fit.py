@@ -0,0 +1,69 @@
+"""
+Randen: Random DataFrame Generator
+    Testcases for generating frames like a sample frame
+"""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from randen import DataFrameGenerator
+from randen.fit import summarize
+
+
+def _sample(nrows: int = 4000) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    sample = pd.DataFrame({
+        "id": rng.permutation(nrows) + 100,
+        "price": rng.lognormal(3, 1, nrows).astype(np.float32),
+        "quantity": pd.array(rng.integers(1, 6, nrows), dtype="Int16"),
+        "flag": rng.random(nrows) < 0.3,
+        "city": rng.choice(["Berlin", "Paris", "Rome"], nrows, p=[0.6, 0.3, 0.1]).astype(object),
+        "name": ["".join(rng.choice(list("abcdef"), rng.integers(3, 9))) for _ in range(nrows)],
+        "code": pd.array(rng.choice(["x", "yy"], nrows), dtype="string"),
+        "at": pd.to_datetime(rng.integers(15 * 10 ** 17, 16 * 10 ** 17, nrows)).tz_localize("UTC"),
+        "level": pd.Categorical(rng.choice(["low", "high"], nrows, p=[0.8, 0.2]), categories=["low", "mid", "high"]),
+    })
+    for column in ["price", "quantity", "city", "name", "code", "at", "level"]:
+        sample.loc[rng.random(nrows) < 0.1, column] = None
+    return sample
+
+
+def test_dataframe_like():
+    """
+    Test frames generated like a sample
+        - Test dtypes, null ratios, ranges, distributions and frequencies follow the sample
+        - Test unique integer columns stay unique, past the sample's range and dtype
+        - Test summaries are compact and picklable, and generate the frames the sample does
+    """
+    sample = _sample()
+    summaries = summarize(sample)
+    assert [summary.kind for summary in summaries] == ["unique", "quantiles", "discrete", "discrete", "discrete",
+                                                       "text", "discrete", "quantiles", "category"]
+    assert len(pickle.dumps(summaries)) < 20000, "Summaries not compact"
+
+    df = DataFrameGenerator(seed=1).get_dataframe_like(200000, pickle.loads(pickle.dumps(summaries)))
+    pd.testing.assert_series_equal(df.dtypes, sample.dtypes)
+    np.testing.assert_allclose(df.isna().mean(), sample.isna().mean(), atol=0.01)
+    assert df["id"].is_unique and df["id"].min() >= 100, "Unique column repeated"
+    assert df["price"].min() >= sample["price"].min() and df["price"].max() <= sample["price"].max()
+    np.testing.assert_allclose(df["price"].quantile([0.1, 0.5, 0.9]), sample["price"].quantile([0.1, 0.5, 0.9]),
+                               rtol=0.05)
+    assert set(df["quantity"].dropna()) == set(sample["quantity"].dropna()), "Wrong discrete values"
+    frequencies = df["city"].value_counts(normalize=True)
+    np.testing.assert_allclose(frequencies[["Berlin", "Paris", "Rome"]], [0.6, 0.3, 0.1], atol=0.02)
+    assert set("".join(df["name"].dropna())) == set("abcdef") and df["name"].dropna().str.len().between(3, 8).all()
+    assert df["at"].min() >= sample["at"].min() and df["at"].max() <= sample["at"].max()
+    assert list(df["level"].cat.categories) == ["low", "mid", "high"] and (df["level"] == "mid").sum() == 0
+
+    assert DataFrameGenerator(seed=1).get_dataframe_like(200000, sample).equals(df), "Sample and summaries differ"
+    chunks = DataFrameGenerator(seed=1).iter_dataframe_like(200000, summaries, chunksize=70000)
+    assert pd.concat(chunks).equals(df), "Chunks do not stitch into the frame"
+
+    keys = DataFrameGenerator(seed=1).get_dataframe_like(1000, pd.DataFrame({"key": np.arange(-50, 50, dtype=np.int8)}))
+    assert keys["key"].is_unique and keys["key"].min() == -50, "Narrow unique column wrapped around"
+
+    with pytest.raises(ValueError):
+        summarize(pd.DataFrame({"mixed": [1, "a"]}))
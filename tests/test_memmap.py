@@ -0,0 +1,73 @@
+"""
+Randen: Random DataFrame Generator
+    Testcases for memory-mapped output and reopening it from the manifest
+"""
+
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from randen import DataFrameGenerator, open_memmap
+
+CTYPES = [str, bytes, int, float, bool, datetime]
+
+
+def _base(values: np.ndarray) -> np.ndarray:
+    while values.base is not None and not isinstance(values, np.memmap):
+        values = values.base
+    return values
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_memmap_dataframe(tmp_path, executor):
+    """
+    Test memmap output
+        - Test the frame equals the in-memory frame of the same seed
+        - Test numeric, bool and datetime columns view the memmap files
+        - Test the dataset reopens from its manifest, as a frame and as raw column buffers
+    """
+    expected = DataFrameGenerator(seed=3).get_dataframe(1000, CTYPES)
+    dfg = DataFrameGenerator(seed=3, workers=2, executor=executor)
+    df = dfg.get_dataframe(1000, CTYPES, memmap_dir=str(tmp_path))
+    pd.testing.assert_frame_equal(df, expected)
+    assert os.path.exists(tmp_path / "manifest.json"), "Manifest not written"
+    for name in ["Int2", "Float3", "Bool4", "Datetime5"]:
+        assert isinstance(_base(df[name].values), np.memmap), f"{name} copied out of its memmap"
+
+    pd.testing.assert_frame_equal(open_memmap(str(tmp_path)), expected)
+    raw = open_memmap(str(tmp_path), as_frame=False)
+    assert list(raw) == list(expected.columns), "Wrong raw columns"
+    assert raw["Str0"].dtype == "S20" and raw["Bytes1"].dtype == "S1", "Object columns not fixed width"
+    np.testing.assert_array_equal(raw["Float3"], expected["Float3"].values)
+
+
+def test_memmap_typed_dataframe(tmp_path):
+    """
+    Test memmap output of the typed generators
+        - Test categorical codes view the memmap file
+        - Test regenerating into a directory replaces the dataset
+    """
+    dfg = DataFrameGenerator(seed=4)
+    df = dfg.get_char_dataframe(1000, 2, chartype="category", memmap_dir=str(tmp_path))
+    assert isinstance(_base(df["Char0"].cat.codes.values), np.memmap), "Codes copied out of their memmap"
+    assert open_memmap(str(tmp_path)).equals(df), "Reopened categorical frame differs"
+
+    df = dfg.get_float_dataframe(500, 3, memmap_dir=str(tmp_path))
+    assert open_memmap(str(tmp_path)).equals(df), "Reopened frame is not the latest dataset"
+
+
+def test_memmap_nullable(tmp_path):
+    """
+    Test memmap output of nullable columns, reopened with their null masks
+    """
+    expected = DataFrameGenerator(seed=5).get_dataframe(1000, CTYPES, nullratio=0.1)
+    df = DataFrameGenerator(seed=5).get_dataframe(1000, CTYPES, nullratio=0.1, memmap_dir=str(tmp_path))
+    pd.testing.assert_frame_equal(df, expected)
+    pd.testing.assert_frame_equal(open_memmap(str(tmp_path)), expected)
+
+    raw = open_memmap(str(tmp_path), as_frame=False)
+    assert isinstance(raw["Int2"], np.ma.MaskedArray), "Nullable column without its mask"
+    assert (raw["Int2"].mask == expected["Int2"].isna().values).all(), "Wrong null mask"
@@ -0,0 +1,30 @@
+"""
+Randen: Random DataFrame Generator
+    Testcases for the keyed permutations behind unique key columns
+"""
+
+import numpy as np
+
+from randen.permutation import FeistelPermutation
+
+
+def test_feistel_permutation_is_bijection():
+    """
+    Test the permutation maps [0, size) onto itself exactly once for odd and even sized domains
+    """
+    for size in (1, 2, 7, 1000, 4097):
+        values = FeistelPermutation(size, key=7)(np.arange(size))
+        assert np.array_equal(np.sort(values), np.arange(size)), f"Not a bijection of [0, {size})"
+
+
+def test_feistel_permutation_chunks():
+    """
+    Test chunks of the index domain map to the same values as the whole domain
+        - Same key gives the same mapping
+        - Different keys give different mappings
+    """
+    perm = FeistelPermutation(10**6, key=3)
+    whole = perm(np.arange(10**4))
+    chunks = np.concatenate([perm(np.arange(i, i + 1000)) for i in range(0, 10**4, 1000)])
+    assert np.array_equal(whole, chunks), "Chunked mapping differs"
+    assert not np.array_equal(whole, FeistelPermutation(10**6, key=4)(np.arange(10**4))), "Key ignored"
@@ -0,0 +1,56 @@
+"""
+Randen: Random DataFrame Generator
+    Testcases for multi-table generation with foreign keys
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from randen import DataFrameGenerator, ForeignKey, RelationalGenerator
+
+
+def _schema(generator: DataFrameGenerator, orphans: float = 0.0) -> RelationalGenerator:
+    rg = RelationalGenerator(generator)
+    rg.add_table("customers", nrows=5000, ctypes=[str, datetime])
+    rg.add_table("orders", fanout=10, ctypes=[float],
+                 foreign_keys={"customer_id": ForeignKey("customers", skew="zipf", orphans=orphans)})
+    rg.add_table("items", fanout=2, key=None, foreign_keys={"order_id": ForeignKey("orders")})
+    return rg
+
+
+def test_foreign_keys():
+    """
+    Test related tables
+        - Test parent keys are a permutation of 1 ... nrows and fan-out sets the child rows
+        - Test foreign keys reference parent keys, but for the requested ratio of orphans
+        - Test Zipf skew concentrates references on a few parents
+    """
+    tables = _schema(DataFrameGenerator(seed=1)).get_tables()
+    customers, orders, items = tables["customers"], tables["orders"], tables["items"]
+    assert list(orders.columns) == ["id", "customer_id", "Float0"], "Wrong columns"
+    assert sorted(customers["id"]) == list(range(1, 5001)), "Keys not a permutation of the rows"
+    assert len(orders) == 50000 and len(items) == 100000, "Wrong fan-out"
+    assert np.isin(orders["customer_id"], customers["id"]).all(), "Orphan orders"
+    assert np.isin(items["order_id"], orders["id"]).all(), "Orphan items"
+    assert orders["customer_id"].value_counts().iloc[0] > 50 * 10, "No Zipf skew"
+    assert items["order_id"].value_counts().iloc[0] < 20, "Uniform references skewed"
+
+    orders = _schema(DataFrameGenerator(seed=1), orphans=0.1).get_table("orders")
+    assert abs((~np.isin(orders["customer_id"], customers["id"])).mean() - 0.1) < 0.01, "Wrong orphan ratio"
+
+
+@pytest.mark.parametrize("workers,executor", [(2, "thread"), (2, "process")])
+def test_consistency(workers, executor):
+    """
+    Test tables are the same generated whole, chunked, in parallel or in any order
+    """
+    rg = _schema(DataFrameGenerator(seed=2))
+    orders = rg.get_table("orders")
+    pd.testing.assert_frame_equal(pd.concat(list(rg.iter_table("orders", chunksize=7000))), orders)
+    pd.testing.assert_frame_equal(rg.get_table("orders"), orders)
+
+    parallel = _schema(DataFrameGenerator(seed=2, workers=workers, executor=executor))
+    pd.testing.assert_frame_equal(parallel.get_table("orders"), orders)
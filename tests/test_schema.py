@@ -0,0 +1,61 @@
+"""
+Randen: Random DataFrame Generator
+    Testcases for compiled schemas
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from randen import DataFrameGenerator
+
+CTYPES = [int, float, bool, str, bytes, datetime, pd.Categorical]
+
+
+def test_generate():
+    """
+    Test compiled schemas
+        - Test a schema generates the frame of the first get_dataframe call of its seed, every time
+        - Test a schema of an unseeded generator generates a new frame every time
+        - Test the plans are built once per number of rows
+        - Test per column parameters and their validation
+    """
+    schema = DataFrameGenerator(seed=3).compile(CTYPES, nullratio=0.1)
+    expected = DataFrameGenerator(seed=3).get_dataframe(1000, CTYPES, nullratio=0.1)
+    pd.testing.assert_frame_equal(schema.generate(1000), expected)
+    assert schema.plan(1000) is schema.plan(1000), "Plans built again"
+    pd.testing.assert_frame_equal(schema.generate(1000), expected)
+    assert len(schema.generate(10)) == 10
+    unseeded = DataFrameGenerator().compile(CTYPES)
+    assert not unseeded.generate(100).equals(unseeded.generate(100)), "Unseeded schema repeats its frame"
+
+    params = {"Int0": {"minval": 0, "maxval": 5000, "unique": True}, "Str1": {"minstrlen": 3, "maxstrlen": 3},
+              "Categorical2": {"ncategories": 4, "nullratio": 0.5}, "Datetime3": {"order": "range"}}
+    df = DataFrameGenerator(seed=3).compile([int, str, pd.Categorical, datetime], params=params).generate(5000)
+    assert sorted(df["Int0"]) == list(range(5000)), "Unique range not applied"
+    assert (df["Str1"].str.len() == 3).all(), "String lengths not applied"
+    assert len(df["Categorical2"].cat.categories) == 4 and 0.4 < df["Categorical2"].isna().mean() < 0.6
+    assert df["Datetime3"].is_monotonic_increasing, "Datetime order not applied"
+    with pytest.raises(ValueError):
+        DataFrameGenerator().compile([float], params={"Float0": {"unique": True}})
+
+
+def test_generate_into_buffers():
+    """
+    Test generating into caller-provided buffers
+        - Test the buffers hold the frame's values, in the kernels' layout, and are reused in place
+    """
+    schema = DataFrameGenerator(seed=3).compile(CTYPES, nullratio=0.1)
+    expected = schema.generate(1000)
+    buffers = schema.empty(1000)
+    ints = buffers["Int0"]
+    assert schema.generate(out=buffers) is buffers and buffers["Int0"] is ints
+    assert isinstance(ints, np.ma.MaskedArray) and (ints.mask == expected["Int0"].isna().values).all()
+    assert (ints.compressed() == expected["Int0"].dropna().values).all(), "Wrong int values"
+    np.testing.assert_array_equal(buffers["Float1"], expected["Float1"].values)
+    strings = buffers["Str3"]
+    assert strings.dtype.kind == "S" and (strings.compressed().astype(str) == expected["Str3"].dropna().values).all()
+    codes = buffers["Categorical6"]
+    np.testing.assert_array_equal(codes, expected["Categorical6"].cat.codes.values)
@@ -0,0 +1,107 @@
+"""
+Randen: Random DataFrame Generator
+    Testcases for the Parquet, Feather, CSV and SQL writer sinks
+"""
+
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from randen import DataFrameGenerator
+
+CTYPES = [str, bytes, int, float, bool, datetime]
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_write_parquet(tmp_path, background):
+    """
+    Test Parquet output
+        - Test one row group per chunk
+        - Test the file holds the seeded get_dataframe frame
+    """
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "frame.parquet")
+    DataFrameGenerator(seed=1).write_parquet(path, 1000, CTYPES, row_group_size=300, background=background)
+
+    assert pq.ParquetFile(path).num_row_groups == 4, "Wrong number of row groups"
+    expected = DataFrameGenerator(seed=1).get_dataframe(1000, CTYPES)
+    pd.testing.assert_frame_equal(pd.read_parquet(path), expected)
+
+
+def test_write_nullable(tmp_path):
+    """
+    Test Parquet and Feather files of nullable and categorical columns read back with the get_dataframe dtypes
+    """
+    pytest.importorskip("pyarrow")
+    ctypes = CTYPES + [pd.Categorical]
+    DataFrameGenerator(seed=2).write_parquet(str(tmp_path / "frame.parquet"), 1000, ctypes, row_group_size=300,
+                                             nullratio=0.1)
+    DataFrameGenerator(seed=2).write_feather(str(tmp_path / "frame.feather"), 1000, ctypes, chunksize=300,
+                                             nullratio=0.1)
+
+    expected = DataFrameGenerator(seed=2).get_dataframe(1000, ctypes, nullratio=0.1)
+    pd.testing.assert_frame_equal(pd.read_parquet(str(tmp_path / "frame.parquet")), expected)
+    pd.testing.assert_frame_equal(pd.read_feather(str(tmp_path / "frame.feather")), expected)
+
+
+def test_write_feather(tmp_path):
+    """
+    Test Feather(Arrow IPC) output holds the seeded get_dataframe frame
+    """
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / "frame.feather")
+    DataFrameGenerator(seed=1).write_feather(path, 1000, CTYPES, chunksize=300, background=True)
+
+    expected = DataFrameGenerator(seed=1).get_dataframe(1000, CTYPES)
+    pd.testing.assert_frame_equal(pd.read_feather(path), expected)
+
+
+def test_write_csv(tmp_path):
+    """
+    Test CSV output
+        - Test the header is written once
+        - Test the rows of every chunk are written
+    """
+    path = str(tmp_path / "frame.csv")
+    DataFrameGenerator(seed=1).write_csv(path, 1000, [int, float], columns=["a", "b"], chunksize=300)
+
+    expected = DataFrameGenerator(seed=1).get_dataframe(1000, [int, float], columns=["a", "b"])
+    pd.testing.assert_frame_equal(pd.read_csv(path), expected)
+
+
+def test_write_sql(tmp_path):
+    """
+    Test SQLite output
+        - Test the table holds the seeded get_dataframe frame, nulls as NULL, across chunks and multi-row inserts
+        - Test if_exists, the indexes built after loading and the bulk pragmas being restored
+    """
+    path = str(tmp_path / "frame.db")
+    ctypes = [int, float, bool, str, datetime, pd.Categorical]
+    DataFrameGenerator(seed=1).write_sql(path, "frame", 1000, ctypes, chunksize=300, nullratio=0.1,
+                                         indexes=["Int0", ["Str3", "Datetime4"]])
+
+    expected = DataFrameGenerator(seed=1).get_dataframe(1000, ctypes, nullratio=0.1)
+    with sqlite3.connect(path) as connection:
+        df = pd.read_sql('SELECT * FROM "frame"', connection)
+        indexes = connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+        synchronous = connection.execute("PRAGMA synchronous").fetchone()[0]
+    assert list(df.columns) == list(expected.columns) and len(df) == 1000
+    for name in ["Int0", "Float1", "Bool2"]:
+        pd.testing.assert_series_equal(df[name], expected[name].astype("float64"))
+    for name in ["Str3", "Categorical5"]:
+        assert df[name].tolist() == expected[name].astype(object).where(expected[name].notna(), None).tolist()
+    pd.testing.assert_series_equal(pd.to_datetime(df["Datetime4"]), expected["Datetime4"].dt.floor("us"))
+    assert sorted(indexes) == [("ix_frame_Int0",), ("ix_frame_Str3_Datetime4",)], "Indexes not built"
+
+    connection = sqlite3.connect(path)
+    assert connection.execute("PRAGMA synchronous").fetchone()[0] == synchronous
+    with pytest.raises(sqlite3.OperationalError):
+        DataFrameGenerator(seed=1).write_sql(connection, "frame", 10, ctypes)
+    DataFrameGenerator(seed=1).write_sql(connection, "frame", 10, ctypes, if_exists="append")
+    assert connection.execute('SELECT COUNT(*) FROM "frame"').fetchone()[0] == 1010
+    DataFrameGenerator(seed=1).write_sql(connection, "frame", 10, [int], if_exists="replace", chunksize=3)
+    assert connection.execute('SELECT COUNT(*), COUNT(DISTINCT "Int0") FROM "frame"').fetchone() == (10, 10)
+    assert connection.execute("PRAGMA synchronous").fetchone()[0] == synchronous, "Pragmas not restored"
+    connection.close()
@@ -0,0 +1,59 @@
+"""
+Randen: Random DataFrame Generator
+    Testcases for the stateful streaming generator
+"""
+
+import json
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from randen import DataFrameGenerator, Stream
+
+
+def _stream(**kwargs) -> Stream:
+    return DataFrameGenerator(seed=7).stream([float, str, int], start=datetime(2024, 1, 1), nkeys=100,
+                                             drift=1000, nullratio=0.1, **kwargs)
+
+
+def test_next_batch():
+    """
+    Test stream batches
+        - Test batches of any sizes concatenate to one big batch
+        - Test ids count up and event times only increase across batches
+        - Test hot keys drift with the row position
+    """
+    stream = _stream()
+    batches = [stream.next_batch(nrows) for nrows in (1, 999, 0, 70000, 3000)]
+    assert stream.position == 74000
+    frame = pd.concat(batches, ignore_index=True)
+    assert frame.equals(_stream().next_batch(74000))
+    assert list(frame.columns) == ["id", "ts", "key", "Float0", "Str1", "Int2"]
+    assert np.array_equal(frame["id"].to_numpy(), np.arange(1, 74001))
+    assert frame["ts"].is_monotonic_increasing and frame["ts"].iloc[0] >= pd.Timestamp(2024, 1, 1)
+    keys = frame["key"].to_numpy()
+    assert keys.min() >= 0 and keys.max() < 100
+    assert np.bincount(keys[:1000]).argmax() != np.bincount(keys[50000:51000]).argmax()
+    assert 0.05 < frame["Int2"].isna().mean() < 0.15
+
+
+def test_checkpoint():
+    """
+    Test stream checkpoints
+        - Test a stream restored from a JSON round trip of its state continues where it stopped
+        - Test the rate limited iterator paces batches to the target rows/s
+    """
+    stream = _stream()
+    stream.next_batch(1234)
+    state = json.loads(json.dumps(stream.state))
+    expected = stream.next_batch(500)
+    restored = DataFrameGenerator().stream([float, str, int], nkeys=100, drift=1000, nullratio=0.1, state=state)
+    batch = restored.next_batch(500)
+    assert batch.equals(expected) and batch["id"].iloc[0] == 1235
+
+    started = time.monotonic()
+    batches = list(_stream().iter_batches(100, rows_per_s=2000, max_batches=5))
+    assert time.monotonic() - started >= 0.2
+    assert [len(batch) for batch in batches] == [100] * 5
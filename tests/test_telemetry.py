@@ -0,0 +1,60 @@
+"""
+Randen: Random DataFrame Generator
+    Testcases for the generation telemetry hooks
+"""
+
+from datetime import datetime
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+from randen import DataFrameGenerator
+from randen.telemetry import ColumnEvent
+
+CTYPES = [int, float, bool, str, bytes, datetime, pd.Categorical]
+
+
+@pytest.mark.parametrize("workers,executor", [(1, "thread"), (2, "thread"), (2, "process")])
+def test_profile(workers, executor):
+    """
+    Test profiling a generation call
+        - Test every row of every column is reported once
+        - Test the profiled frame equals the frame generated without hooks
+        - Test the profile is detached when the block exits
+    """
+    dfg = DataFrameGenerator(seed=6, workers=workers, executor=executor)
+    with dfg.profile() as profile:
+        df = dfg.get_dataframe(1000, CTYPES, nullratio=0.1)
+    pd.testing.assert_frame_equal(df, DataFrameGenerator(seed=6).get_dataframe(1000, CTYPES, nullratio=0.1))
+    assert not dfg._hooks, "Profile still attached"
+
+    summary = profile.summary()
+    assert set(summary.index.get_level_values("column")) == set(df.columns), "Columns missing from the summary"
+    rows = Counter()
+    for event in profile.events:
+        if event.engine not in ("decode", "nulls"):
+            rows[event.column] += event.nrows
+    assert set(rows.values()) == {1000}, "Rows not reported once"
+    assert summary.loc[("Int0", "nulls"), "nrows"] == 1000, "Null mask not reported"
+    assert summary.loc[("Int0", "ints"), "nbytes"] == 8000, "Wrong column bytes"
+    assert (summary["seconds"].diff().dropna() <= 0).all(), "Summary not sorted slowest first"
+    assert {event.executor for event in profile.events} <= {"serial", "thread", "process", "parent"}
+
+
+def test_hooks():
+    """
+    Test hooks given to the generator
+        - Test each chunk of iter_dataframe is reported with its row offset
+        - Test a removed hook receives no more events
+    """
+    events = []
+    dfg = DataFrameGenerator(seed=7, hooks=[events.append])
+    list(dfg.iter_dataframe(250, [int], chunksize=100))
+    assert all(isinstance(event, ColumnEvent) for event in events), "Hook received an unknown event"
+    assert [(event.start, event.nrows) for event in events] == [(0, 100), (100, 100), (200, 50)], "Wrong chunks"
+    assert all(event.rows_per_s > 0 for event in events), "Wrong rows/s"
+
+    dfg.remove_hook(events.append)
+    dfg.get_integer_dataframe(10, 1)
+    assert len(events) == 3, "Removed hook still called"